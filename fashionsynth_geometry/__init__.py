@@ -0,0 +1,82 @@
+"""FashionSynth pattern geometry without Blender
+
+SVG parsing, pattern orientation, outline contours, seam edge classification and stitch placement on
+plain lists and NumPy arrays.
+Nothing here imports bpy, so it runs on any Python with NumPy - the addon is a thin layer on top."""
+
+from .svg import (
+    CURVE_TOLERANCE_PREVIEW,
+    CURVE_TOLERANCE_PRODUCTION,
+    SVG_STREAM_CHUNK_SIZE,
+    iter_path_segments,
+    get_coordinate_scale_factor,
+    flatten_cubic,
+    flatten_quadratic,
+    flatten_arc,
+    parse_path_data,
+    parse_polygon_points,
+    get_outline_coordinates,
+    extract_coordinates_from_svg_chunks,
+    extract_coordinates_from_svg,
+    load_svg_from_file,
+    get_coordinates_from_file,
+)
+from .pattern import (
+    orient_coordinates_for_part,
+    as_points_array,
+    to_flat_coordinates,
+    convex_hull_points,
+    find_mirror_line,
+    find_mirror_line_and_visualize,
+    MirrorSymmetryIndex,
+    calculate_mirror_symmetry_score,
+    mirror_point_across_line,
+    mirror_points_across_line,
+    auto_orient_sleeve,
+    auto_orient_sleeve_points,
+    align_mirror_line_to_y_axis,
+    align_mirror_line_to_y_axis_points,
+    minimum_area_bounding_box,
+    long_axis_rotation,
+    auto_orient_horizontal_piece,
+    auto_orient_horizontal_piece_points,
+    auto_orient_front_panel,
+    auto_orient_front_panel_points,
+    mirror_vertically,
+    mirror_points_vertically,
+    find_longest_straight_z_line,
+    rotate_coordinates,
+    rotate_points,
+)
+from .pieces import (
+    QUARTER_TURN_ROTATIONS,
+    pattern_vertices,
+    transform_points,
+    quarter_turn_rotation_matrix,
+    quarter_turn_world_spans,
+    calculate_edge_curvature,
+)
+from .seams import (
+    edge_geometry,
+    angles_from_axis,
+    y_dominant_edges,
+    edge_midpoint_z,
+    sleeve_horizontal_edges,
+    cuff_horizontal_edges,
+    EdgeAdjacency,
+)
+from .contour import (
+    CONTOUR_STRAIGHT_TURN,
+    CONTOUR_CORNER_TURN,
+    CONTOUR_ORIENTATION_ANGLE,
+    CONTOUR_RUN_KINDS,
+    CONTOUR_RUN_ORIENTATIONS,
+    turning_angles,
+    edge_orientations,
+    split_runs,
+    ContourIndex,
+)
+from .stitches import (
+    order_segments,
+    resample_segments,
+)
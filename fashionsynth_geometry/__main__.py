@@ -0,0 +1,68 @@
+"""Preprocess pattern SVGs without Blender
+
+    python -m fashionsynth_geometry PART_NAME FILE.svg [--tolerance T] [--raw]
+    python -m fashionsynth_geometry benchmark-parser [--commands N] [--repeats R]
+    python -m fashionsynth_geometry benchmark-symmetry [--sizes N ...]
+
+Prints the piece's outline as a JSON list of [x, y] points, oriented the way the addon lays that
+part out (unless --raw). The benchmark commands time the SVG path parser and the mirror symmetry
+scorer against the implementations they replaced."""
+
+import argparse
+import json
+import sys
+
+from . import CURVE_TOLERANCE_PRODUCTION, get_coordinates_from_file, orient_coordinates_for_part, as_points_array
+from .benchmark import benchmark_path_parsing, benchmark_mirror_symmetry
+
+def benchmark_parser_main(argv):
+    parser = argparse.ArgumentParser(prog="python -m fashionsynth_geometry benchmark-parser", description="Time SVG path parsing")
+    parser.add_argument("--commands", type=int, default=100000, help="drawing commands per benchmark path")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+    
+    benchmark_path_parsing(args.commands, args.repeats)
+    return 0
+
+def benchmark_symmetry_main(argv):
+    parser = argparse.ArgumentParser(prog="python -m fashionsynth_geometry benchmark-symmetry", description="Time mirror symmetry scoring")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 5000, 50000], help="outline point counts")
+    args = parser.parse_args(argv)
+    
+    benchmark_mirror_symmetry(tuple(args.sizes))
+    return 0
+
+# Subcommands checked before the PART_NAME FILE.svg form, which has no command word
+BENCHMARK_COMMANDS = {
+    "benchmark-parser": benchmark_parser_main,
+    "benchmark-symmetry": benchmark_symmetry_main,
+}
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in BENCHMARK_COMMANDS:
+        return BENCHMARK_COMMANDS[argv[0]](argv[1:])
+    
+    parser = argparse.ArgumentParser(prog="python -m fashionsynth_geometry", description="Extract a pattern outline from an SVG")
+    parser.add_argument("part_name", help="part name as in the garment defaults, e.g. front_panel or hoodie_sleeve_1")
+    parser.add_argument("svg_file")
+    parser.add_argument("--tolerance", type=float, default=CURVE_TOLERANCE_PRODUCTION, help="curve flattening tolerance in scene units")
+    parser.add_argument("--raw", action="store_true", help="skip orientation")
+    args = parser.parse_args(argv)
+    
+    coordinates = get_coordinates_from_file(args.svg_file, args.tolerance)
+    if not coordinates:
+        print(f"No pattern outline in {args.svg_file}", file=sys.stderr)
+        return 1
+    
+    if args.raw:
+        points = as_points_array(coordinates)
+    else:
+        points = orient_coordinates_for_part(coordinates, args.part_name)
+    
+    json.dump(points.tolist(), sys.stdout)
+    sys.stdout.write("\n")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
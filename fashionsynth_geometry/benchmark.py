@@ -0,0 +1,137 @@
+"""Timings for the geometry hot paths against the implementations they replaced
+
+    python -m fashionsynth_geometry benchmark-parser [--commands N]
+    python -m fashionsynth_geometry benchmark-symmetry [--sizes N ...]
+
+Each benchmark prints one row per case with the best of a few repeats."""
+
+import math
+import re
+import time
+
+import numpy as np
+
+from .svg import iter_path_segments
+from .pattern import MIRROR_SCORE_BLOCK_ELEMENTS, MIRROR_SCORE_TOLERANCE, MirrorSymmetryIndex, mirror_points_across_line
+
+# Brute-force symmetry timings above this many points cover only a couple of axes, scaled up
+BENCHMARK_BRUTE_FORCE_FULL_SWEEP = 5000
+BENCHMARK_BRUTE_FORCE_AXES = 2
+
+def parse_path_data_regex_split(path_data):
+    """The parser iter_path_segments replaced, kept as the benchmark reference: split on command
+    letters and pair up every number found, control points and flags included"""
+    
+    coordinates = []
+    commands = re.split(r'[MLCZHVSQTAmlczhvsqta]', path_data)
+    for command in commands:
+        if command.strip():
+            numbers = re.findall(r'-?\d+\.?\d*', command)
+            
+            for i in range(0, len(numbers)-1, 2):
+                if i+1 < len(numbers):
+                    try:
+                        x = float(numbers[i])
+                        y = float(numbers[i+1])
+                        coordinates.extend([x, y])
+                    except ValueError:
+                        continue
+    return coordinates
+
+def benchmark_path_cases(commands):
+    """(label, path data) pairs with `commands` drawing commands each"""
+    
+    mixed = ("l1.5 0", "c1 1 2 1 3 0", "h-2", "v1.25", "s1 -1 2 0", "q1 1 2 0", "t1 0", "a1 1 0 0 1 2 0", "L10 10", "C1e1 2e1 3e1 .5 4e1 5")
+    return (
+        ("mixed commands", "M0 0 " + " ".join(mixed[i % len(mixed)] for i in range(commands)) + "z"),
+        ("cubic only", "M0 0 " + " ".join(f"C{i} {i + 1} {i + 2} {i + 1} {i + 3} {i}" for i in range(commands))),
+        ("lines only", "M0 0 " + " ".join(f"L{i} {i % 7}" for i in range(commands))),
+        ("one implicit l", "M0 0 l" + " 1 1" * commands),
+        ("compact arc flags", "M0 0 " + "a1 1 0 0110 0" * commands),
+    )
+
+def time_best(function, argument, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = function(argument)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def benchmark_path_parsing(commands=100000, repeats=3):
+    """Time iter_path_segments against the regex split parser, prints ms and segments/vertices per case"""
+    
+    for label, path_data in benchmark_path_cases(commands):
+        new_time, segments = time_best(lambda data: list(iter_path_segments(data)), path_data, repeats)
+        old_time, coordinates = time_best(parse_path_data_regex_split, path_data, repeats)
+        
+        print(f"{label:>18}: old {old_time * 1000:7.1f} ms / {len(coordinates) // 2:>7} vertices | "
+              f"new {new_time * 1000:7.1f} ms / {len(segments):>7} segments")
+
+def calculate_mirror_symmetry_score_brute_force(points, mirror_line, tolerance=MIRROR_SCORE_TOLERANCE):
+    """The scorer MirrorSymmetryIndex replaced, kept as the benchmark and test reference: nearest
+    neighbour of every reflected point by brute force"""
+    
+    total_points = len(points)
+    if total_points == 0:
+        return 0
+    
+    mirrored = mirror_points_across_line(points, *mirror_line)
+    matches = 0
+    
+    # Nearest neighbour by brute force, a block of mirrored points at a time to bound memory
+    block_size = max(1, MIRROR_SCORE_BLOCK_ELEMENTS // total_points)
+    for start in range(0, total_points, block_size):
+        block = mirrored[start:start + block_size]
+        dx = block[:, 0, None] - points[None, :, 0]
+        dy = block[:, 1, None] - points[None, :, 1]
+        min_distance = np.sqrt((dx * dx + dy * dy).min(axis=1))
+        matches += int(np.count_nonzero(min_distance < tolerance))
+    
+    return matches / total_points
+
+def benchmark_outline_points(size, seed=0):
+    """A wavy, roughly mirror-symmetric outline of `size` points at pattern SVG scale"""
+    
+    angles = np.sort(np.random.default_rng(seed).uniform(0.0, 2 * math.pi, size))
+    radius = 1.0 + 0.1 * np.cos(angles * 6)
+    return np.column_stack((600 * radius * np.cos(angles), 1000 * radius * np.sin(angles)))
+
+def benchmark_mirror_axes(points, axes):
+    """`axes` mirror lines through the centroid, evenly spread over half a turn"""
+    
+    center_x, center_y = points.mean(axis=0).tolist()
+    half_length = float(np.ptp(points, axis=0).max()) * 2
+    lines = []
+    for i in range(axes):
+        angle = math.pi * i / axes
+        dx = math.cos(angle) * half_length
+        dy = math.sin(angle) * half_length
+        lines.append(((center_x - dx, center_y - dy), (center_x + dx, center_y + dy)))
+    return lines
+
+def benchmark_mirror_symmetry(sizes=(500, 5000, 50000), axes=18):
+    """Time an 18-axis symmetry sweep with MirrorSymmetryIndex against the brute-force scorer
+    
+    Prints one row per size and whether every axis scored identically."""
+    
+    for size in sizes:
+        points = benchmark_outline_points(size)
+        lines = benchmark_mirror_axes(points, axes)
+        
+        start = time.perf_counter()
+        symmetry_index = MirrorSymmetryIndex(points)
+        build_time = time.perf_counter() - start
+        index_scores = [symmetry_index.score(line) for line in lines]
+        index_time = time.perf_counter() - start
+        
+        brute_force_lines = lines if size <= BENCHMARK_BRUTE_FORCE_FULL_SWEEP else lines[:BENCHMARK_BRUTE_FORCE_AXES]
+        start = time.perf_counter()
+        brute_force_scores = [calculate_mirror_symmetry_score_brute_force(points, line) for line in brute_force_lines]
+        brute_force_time = (time.perf_counter() - start) * axes / len(brute_force_lines)
+        
+        identical = index_scores[:len(brute_force_scores)] == brute_force_scores
+        estimate = "~" if len(brute_force_lines) < axes else " "
+        print(f"{size:>7} points: index {index_time * 1000:9.1f} ms (build {build_time * 1000:6.1f} ms) | "
+              f"brute force {estimate}{brute_force_time * 1000:9.1f} ms | "
+              f"{brute_force_time / index_time:6.1f}x | scores {'identical' if identical else 'DIFFER'}")
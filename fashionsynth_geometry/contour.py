@@ -0,0 +1,348 @@
+"""Ordered boundary contour of a pattern piece
+
+Every piece is one closed outline. The contour index keeps that loop in order with its cumulative arc
+length, the turning angle at every vertex and a split into straight and curved runs of one orientation,
+so seam finders can query a piece's structure instead of rediscovering it from an unordered edge scan."""
+
+import math
+
+import numpy as np
+
+from .seams import EdgeAdjacency
+
+# Vertices turning less than this (degrees) continue a straight run
+CONTOUR_STRAIGHT_TURN = 2.0
+# Vertices turning more than this are corners and end a run, whatever its kind - the armhole start angle
+CONTOUR_CORNER_TURN = 35.0
+# Edges within this of the up axis are vertical, within it of level horizontal - the side and hem angle
+CONTOUR_ORIENTATION_ANGLE = 30.0
+
+CONTOUR_RUN_KINDS = ("straight", "curved")
+CONTOUR_RUN_ORIENTATIONS = ("vertical", "horizontal", "diagonal")
+
+def turning_angles(vectors, lengths):
+    """Degrees the outline turns at each vertex - between edge i - 1 and edge i, 0..180, 0 where either
+    edge has no length"""
+    
+    safe = np.where(lengths > 0, lengths, 1.0)[:, None]
+    directions = vectors / safe
+    cosines = (np.roll(directions, 1, axis=0) * directions).sum(axis=1)
+    angles = np.degrees(np.arccos(np.clip(cosines, -1.0, 1.0)))
+    
+    degenerate = (lengths == 0) | (np.roll(lengths, 1) == 0)
+    angles[degenerate] = 0.0
+    return angles
+
+def edge_orientations(vectors, lengths, up, max_angle=CONTOUR_ORIENTATION_ANGLE):
+    """CONTOUR_RUN_ORIENTATIONS code of every edge against an up direction - diagonal for zero-length edges"""
+    
+    up = np.asarray(up, dtype=np.float64)
+    up = up / np.linalg.norm(up)
+    
+    ratios = np.abs(vectors @ up) / np.where(lengths > 0, lengths, np.inf)
+    angles = np.degrees(np.arccos(np.minimum(1.0, ratios)))
+    codes = np.where(angles < max_angle, 0, np.where(angles > 90.0 - max_angle, 1, 2))
+    codes[lengths == 0] = 2
+    return codes
+
+def split_runs(turning, orientations, straight_turn=CONTOUR_STRAIGHT_TURN, corner_turn=CONTOUR_CORNER_TURN):
+    """(starts, counts, kinds) of the runs of a closed loop, by loop position
+    
+    An edge is curved when the outline turns more than straight_turn at both its ends, not counting
+    corners. Runs are the stretches of edges of one kind and orientation with no corner between them,
+    and a straight run also ends where two of its edges meet turning more than straight_turn."""
+    
+    count = len(turning)
+    corners = turning > corner_turn
+    # A corner says nothing about whether the edges either side of it are curved
+    joins = np.where(corners, np.inf, turning)
+    edge_turns = np.minimum(joins, np.roll(joins, -1))
+    kinds = ((edge_turns > straight_turn) & np.isfinite(edge_turns)).astype(np.int64)
+    
+    changes = (kinds != np.roll(kinds, 1)) | (orientations != np.roll(orientations, 1))
+    kinks = (turning > straight_turn) & (kinds == 0) & (np.roll(kinds, 1) == 0)
+    breaks = np.flatnonzero(corners | changes | kinks)
+    if len(breaks) == 0:
+        return np.zeros(1, dtype=np.int64), np.array([count]), kinds[:1]
+    
+    counts = np.diff(np.append(breaks, breaks[0] + count))
+    return breaks, counts, kinds[breaks]
+
+class ContourIndex:
+    """Ordered loop of a piece's outline, addressed by mesh vertex and edge index
+    
+    points holds every mesh vertex. Loop position p runs from vertex vertex_order[p] along edge
+    edge_order[p] to vertex_order[p + 1]; pieces built by the addon use the identity order, edited ones
+    may leave vertices and edges off the loop."""
+    
+    def __init__(self, points, vertex_order=None, edge_order=None, edge_count=None):
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        
+        self.vertex_order = np.arange(len(points)) if vertex_order is None else np.asarray(vertex_order, dtype=np.int64)
+        count = len(self.vertex_order)
+        self.edge_order = np.arange(count) if edge_order is None else np.asarray(edge_order, dtype=np.int64)
+        self.vertex_count = len(points)
+        self.edge_count = count if edge_count is None else edge_count
+        
+        self.points = points[self.vertex_order]
+        self.vectors = np.roll(self.points, -1, axis=0) - self.points
+        self.lengths = np.sqrt((self.vectors * self.vectors).sum(axis=1))
+        self.arc_length = np.concatenate(([0.0], np.cumsum(self.lengths)))
+        self.turning = turning_angles(self.vectors, self.lengths)
+        
+        # Mesh index → loop position (-1 off the loop), as lists for the per-step lookups of the walkers
+        vertex_position = np.full(self.vertex_count, -1, dtype=np.int64)
+        vertex_position[self.vertex_order] = np.arange(count)
+        edge_position = np.full(self.edge_count, -1, dtype=np.int64)
+        edge_position[self.edge_order] = np.arange(count)
+        self._vertex_position = vertex_position.tolist()
+        self._edge_position = edge_position.tolist()
+        self._vertex_list = self.vertex_order.tolist()
+        self._edge_list = self.edge_order.tolist()
+        self._turning_list = self.turning.tolist()
+        # Runs and each loop position's run, per up direction
+        self._runs = {}
+    
+    @classmethod
+    def from_mesh_loop(cls, points, edge_vertices):
+        """Index of a mesh whose edges form one closed loop through every vertex, or None"""
+        
+        edge_vertices = np.asarray(edge_vertices, dtype=np.int64).reshape(-1, 2)
+        count = len(points)
+        if count < 3 or len(edge_vertices) != count:
+            return None
+        
+        # The layout build_outline_mesh writes - edge i joins vertex i to i + 1
+        indices = np.arange(count)
+        if np.array_equal(edge_vertices, np.column_stack((indices, np.roll(indices, -1)))):
+            return cls(points)
+        
+        adjacency = EdgeAdjacency(edge_vertices, count)
+        if any(len(adjacency.edges_at(vertex)) != 2 for vertex in range(count)):
+            return None
+        
+        vertex_order = [int(edge_vertices[0, 0])]
+        edge_order = [0]
+        for _ in range(count - 1):
+            vertex = adjacency.other_vertex(edge_order[-1], vertex_order[-1])
+            first, second = adjacency.edges_at(vertex)
+            vertex_order.append(vertex)
+            edge_order.append(second if first == edge_order[-1] else first)
+        
+        # Two or more separate loops
+        if len(set(vertex_order)) != count:
+            return None
+        
+        return cls(points, vertex_order, edge_order)
+    
+    @classmethod
+    def from_edge_graph(cls, points, edge_vertices):
+        """Index of the outer boundary of a planar mesh whose edges aren't one loop - a piece with a loop
+        cut or edges added inside it - or None if that boundary isn't a simple loop
+        
+        Walks the EdgeAdjacency from the leftmost vertex, always taking the sharpest right turn, which
+        keeps to the outside of the piece."""
+        
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        edge_vertices = np.asarray(edge_vertices, dtype=np.int64).reshape(-1, 2)
+        used = np.unique(edge_vertices)
+        if len(used) < 3:
+            return None
+        
+        # Flatten onto the piece's plane - its two widest principal axes
+        centre = points[used].mean(axis=0)
+        _, _, axes = np.linalg.svd(points[used] - centre, full_matrices=False)
+        flat = ((points - centre) @ axes[:2].T).tolist()
+        
+        adjacency = EdgeAdjacency(edge_vertices, len(points))
+        start = int(used[np.lexsort((np.asarray(flat)[used, 1], np.asarray(flat)[used, 0]))[0]])
+        
+        # Arrive at the start heading right, so the first turn picks the lowest of its edges
+        vertex, arrived, back = start, -1, math.pi
+        vertex_order = []
+        edge_order = []
+        for _ in range(2 * len(edge_vertices)):
+            best = None
+            x, y = flat[vertex]
+            for edge in adjacency.edges_at(vertex):
+                if edge == arrived:
+                    continue
+                other = adjacency.other_vertex(edge, vertex)
+                # Anticlockwise angle from the way back - the smallest is the sharpest right turn
+                turn = (math.atan2(flat[other][1] - y, flat[other][0] - x) - back) % (2 * math.pi)
+                if best is None or turn < best[0]:
+                    best = (turn, edge, other)
+            
+            # A dead end, or back at the start about to go round again
+            if best is None or (vertex == start and edge_order and best[1] == edge_order[0]):
+                break
+            
+            _, edge, other = best
+            vertex_order.append(vertex)
+            edge_order.append(edge)
+            back = math.atan2(y - flat[other][1], x - flat[other][0])
+            vertex, arrived = other, edge
+        
+        # A boundary that never closed or passes a vertex twice
+        if vertex != start or len(vertex_order) < 3 or len(set(vertex_order)) != len(vertex_order):
+            return None
+        
+        return cls(points, vertex_order, edge_order, len(edge_vertices))
+    
+    @classmethod
+    def from_property(cls, points, edge_vertices, data):
+        """Rebuild an index stored with to_property, or None if the mesh no longer matches it"""
+        
+        try:
+            vertex_order = np.asarray(data["vertex_order"], dtype=np.int64)
+            edge_order = np.asarray(data["edge_order"], dtype=np.int64)
+            arc_length = np.asarray(data["arc_length"], dtype=np.float64)
+            vertex_count = int(data["vertex_count"])
+            edge_count = int(data["edge_count"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        
+        # Vertices or edges added or removed since the index was stored
+        if vertex_count != len(points) or edge_count != len(edge_vertices) or len(edge_order) != len(vertex_order):
+            return None
+        
+        contour = cls(points, vertex_order, edge_order, edge_count)
+        # Vertices moved since the index was stored
+        if not np.allclose(contour.arc_length, arc_length, atol=1e-6):
+            return None
+        return contour
+    
+    def to_property(self):
+        """Plain lists for a Blender ID property"""
+        
+        return {
+            "vertex_order": self.vertex_order.tolist(),
+            "edge_order": self.edge_order.tolist(),
+            "arc_length": self.arc_length.tolist(),
+            "vertex_count": self.vertex_count,
+            "edge_count": self.edge_count,
+        }
+    
+    @property
+    def count(self):
+        return len(self._edge_list)
+    
+    def linked_edges(self, edge):
+        """The loop edges either side of an edge - past its start, then past its end"""
+        
+        position = self._edge_position[edge]
+        if position < 0:
+            return []
+        return [self._edge_list[position - 1], self._edge_list[(position + 1) % self.count]]
+    
+    def edges_at(self, vertex):
+        """The loop edges meeting at a vertex - the one arriving, then the one leaving"""
+        
+        position = self._vertex_position[vertex]
+        if position < 0:
+            return []
+        return [self._edge_list[position - 1], self._edge_list[position]]
+    
+    def join_vertex(self, edge, linked):
+        """The vertex an edge shares with one of its linked_edges"""
+        
+        position = self._edge_position[edge]
+        if self._edge_list[position - 1] == linked:
+            return self._vertex_list[position]
+        return self._vertex_list[(position + 1) % self.count]
+    
+    def leads_to(self, edge, vertex):
+        """Whether following the loop forward along an edge arrives at one of its vertices"""
+        return self._vertex_list[(self._edge_position[edge] + 1) % self.count] == vertex
+    
+    def turn_at(self, vertex):
+        """Degrees the loop turns at a vertex, 0..180"""
+        return self._turning_list[self._vertex_position[vertex]]
+    
+    def bend_at(self, vertex):
+        """Angle at a vertex between the lines of its two edges, ignoring direction - 0..90"""
+        
+        turn = self._turning_list[self._vertex_position[vertex]]
+        return min(turn, 180.0 - turn)
+    
+    def _split(self, up):
+        """(runs, run of every loop position) against an up direction, cached"""
+        
+        up = np.asarray(up, dtype=np.float64)
+        up = up / np.linalg.norm(up)
+        key = tuple(up.tolist())
+        if key in self._runs:
+            return self._runs[key]
+        
+        count = self.count
+        orientations = edge_orientations(self.vectors, self.lengths, up)
+        starts, counts, kinds = split_runs(self.turning, orientations)
+        orientations = orientations[starts].tolist()
+        run_of_position = np.empty(count, dtype=np.int64)
+        
+        runs = []
+        for run, (start, run_count, kind) in enumerate(zip(starts.tolist(), counts.tolist(), kinds.tolist())):
+            positions = (start + np.arange(run_count)) % count
+            run_of_position[positions] = run
+            end = (start + run_count) % count
+            
+            chord = self.points[end] - self.points[start]
+            chord_length = float(np.linalg.norm(chord))
+            chord_angle = math.degrees(math.acos(min(1.0, abs(float(chord @ up)) / chord_length))) if chord_length > 0 else 90.0
+            runs.append({
+                'start': start,
+                'count': run_count,
+                'kind': CONTOUR_RUN_KINDS[kind],
+                'orientation': CONTOUR_RUN_ORIENTATIONS[orientations[run]],
+                'angle': chord_angle,
+                'turn': self._turning_list[start],
+                'length': float(self.lengths[positions].sum()),
+                'edges': self.edge_order[positions].tolist(),
+                'vertices': self.vertex_order[np.append(positions, end)].tolist(),
+            })
+        
+        self._runs[key] = (runs, run_of_position.tolist())
+        return self._runs[key]
+    
+    def runs(self, up=(0.0, 0.0, 1.0)):
+        """One dict per run, in loop order - loop start, edge count, kind, orientation and chord angle
+        from up (degrees), the turn into its first vertex, arc length, mesh edges and mesh vertices"""
+        return self._split(up)[0]
+    
+    def run_of(self, edge, up=(0.0, 0.0, 1.0)):
+        """The run a mesh edge belongs to, or None off the loop"""
+        
+        position = self._edge_position[edge]
+        if position < 0:
+            return None
+        runs, run_of_position = self._split(up)
+        return runs[run_of_position[position]]
+    
+    def walk_runs(self, edge, forward=True, up=(0.0, 0.0, 1.0), corner_turn=CONTOUR_CORNER_TURN, orientation=None):
+        """Loop edges from a mesh edge onwards, a run at a time, up to the first run boundary turning more
+        than corner_turn (at least CONTOUR_CORNER_TURN) or, given an orientation, the first run of another
+        
+        Returns (mesh edges, the edge past the stop) - None for the latter if the walk came all the way
+        round. forward follows loop order, otherwise it's walked backwards."""
+        
+        position = self._edge_position[edge]
+        if position < 0:
+            return [], None
+        
+        runs, run_of_position = self._split(up)
+        run = run_of_position[position]
+        offset = (position - runs[run]['start']) % self.count
+        edges = list(runs[run]['edges'][offset:] if forward else runs[run]['edges'][offset::-1])
+        
+        step = 1 if forward else -1
+        while len(edges) < self.count:
+            following = runs[(run + step) % len(runs)]
+            # The boundary crossed is the first vertex of whichever run comes later in loop order
+            boundary = following if forward else runs[run]
+            if boundary['turn'] > corner_turn or (orientation is not None and following['orientation'] != orientation):
+                return edges, following['edges'][0 if forward else -1]
+            
+            edges.extend(following['edges'] if forward else following['edges'][::-1])
+            run = (run + step) % len(runs)
+        
+        return edges[:self.count], None
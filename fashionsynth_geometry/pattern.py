@@ -0,0 +1,581 @@
+"""Pattern piece orientation on N×2 NumPy point arrays: mirror axes, fold lines, bounding boxes"""
+
+import math
+
+import numpy as np
+
+# A mirrored point matches when it lands closer than this (SVG units) to a point of the piece
+MIRROR_SCORE_TOLERANCE = 50
+# Symmetry scoring compares at most this many point pairs at once
+MIRROR_SCORE_BLOCK_ELEMENTS = 1 << 20
+# Mirror axis search: seeds from principal axes and the longest convex hull edges, refined by a
+# pattern search on (angle, offset) until the angle step drops below the precision
+MIRROR_AXIS_HULL_EDGES = 4
+MIRROR_AXIS_REFINE_SEEDS = 2
+MIRROR_AXIS_ANGLE_STEP = math.radians(4)
+MIRROR_AXIS_ANGLE_PRECISION = math.radians(0.1)
+MIRROR_AXIS_MAX_EVALUATIONS = 80
+# Found axes are reported in the angle range the old 10° sweep covered, so pieces end up the same way up
+MIRROR_AXIS_MIN_ANGLE = -math.pi / 36
+
+# Fold line detection: chord ends within this x distance (SVG units) count as vertical
+FOLD_LINE_TOLERANCE = 5
+
+# Panels and bands keep their drawn axes unless a tilted bounding box is this much smaller in area
+BOUNDING_BOX_AXIS_ALIGNED_SLACK = 0.02
+# Bounding box search projects at most this many hull points at once
+BOUNDING_BOX_BLOCK_ELEMENTS = 1 << 20
+
+def orient_coordinates_for_part(coordinates, part_name):
+    """Rotate/mirror pattern coordinates into the layout their part expects, returns an N×2 points array
+    
+    Accepts flat [x, y, ...] coordinates or a points array."""
+    
+    points = as_points_array(coordinates)
+    if len(points) < 3:
+        return points
+    
+    if "front_panel" in part_name.lower() or "back_panel" in part_name.lower():
+        points = auto_orient_front_panel_points(points)
+    elif "neck_binding" in part_name.lower() or "waist_band" in part_name.lower():
+        points = auto_orient_horizontal_piece_points(points)
+    elif "sleeve" in part_name.lower() and "cuff" not in part_name.lower():
+        points = auto_orient_sleeve_points(points)
+    
+    return points
+
+def as_points_array(coordinates):
+    """N×2 float64 array of flat [x, y, ...] coordinates, (x, y) pairs or an existing points array
+    
+    A trailing unpaired value in flat coordinates is dropped, as the list-based helpers always did."""
+    
+    points = np.asarray(coordinates, dtype=np.float64)
+    if points.ndim == 1:
+        points = points[:len(points) // 2 * 2].reshape(-1, 2)
+    return points
+
+def to_flat_coordinates(points):
+    """Flat [x, y, ...] list of a points array"""
+    return as_points_array(points).ravel().tolist()
+
+def convex_hull_points(points):
+    """Convex hull of an N×2 points array as a counter-clockwise array of hull vertices"""
+    
+    unique_points = np.unique(as_points_array(points), axis=0)
+    if len(unique_points) < 3:
+        return unique_points
+    
+    def half_hull(ordered):
+        hull = []
+        for x, y in ordered:
+            while len(hull) >= 2:
+                (ax, ay), (bx, by) = hull[-2], hull[-1]
+                if (bx - ax) * (y - ay) - (by - ay) * (x - ax) > 0:
+                    break
+                hull.pop()
+            hull.append((x, y))
+        return hull
+    
+    ordered = unique_points.tolist()
+    lower = half_hull(ordered)
+    upper = half_hull(reversed(ordered))
+    return np.array(lower[:-1] + upper[:-1], dtype=np.float64)
+
+def mirror_axis_seeds(points, pivot):
+    """Candidate mirror axes as (angle, offset) pairs - the principal axes through the centroid, plus the
+    perpendicular bisectors of the longest hull edges and lines through the centroid parallel to them"""
+    
+    seeds = []
+    
+    centered = points - pivot
+    _, eigenvectors = np.linalg.eigh(centered.T @ centered)
+    for direction_x, direction_y in eigenvectors.T.tolist():
+        seeds.append((math.atan2(direction_y, direction_x), 0.0))
+    
+    hull = convex_hull_points(points)
+    if len(hull) >= 3:
+        edges = np.roll(hull, -1, axis=0) - hull
+        longest = np.argsort(-np.hypot(edges[:, 0], edges[:, 1]), kind='stable')[:MIRROR_AXIS_HULL_EDGES]
+        for edge_index in longest.tolist():
+            edge_x, edge_y = edges[edge_index].tolist()
+            seeds.append((math.atan2(edge_y, edge_x), 0.0))
+            
+            # Perpendicular bisector: direction (-edge_y, edge_x) through the edge midpoint
+            bisector_angle = math.atan2(edge_x, -edge_y)
+            mid_x, mid_y = (hull[edge_index] + edges[edge_index] / 2 - pivot).tolist()
+            seeds.append((bisector_angle, -math.sin(bisector_angle) * mid_x + math.cos(bisector_angle) * mid_y))
+    
+    return seeds
+
+def normalize_mirror_axis(angle, offset):
+    """Same axis with its angle in [MIRROR_AXIS_MIN_ANGLE, MIRROR_AXIS_MIN_ANGLE + pi)"""
+    
+    half_turns = math.floor((angle - MIRROR_AXIS_MIN_ANGLE) / math.pi)
+    angle -= half_turns * math.pi
+    # Turning the direction by pi flips the normal the offset is measured along
+    return angle, (-offset if half_turns % 2 else offset)
+
+def mirror_axis_line(pivot, angle, offset, center, half_length):
+    """(line_start, line_end) of the axis at `offset` from pivot, centred on center's projection onto it"""
+    
+    direction_x, direction_y = math.cos(angle), math.sin(angle)
+    on_line_x = pivot[0] - direction_y * offset
+    on_line_y = pivot[1] + direction_x * offset
+    
+    along = (center[0] - on_line_x) * direction_x + (center[1] - on_line_y) * direction_y
+    mid_x = on_line_x + direction_x * along
+    mid_y = on_line_y + direction_y * along
+    
+    return (
+        (mid_x - direction_x * half_length, mid_y - direction_y * half_length),
+        (mid_x + direction_x * half_length, mid_y + direction_y * half_length),
+    )
+
+def find_mirror_line(points):
+    """Best mirror axis of an N×2 points array, or None if no axis mirrors at least 40% of the points"""
+    
+    if len(points) < 4:
+        return None
+    
+    min_x, min_y = points.min(axis=0).tolist()
+    max_x, max_y = points.max(axis=0).tolist()
+    
+    center = ((min_x + max_x) / 2, (min_y + max_y) / 2)
+    half_length = max(max_x - min_x, max_y - min_y) * 2
+    pivot = tuple(points.mean(axis=0).tolist())
+    
+    # Index the piece once, every candidate axis is scored against it
+    symmetry_index = MirrorSymmetryIndex(points)
+    evaluations = {}
+    
+    def evaluate(angle, offset):
+        angle, offset = normalize_mirror_axis(angle, offset)
+        key = (round(angle, 12), round(offset, 9))
+        if key not in evaluations:
+            line = mirror_axis_line(pivot, angle, offset, center, half_length)
+            evaluations[key] = symmetry_index.evaluate(line) + (angle, offset)
+        return evaluations[key]
+    
+    # (score, residual, angle, offset) per seed, best residual first
+    seeds = sorted(
+        (evaluate(angle, offset) for angle, offset in mirror_axis_seeds(points, pivot)),
+        key=lambda result: result[1],
+    )
+    
+    best = None
+    for seed in seeds[:MIRROR_AXIS_REFINE_SEEDS]:
+        if best is not None and seed[1] > 2 * best[1]:
+            break
+        
+        current = seed
+        angle_step = MIRROR_AXIS_ANGLE_STEP
+        offset_step = symmetry_index.tolerance / 2
+        
+        # Pattern search: move to the best neighbour, halve the steps once no neighbour is better
+        while angle_step >= MIRROR_AXIS_ANGLE_PRECISION and current[1] > 0:
+            if len(evaluations) >= MIRROR_AXIS_MAX_EVALUATIONS:
+                break
+            
+            _, _, angle, offset = current
+            neighbour = min(
+                (
+                    evaluate(angle + angle_step, offset),
+                    evaluate(angle - angle_step, offset),
+                    evaluate(angle, offset + offset_step),
+                    evaluate(angle, offset - offset_step),
+                ),
+                key=lambda result: result[1],
+            )
+            
+            if neighbour[1] < current[1]:
+                current = neighbour
+            else:
+                angle_step /= 2
+                offset_step /= 2
+        
+        if best is None or current[1] < best[1]:
+            best = current
+    
+    symmetry_score, _, angle, offset = best
+    if symmetry_score > 0.4:
+        return mirror_axis_line(pivot, angle, offset, center, half_length)
+    else:
+        return None
+
+def find_mirror_line_and_visualize(coordinates, part_name="test"):
+    return find_mirror_line(as_points_array(coordinates))
+
+class MirrorSymmetryIndex:
+    """Uniform grid over a piece's points for scoring many candidate mirror axes
+    
+    Cells are slightly wider than the match tolerance, so every point within tolerance of a query
+    lies in the 3×3 cells around it. Distances are computed exactly as the brute-force scorer did,
+    so scores are identical."""
+    
+    def __init__(self, points, tolerance=MIRROR_SCORE_TOLERANCE):
+        self.points = as_points_array(points)
+        self.tolerance = tolerance
+        self.cell_size = tolerance * (1 + 1e-6)
+        
+        cells = np.floor(self.points / self.cell_size).astype(np.int64)
+        order = np.lexsort((cells[:, 1], cells[:, 0]))
+        self.sorted_points = self.points[order]
+        
+        sorted_cells = cells[order]
+        starts = np.flatnonzero(np.any(np.diff(sorted_cells, axis=0) != 0, axis=1)) + 1
+        starts = np.concatenate(([0], starts)) if len(order) else starts
+        ends = np.append(starts[1:], len(order))
+        self.cell_ranges = {
+            (cell_x, cell_y): (start, end)
+            for (cell_x, cell_y), start, end in zip(sorted_cells[starts].tolist(), starts.tolist(), ends.tolist())
+        }
+    
+    def nearest_distances(self, queries):
+        """Distance from each query point to its nearest indexed point, inf where none is within tolerance"""
+        
+        distances = np.full(len(queries), np.inf)
+        if len(queries) == 0 or not self.cell_ranges:
+            return distances
+        
+        query_cells = np.floor(queries / self.cell_size).astype(np.int64)
+        unique_cells, inverse = np.unique(query_cells, axis=0, return_inverse=True)
+        order = np.argsort(inverse.ravel(), kind='stable')
+        group_ends = np.cumsum(np.bincount(inverse.ravel(), minlength=len(unique_cells)))
+        
+        group_start = 0
+        for (cell_x, cell_y), group_end in zip(unique_cells.tolist(), group_ends.tolist()):
+            group_indices = order[group_start:group_end]
+            group = queries[group_indices]
+            group_start = group_end
+            
+            neighbour_ranges = [
+                self.cell_ranges[(cell_x + dx, cell_y + dy)]
+                for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                if (cell_x + dx, cell_y + dy) in self.cell_ranges
+            ]
+            if not neighbour_ranges:
+                continue
+            
+            candidates = np.concatenate([self.sorted_points[start:end] for start, end in neighbour_ranges])
+            
+            # Dense distances for this cell's queries, a block at a time to bound memory
+            block_size = max(1, MIRROR_SCORE_BLOCK_ELEMENTS // len(candidates))
+            for block_start in range(0, len(group), block_size):
+                block = group[block_start:block_start + block_size]
+                dx = block[:, 0, None] - candidates[None, :, 0]
+                dy = block[:, 1, None] - candidates[None, :, 1]
+                distances[group_indices[block_start:block_start + block_size]] = np.sqrt((dx * dx + dy * dy).min(axis=1))
+        
+        return distances
+    
+    def count_matches(self, queries):
+        """How many query points have an indexed point closer than the tolerance"""
+        return int(np.count_nonzero(self.nearest_distances(queries) < self.tolerance))
+    
+    def score(self, mirror_line):
+        """Fraction of points whose reflection across mirror_line lands within tolerance of a point"""
+        
+        total_points = len(self.points)
+        if total_points == 0:
+            return 0
+        
+        mirrored = mirror_points_across_line(self.points, *mirror_line)
+        return self.count_matches(mirrored) / total_points
+    
+    def evaluate(self, mirror_line):
+        """(score, residual) of a candidate axis
+        
+        The residual is the mean squared distance from each reflection to the piece, capped at the
+        tolerance and scaled to 0..1. Unlike the score it keeps falling as an axis closes in on the
+        true one, which is what the axis search follows."""
+        
+        if len(self.points) == 0:
+            return 0, 1.0
+        
+        distances = self.nearest_distances(mirror_points_across_line(self.points, *mirror_line))
+        capped = np.minimum(distances, self.tolerance) / self.tolerance
+        score = int(np.count_nonzero(distances < self.tolerance)) / len(self.points)
+        return score, float(np.mean(capped * capped))
+
+def calculate_mirror_symmetry_score(points, mirror_line):
+    """Fraction of points whose reflection across mirror_line lands within 50 units of a point"""
+    return MirrorSymmetryIndex(points).score(mirror_line)
+
+def mirror_point_across_line(point, line_start, line_end):
+    px, py = point
+    x1, y1 = line_start
+    x2, y2 = line_end
+    
+    dx = x2 - x1
+    dy = y2 - y1
+    
+    if dx == 0 and dy == 0:
+        return point
+    
+    t = ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)
+    
+    closest_x = x1 + t * dx
+    closest_y = y1 + t * dy
+    
+    mirrored_x = 2 * closest_x - px
+    mirrored_y = 2 * closest_y - py
+    
+    return (mirrored_x, mirrored_y)
+
+def mirror_points_across_line(points, line_start, line_end):
+    """mirror_point_across_line for every row of an N×2 points array"""
+    
+    x1, y1 = line_start
+    x2, y2 = line_end
+    
+    dx = x2 - x1
+    dy = y2 - y1
+    
+    if dx == 0 and dy == 0:
+        return points.copy()
+    
+    t = ((points[:, 0] - x1) * dx + (points[:, 1] - y1) * dy) / (dx * dx + dy * dy)
+    
+    closest_x = x1 + t * dx
+    closest_y = y1 + t * dy
+    
+    return np.column_stack((2 * closest_x - points[:, 0], 2 * closest_y - points[:, 1]))
+
+def auto_orient_sleeve(coordinates):
+    return to_flat_coordinates(auto_orient_sleeve_points(as_points_array(coordinates)))
+
+def auto_orient_sleeve_points(points):
+    mirror_line = find_mirror_line(points)
+    if mirror_line:
+        return align_mirror_line_to_y_axis_points(points, mirror_line)
+    else:
+        return points
+
+def align_mirror_line_to_y_axis(coordinates, mirror_line):
+    return to_flat_coordinates(align_mirror_line_to_y_axis_points(as_points_array(coordinates), mirror_line))
+
+def align_mirror_line_to_y_axis_points(points, mirror_line):
+    line_start, line_end = mirror_line
+    
+    mirror_dx = line_end[0] - line_start[0]
+    mirror_dy = line_end[1] - line_start[1]
+    current_angle = math.atan2(mirror_dy, mirror_dx)
+    
+    target_angle = 0
+    rotation_needed = target_angle - current_angle
+    
+    mirror_center_x = (line_start[0] + line_end[0]) / 2
+    mirror_center_y = (line_start[1] + line_end[1]) / 2
+    
+    cos_angle = math.cos(rotation_needed)
+    sin_angle = math.sin(rotation_needed)
+    
+    temp_x = points[:, 0] - mirror_center_x
+    temp_y = points[:, 1] - mirror_center_y
+    
+    new_x = temp_x * cos_angle - temp_y * sin_angle
+    new_y = temp_x * sin_angle + temp_y * cos_angle
+    
+    return np.column_stack((new_x + mirror_center_x, new_y + mirror_center_y))
+
+def minimum_area_bounding_box(points):
+    """(angle, length, width) of the smallest-area rectangle around an N×2 points array
+    
+    angle is the direction of the rectangle side measuring `length`, in [0, pi/2). The smallest
+    rectangle has a side on a convex hull edge, so only hull edge directions are tried - the
+    rotating calipers candidates - each projected in one pass. The drawn axes (angle 0) win unless
+    a tilted box is smaller by more than BOUNDING_BOX_AXIS_ALIGNED_SLACK."""
+    
+    hull = convex_hull_points(points)
+    if len(hull) == 0:
+        return 0.0, 0.0, 0.0
+    
+    edges = np.roll(hull, -1, axis=0) - hull
+    angles = np.mod(np.arctan2(edges[:, 1], edges[:, 0]), math.pi / 2)
+    angles = np.unique(np.concatenate(([0.0], angles)))
+    
+    lengths = np.empty(len(angles))
+    widths = np.empty(len(angles))
+    block_size = max(1, BOUNDING_BOX_BLOCK_ELEMENTS // len(hull))
+    for block_start in range(0, len(angles), block_size):
+        block = slice(block_start, block_start + block_size)
+        cos_angles = np.cos(angles[block])[:, None]
+        sin_angles = np.sin(angles[block])[:, None]
+        along = hull[None, :, 0] * cos_angles + hull[None, :, 1] * sin_angles
+        across = hull[None, :, 1] * cos_angles - hull[None, :, 0] * sin_angles
+        lengths[block] = np.ptp(along, axis=1)
+        widths[block] = np.ptp(across, axis=1)
+    
+    areas = lengths * widths
+    best = int(areas.argmin())
+    # angles is sorted and starts at 0.0, the drawn axes
+    if areas[0] <= areas[best] * (1 + BOUNDING_BOX_AXIS_ALIGNED_SLACK):
+        best = 0
+    
+    return float(angles[best]), float(lengths[best]), float(widths[best])
+
+def long_axis_rotation(points, vertical=False):
+    """Degrees to rotate_points by so a piece's long axis runs horizontally, or vertically
+    
+    Picked from [-45, 135) so an upright piece turns by 90 rather than -90, as the 0/90/180/270
+    trials did."""
+    
+    angle, length, width = minimum_area_bounding_box(points)
+    long_axis = angle if length >= width else angle + math.pi / 2
+    target = math.pi / 2 if vertical else 0.0
+    
+    rotation = math.degrees(target - long_axis)
+    return (rotation + 45) % 180 - 45
+
+def auto_orient_horizontal_piece(coordinates):
+    return to_flat_coordinates(auto_orient_horizontal_piece_points(as_points_array(coordinates)))
+
+def auto_orient_horizontal_piece_points(points):
+    return rotate_points(points, long_axis_rotation(points))
+
+def auto_orient_front_panel(coordinates):
+    return to_flat_coordinates(auto_orient_front_panel_points(as_points_array(coordinates)))
+
+def auto_orient_front_panel_points(points):
+    if len(points) < 4:
+        return mirror_points_vertically(points)
+    
+    return mirror_points_vertically(rotate_points(points, long_axis_rotation(points, vertical=True)))
+
+def mirror_vertically(coordinates):
+    return to_flat_coordinates(mirror_points_vertically(as_points_array(coordinates)))
+
+def mirror_points_vertically(points):
+    """Unfold a half pattern cut on the fold: append its reflection across the fold line, in reverse order"""
+    
+    fold_x = find_longest_straight_z_line(points)
+    
+    mirrored_points = np.column_stack((2 * fold_x - points[::-1, 0], points[::-1, 1]))
+    
+    return np.concatenate((points, mirrored_points))
+
+def sparse_table(values, reduce):
+    """Levels of running `reduce` over power-of-two windows, for range_query"""
+    
+    table = [values]
+    width = 1
+    while width * 2 <= len(values):
+        previous = table[-1]
+        table.append(reduce(previous[:len(previous) - width], previous[width:]))
+        width *= 2
+    return table
+
+def range_query(table, reduce, starts, ends, empty):
+    """`reduce` of values[start:end] for each range, `empty` where a range has no values"""
+    
+    lengths = ends - starts
+    result = np.full(len(starts), empty)
+    for level in range(len(table)):
+        # Ranges whose largest power-of-two cover is 2**level take two overlapping windows at that level
+        selected = np.flatnonzero((lengths >= 1 << level) & (lengths < 2 << level))
+        if len(selected):
+            level_values = table[level]
+            result[selected] = reduce(
+                level_values[starts[selected]],
+                level_values[ends[selected] - (1 << level)],
+            )
+    return result
+
+def find_longest_straight_z_line(points):
+    """x of the longest near-vertical chord between non-adjacent points, or the max x if there is none
+    
+    Points are swept in x order: each point's partners are the contiguous run within the tolerance, and
+    range min/max tables give the furthest partner in y without comparing pairs. Ties go to the first
+    pair in point order, as the all-pairs scan did."""
+    
+    points = as_points_array(points)
+    xs = points[:, 0]
+    ys = points[:, 1]
+    tolerance = FOLD_LINE_TOLERANCE
+    count = len(points)
+    
+    if count < 3:
+        return float(xs.max())
+    
+    order = np.argsort(xs, kind='stable')
+    sorted_xs = xs[order]
+    sorted_ys = ys[order]
+    position = np.empty(count, dtype=np.int64)
+    position[order] = np.arange(count)
+    
+    # Run of x-sorted points with |x - xs[i]| < tolerance, found by bisecting on that exact test
+    def first_sorted_index(condition):
+        low = np.zeros(count, dtype=np.int64)
+        high = np.full(count, count, dtype=np.int64)
+        while np.any(low < high):
+            middle = (low + high) // 2
+            passed = condition(sorted_xs[np.minimum(middle, count - 1)] - xs) & (low < high)
+            high = np.where(passed, middle, high)
+            low = np.where(passed | (low >= high), low, middle + 1)
+        return low
+    
+    run_starts = first_sorted_index(lambda dx: dx > -tolerance)
+    run_ends = first_sorted_index(lambda dx: dx >= tolerance)
+    
+    # A point and its neighbours in contour order can't pair, which splits its run into up to four ranges
+    indices = np.arange(count)
+    excluded = np.sort(np.column_stack((
+        position,
+        position[np.maximum(indices - 1, 0)],
+        position[np.minimum(indices + 1, count - 1)],
+    )), axis=1)
+    range_bounds = [
+        (run_starts, excluded[:, 0]),
+        (excluded[:, 0] + 1, excluded[:, 1]),
+        (excluded[:, 1] + 1, excluded[:, 2]),
+        (excluded[:, 2] + 1, run_ends),
+    ]
+    
+    max_table = sparse_table(sorted_ys, np.maximum)
+    min_table = sparse_table(sorted_ys, np.minimum)
+    
+    lengths = np.full(count, -np.inf)
+    for range_starts, range_ends in range_bounds:
+        range_starts = np.maximum(range_starts, run_starts)
+        range_ends = np.maximum(np.minimum(range_ends, run_ends), range_starts)
+        highest = range_query(max_table, np.maximum, range_starts, range_ends, -np.inf)
+        lowest = range_query(min_table, np.minimum, range_starts, range_ends, np.inf)
+        lengths = np.maximum(lengths, np.maximum(highest - ys, ys - lowest))
+    
+    best_length = lengths.max()
+    if best_length == -np.inf:
+        return float(xs.max())
+    
+    # The first pair's first point is the first point on any longest chord, its partner the first such partner
+    i = int(np.flatnonzero(lengths == best_length)[0])
+    partners = order[run_starts[i]:run_ends[i]]
+    partners = partners[(np.abs(partners - i) >= 2) & (np.abs(ys[partners] - ys[i]) == best_length)]
+    j = int(partners.min())
+    
+    return float((xs[i] + xs[j]) / 2)
+
+def rotate_coordinates(coordinates, rotation_degrees):
+    if rotation_degrees == 0:
+        return coordinates
+    
+    return to_flat_coordinates(rotate_points(as_points_array(coordinates), rotation_degrees))
+
+def rotate_points(points, rotation_degrees):
+    """Rotate an N×2 points array about its centroid"""
+    
+    if rotation_degrees == 0 or len(points) == 0:
+        return points
+    
+    center_x, center_y = points.mean(axis=0).tolist()
+    
+    angle = math.radians(rotation_degrees)
+    cos_angle = math.cos(angle)
+    sin_angle = math.sin(angle)
+    
+    x_centered = points[:, 0] - center_x
+    y_centered = points[:, 1] - center_y
+    
+    x_rotated = x_centered * cos_angle - y_centered * sin_angle
+    y_rotated = x_centered * sin_angle + y_centered * cos_angle
+    
+    return np.column_stack((x_rotated + center_x, y_rotated + center_y))
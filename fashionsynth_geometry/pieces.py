@@ -0,0 +1,93 @@
+"""3D piece geometry on NumPy arrays: mesh vertex layout, transforms, quarter-turn orientation"""
+
+import numpy as np
+
+from .svg import get_coordinate_scale_factor
+
+def pattern_vertices(points, part_name, scale_factor=None):
+    """N×3 local vertex positions of a pattern piece, centred on its bounding box
+    
+    Pattern x/y become y/z for sleeves and x/z for everything else, divided by scale_factor
+    (picked from the coordinates' magnitude when None)."""
+    
+    if scale_factor is None:
+        scale_factor = get_coordinate_scale_factor(float(np.abs(points).max()))
+    
+    # Pattern x/y become scene y/z for sleeves and x/z for everything else
+    flat_x = points[:, 0] / scale_factor
+    flat_z = -points[:, 1] / scale_factor
+    zeros = np.zeros(len(points))
+    if "sleeve" in part_name.lower() and "cuff" not in part_name.lower():
+        verts = np.column_stack((zeros, flat_x, flat_z))
+    else:
+        verts = np.column_stack((flat_x, zeros, flat_z))
+    
+    # Centre on the bounding box
+    verts -= (verts.min(axis=0) + verts.max(axis=0)) / 2
+    return verts
+
+def transform_points(matrix, points):
+    """N×3 points moved by a 4×4 transform matrix (rows as in mathutils)"""
+    
+    matrix = np.asarray(matrix, dtype=np.float64)
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+def quarter_turn_rotation_matrix(rot_x, rot_y, rot_z):
+    """Exact integer matrix of an XYZ Euler rotation in multiples of 90 degrees"""
+    
+    def axis_rotation(degrees, first, second):
+        cos_angle, sin_angle = {0: (1, 0), 90: (0, 1), 180: (-1, 0), 270: (0, -1)}[degrees % 360]
+        matrix = np.identity(3, dtype=np.int64)
+        matrix[first, first] = cos_angle
+        matrix[first, second] = -sin_angle
+        matrix[second, first] = sin_angle
+        matrix[second, second] = cos_angle
+        return matrix
+    
+    return axis_rotation(rot_z, 0, 1) @ axis_rotation(rot_y, 2, 0) @ axis_rotation(rot_x, 1, 2)
+
+def get_quarter_turn_rotations():
+    """The 24 axis-aligned rotations (the proper signed permutation matrices), each with the first
+    quarter-turn XYZ Euler angles in 0/90/180/270 trial order that produce it
+    
+    The other 24 signed permutations mirror a piece and have no Euler angles. Dropping repeat
+    matrices keeps first-best ties resolving as they did over all 64 trials."""
+    
+    rotations = {}
+    for rot_x in (0, 90, 180, 270):
+        for rot_y in (0, 90, 180, 270):
+            for rot_z in (0, 90, 180, 270):
+                matrix = quarter_turn_rotation_matrix(rot_x, rot_y, rot_z)
+                rotations.setdefault(matrix.tobytes(), ((rot_x, rot_y, rot_z), matrix))
+    return list(rotations.values())
+
+QUARTER_TURN_ROTATIONS = get_quarter_turn_rotations()
+
+def quarter_turn_world_spans(local_spans, matrix):
+    """World x/y/z spans of a piece with the given local spans after a quarter-turn rotation"""
+    return (np.abs(matrix) @ local_spans).tolist()
+
+def calculate_edge_curvature(edge_points):
+    """Mean distance of an edge's inner points from the straight line joining its lowest and highest
+    point, measured across x/y - 0 for a straight edge. Takes an N×3 array or (x, y, z) points"""
+    
+    points = np.asarray(edge_points, dtype=np.float64).reshape(-1, 3)
+    if len(points) < 3:
+        return 0
+    
+    # Sort points by Z coordinate
+    points = points[np.argsort(points[:, 2], kind='stable')]
+    start = points[0]
+    end = points[-1]
+    inner = points[1:-1]
+    
+    # Distance from each inner point to the line between start and end, at the same Z
+    if end[2] != start[2]:
+        t = (inner[:, 2] - start[2]) / (end[2] - start[2])
+    else:
+        t = np.zeros(len(inner))
+    line_x = start[0] + t * (end[0] - start[0])
+    line_y = start[1] + t * (end[1] - start[1])
+    
+    deviation = np.sqrt((inner[:, 0] - line_x) ** 2 + (inner[:, 1] - line_y) ** 2)
+    return float(deviation.sum()) / len(inner)
@@ -0,0 +1,122 @@
+"""Seam edge classification on plain arrays
+
+Pieces are described by their world-space vertices (N×3) and edge vertex indices (M×2); the
+classifiers return edge indices, leaving it to the caller to map them back to mesh edges."""
+
+import numpy as np
+
+def edge_geometry(world_vertices, edge_vertices):
+    """(starts, ends, vectors, lengths) of every edge"""
+    
+    starts = world_vertices[edge_vertices[:, 0]]
+    ends = world_vertices[edge_vertices[:, 1]]
+    vectors = ends - starts
+    return starts, ends, vectors, np.sqrt((vectors * vectors).sum(axis=1))
+
+def angles_from_axis(vectors, lengths, axis):
+    """Degrees between each edge and a world axis (0 = X, 1 = Y, 2 = Z), either direction - 90 for
+    zero-length edges"""
+    
+    ratios = np.abs(vectors[:, axis]) / np.where(lengths > 0, lengths, np.inf)
+    return np.degrees(np.arccos(np.minimum(1.0, ratios)))
+
+def y_dominant_edges(world_vertices, edge_vertices, z_ratio=1.0, min_y_extent=0.1):
+    """Edges spanning more than min_y_extent in y, more in y than z * z_ratio and more in y than x"""
+    
+    if len(edge_vertices) == 0:
+        return np.empty(0, dtype=np.int64)
+    
+    _, _, vectors, _ = edge_geometry(world_vertices, edge_vertices)
+    extents = np.abs(vectors)
+    return np.flatnonzero(
+        (extents[:, 1] > min_y_extent)
+        & (extents[:, 1] > extents[:, 2] * z_ratio)
+        & (extents[:, 1] > extents[:, 0])
+    )
+
+def edge_midpoint_z(world_vertices, edge_vertices, edges):
+    """Midpoint z of the given edges"""
+    
+    vertex_pairs = edge_vertices[edges]
+    return (world_vertices[vertex_pairs[:, 0], 2] + world_vertices[vertex_pairs[:, 1], 2]) / 2
+
+def sleeve_horizontal_edges(world_vertices, edge_vertices):
+    """(top, bottom) edge index lists of a sleeve's horizontal seams, each lowest first, or (None, None)
+    
+    Y-dominant edges (allowing for curves that dip in z) split at the middle of their z range; if
+    that leaves one side empty, the edges within 0.2 of the lowest and highest are used instead."""
+    
+    edges = y_dominant_edges(world_vertices, edge_vertices, z_ratio=0.7)
+    if len(edges) < 2:
+        return None, None
+    
+    avg_z = edge_midpoint_z(world_vertices, edge_vertices, edges)
+    order = np.argsort(avg_z, kind='stable')
+    edges = edges[order]
+    avg_z = avg_z[order]
+    
+    z_mid = (avg_z.min() + avg_z.max()) / 2
+    top = avg_z >= z_mid
+    bottom = avg_z < z_mid
+    
+    if not top.any() or not bottom.any():
+        z_tolerance = 0.2
+        top = np.abs(avg_z - avg_z[-1]) < z_tolerance
+        bottom = np.abs(avg_z - avg_z[0]) < z_tolerance
+    
+    return edges[top].tolist(), edges[bottom].tolist()
+
+def cuff_horizontal_edges(world_vertices, edge_vertices, level_tolerance=0.05):
+    """(top, bottom) edge index lists of a cuff's horizontal seams, each lowest first, or (None, None) -
+    the Y-dominant edges within level_tolerance of the highest and of the lowest one"""
+    
+    edges = y_dominant_edges(world_vertices, edge_vertices)
+    if len(edges) < 2:
+        return None, None
+    
+    avg_z = edge_midpoint_z(world_vertices, edge_vertices, edges)
+    order = np.argsort(avg_z, kind='stable')
+    edges = edges[order]
+    avg_z = avg_z[order]
+    
+    top = np.abs(avg_z - avg_z[-1]) < level_tolerance
+    bottom = np.abs(avg_z - avg_z[0]) < level_tolerance
+    return edges[top].tolist(), edges[bottom].tolist()
+
+class EdgeAdjacency:
+    """Vertex → edge incidence of a piece's edge list, for walking connected edges
+    
+    Built once in O(E). edges_at lists a vertex's edges in ascending edge order and linked_edges
+    those touching an edge's two ends, so a chain walk over E edges costs O(E) in total. ContourIndex
+    walks it to order the outline of meshes not in the addon's own layout, loop cuts and all."""
+    
+    def __init__(self, edge_vertices, vertex_count=None):
+        edge_vertices = np.asarray(edge_vertices, dtype=np.int64).reshape(-1, 2)
+        if vertex_count is None:
+            vertex_count = int(edge_vertices.max()) + 1 if len(edge_vertices) else 0
+        
+        ends = edge_vertices.ravel()
+        order = np.argsort(ends, kind='stable')
+        offsets = np.concatenate(([0], np.cumsum(np.bincount(ends, minlength=vertex_count))))
+        
+        self.edge_vertices = [tuple(pair) for pair in edge_vertices.tolist()]
+        self._incident = (order // 2).tolist()
+        self._offsets = offsets.tolist()
+    
+    def edges_at(self, vertex):
+        """Indices of the edges using a vertex"""
+        return self._incident[self._offsets[vertex]:self._offsets[vertex + 1]]
+    
+    def other_vertex(self, edge, vertex):
+        first, second = self.edge_vertices[edge]
+        return second if first == vertex else first
+    
+    def linked_edges(self, edge):
+        """Edges sharing a vertex with an edge - those at its first vertex, then its second"""
+        
+        return [
+            linked
+            for vertex in self.edge_vertices[edge]
+            for linked in self.edges_at(vertex)
+            if linked != edge
+        ]
@@ -0,0 +1,42 @@
+"""Stitch placement along seam edge chains
+
+A seam is a chain of world-space segments (N×3 start and end arrays, each segment pointing along the
+chain). Stitch points are spread over it at equal arc length, found with one binary search over the
+cumulative segment lengths instead of a scan of every edge per point."""
+
+import numpy as np
+
+def order_segments(starts, ends, axis):
+    """(starts, ends) with every segment pointing toward +axis (0 = X, 1 = Y, 2 = Z) and sorted by
+    where it starts along it - the chain order of a seam running along that axis"""
+    
+    starts = np.asarray(starts, dtype=np.float64).reshape(-1, 3)
+    ends = np.asarray(ends, dtype=np.float64).reshape(-1, 3)
+    
+    flip = (starts[:, axis] > ends[:, axis])[:, None]
+    starts, ends = np.where(flip, ends, starts), np.where(flip, starts, ends)
+    order = np.argsort(starts[:, axis], kind='stable')
+    return starts[order], ends[order]
+
+def resample_segments(starts, ends, count, start=0.0, end=1.0):
+    """count points at equal arc length along a chain of segments, from fraction start to fraction end
+    of its length - both included, a single point sits midway. Gaps between segments add no length"""
+    
+    starts = np.asarray(starts, dtype=np.float64).reshape(-1, 3)
+    ends = np.asarray(ends, dtype=np.float64).reshape(-1, 3)
+    if count < 1 or len(starts) == 0:
+        return np.empty((0, 3))
+    
+    vectors = ends - starts
+    lengths = np.sqrt((vectors * vectors).sum(axis=1))
+    cumulative = np.concatenate(([0.0], np.cumsum(lengths)))
+    
+    if count == 1:
+        fractions = np.array([(start + end) / 2])
+    else:
+        fractions = np.linspace(start, end, count)
+    targets = fractions * cumulative[-1]
+    
+    segments = np.clip(np.searchsorted(cumulative, targets, side='right') - 1, 0, len(lengths) - 1)
+    offsets = (targets - cumulative[segments]) / np.where(lengths[segments] > 0, lengths[segments], 1.0)
+    return starts[segments] + np.clip(offsets, 0.0, 1.0)[:, None] * vectors[segments]
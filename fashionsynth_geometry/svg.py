@@ -0,0 +1,470 @@
+"""SVG pattern outlines: path parsing, adaptive curve flattening and streaming outline extraction
+
+Coordinates come back as flat [x, y, ...] lists in SVG units."""
+
+import math
+import re
+import traceback
+import xml.etree.ElementTree as ET
+
+# Max distance (scene units) between a pattern's curves and the polyline they are flattened to
+CURVE_TOLERANCE_PREVIEW = 0.02
+CURVE_TOLERANCE_PRODUCTION = 0.002
+CURVE_FLATTEN_MAX_DEPTH = 12
+
+# SVGs are fed to the streaming parser in pieces this size - big enough that expat isn't
+# re-scanning a multi-megabyte inline image attribute on every feed
+SVG_STREAM_CHUNK_SIZE = 1024 * 1024
+
+# SVG path grammar: (absolute command, is relative, argument count) per command letter, and one
+# token pattern matching either a command letter or a number (exponents and ".5" included)
+SVG_PATH_COMMANDS = {
+    'M': ('M', False, 2), 'm': ('M', True, 2),
+    'L': ('L', False, 2), 'l': ('L', True, 2),
+    'H': ('H', False, 1), 'h': ('H', True, 1),
+    'V': ('V', False, 1), 'v': ('V', True, 1),
+    'C': ('C', False, 6), 'c': ('C', True, 6),
+    'S': ('S', False, 4), 's': ('S', True, 4),
+    'Q': ('Q', False, 4), 'q': ('Q', True, 4),
+    'T': ('T', False, 2), 't': ('T', True, 2),
+    'A': ('A', False, 7), 'a': ('A', True, 7),
+    'Z': ('Z', False, 0), 'z': ('Z', True, 0),
+}
+
+SVG_NUMBER_PATTERN = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+
+SVG_NUMBER_RE = re.compile(SVG_NUMBER_PATTERN)
+
+SVG_PATH_TOKEN_RE = re.compile(r'[MmZzLlHhVvCcSsQqTtAa]|' + SVG_NUMBER_PATTERN)
+
+def iter_path_segments(path_data):
+    """Single pass over SVG path data, yielding absolute segments
+    
+    ('M', end), ('L', end), ('C', c1, c2, end), ('Q', c, end), ('A', rx, ry, angle, large_arc, sweep, end)
+    and ('Z', start) - points are (x, y) tuples, each segment starts where the previous one ended.
+    H/V become L and S/T get their reflected control point. Parsing stops at the first command
+    with missing arguments, keeping everything before it, as SVG renderers do."""
+    
+    tokens = SVG_PATH_TOKEN_RE.findall(path_data)
+    token_count = len(tokens)
+    commands = SVG_PATH_COMMANDS
+    i = 0
+    command = None
+    cur_x = cur_y = 0.0
+    start_x = start_y = 0.0
+    ctrl_x = ctrl_y = 0.0
+    prev = None
+    
+    while i < token_count:
+        spec = commands.get(tokens[i])
+        if spec is not None:
+            upper, relative, count = spec
+            i += 1
+            
+            if upper == 'Z':
+                cur_x, cur_y = start_x, start_y
+                prev = 'Z'
+                yield ('Z', (start_x, start_y))
+                continue
+        elif command is None or upper == 'Z':
+            # Numbers with no command to repeat
+            return
+        
+        command = upper
+        try:
+            if upper == 'A':
+                # Arc flags are single digits and may run straight into the next number ("a5 5 0 1050 50"),
+                # so arguments are read one at a time with the split-off remainder as the next token
+                values = []
+                rest = None
+                while len(values) < 7:
+                    if rest:
+                        token = rest
+                        rest = None
+                    elif i < token_count:
+                        token = tokens[i]
+                        i += 1
+                    else:
+                        return
+                    if (len(values) == 3 or len(values) == 4) and len(token) > 1 and token[0] in '01':
+                        rest = token[1:]
+                        token = token[0]
+                    values.append(float(token))
+            else:
+                values = list(map(float, tokens[i:i + count]))
+                if len(values) < count:
+                    return
+                i += count
+        except ValueError:
+            # A command letter where an argument was expected
+            return
+        
+        if relative:
+            base_x, base_y = cur_x, cur_y
+        else:
+            base_x = base_y = 0.0
+        
+        if upper == 'L':
+            cur_x = base_x + values[0]
+            cur_y = base_y + values[1]
+            prev = 'L'
+            yield ('L', (cur_x, cur_y))
+        elif upper == 'C':
+            ctrl_x = base_x + values[2]
+            ctrl_y = base_y + values[3]
+            cur_x = base_x + values[4]
+            cur_y = base_y + values[5]
+            prev = 'C'
+            yield ('C', (base_x + values[0], base_y + values[1]), (ctrl_x, ctrl_y), (cur_x, cur_y))
+        elif upper == 'H':
+            cur_x = base_x + values[0]
+            prev = 'L'
+            yield ('L', (cur_x, cur_y))
+        elif upper == 'V':
+            cur_y = base_y + values[0]
+            prev = 'L'
+            yield ('L', (cur_x, cur_y))
+        elif upper == 'M':
+            cur_x = start_x = base_x + values[0]
+            cur_y = start_y = base_y + values[1]
+            # Further coordinate pairs after a moveto are implicit linetos
+            upper = 'L'
+            prev = 'M'
+            yield ('M', (cur_x, cur_y))
+        elif upper == 'S':
+            c1 = (2 * cur_x - ctrl_x, 2 * cur_y - ctrl_y) if prev == 'C' else (cur_x, cur_y)
+            ctrl_x = base_x + values[0]
+            ctrl_y = base_y + values[1]
+            cur_x = base_x + values[2]
+            cur_y = base_y + values[3]
+            prev = 'C'
+            yield ('C', c1, (ctrl_x, ctrl_y), (cur_x, cur_y))
+        elif upper == 'Q' or upper == 'T':
+            if upper == 'Q':
+                ctrl_x = base_x + values[0]
+                ctrl_y = base_y + values[1]
+                cur_x = base_x + values[2]
+                cur_y = base_y + values[3]
+            else:
+                if prev == 'Q':
+                    ctrl_x, ctrl_y = 2 * cur_x - ctrl_x, 2 * cur_y - ctrl_y
+                else:
+                    ctrl_x, ctrl_y = cur_x, cur_y
+                cur_x = base_x + values[0]
+                cur_y = base_y + values[1]
+            prev = 'Q'
+            yield ('Q', (ctrl_x, ctrl_y), (cur_x, cur_y))
+        else:
+            cur_x = base_x + values[5]
+            cur_y = base_y + values[6]
+            prev = 'A'
+            yield ('A', abs(values[0]), abs(values[1]), values[2], values[3] != 0, values[4] != 0, (cur_x, cur_y))
+
+def get_coordinate_scale_factor(max_coord):
+    """Divisor that brings raw SVG coordinates into scene units, picked from their magnitude"""
+    
+    if max_coord > 1000:
+        return 1000
+    elif max_coord > 100:
+        return 100
+    elif max_coord > 10:
+        return 10
+    else:
+        return 1
+
+def flatten_cubic(p0, p1, p2, p3, tolerance, points):
+    """Append points approximating a cubic Bezier (after p0, ending on p3) within tolerance
+    
+    Subdivides at t=0.5 until each piece is flat enough that its chord stays within tolerance
+    of the curve, so straight runs get one point and tight bends get many."""
+    
+    # Flatness bound on the control polygon: max curve-to-chord distance <= sqrt(ux + uy) / 4
+    limit = 16 * tolerance * tolerance
+    stack = [(p0, p1, p2, p3, 0)]
+    
+    while stack:
+        a, b, c, d, depth = stack.pop()
+        
+        ux = 3 * b[0] - 2 * a[0] - d[0]
+        uy = 3 * b[1] - 2 * a[1] - d[1]
+        vx = 3 * c[0] - 2 * d[0] - a[0]
+        vy = 3 * c[1] - 2 * d[1] - a[1]
+        
+        if depth >= CURVE_FLATTEN_MAX_DEPTH or max(ux * ux, vx * vx) + max(uy * uy, vy * vy) <= limit:
+            points.append(d)
+            continue
+        
+        # de Casteljau split, second half pushed first so points come out in order
+        ab = ((a[0] + b[0]) * 0.5, (a[1] + b[1]) * 0.5)
+        bc = ((b[0] + c[0]) * 0.5, (b[1] + c[1]) * 0.5)
+        cd = ((c[0] + d[0]) * 0.5, (c[1] + d[1]) * 0.5)
+        abc = ((ab[0] + bc[0]) * 0.5, (ab[1] + bc[1]) * 0.5)
+        bcd = ((bc[0] + cd[0]) * 0.5, (bc[1] + cd[1]) * 0.5)
+        mid = ((abc[0] + bcd[0]) * 0.5, (abc[1] + bcd[1]) * 0.5)
+        
+        stack.append((mid, bcd, cd, d, depth + 1))
+        stack.append((a, ab, abc, mid, depth + 1))
+
+def flatten_quadratic(p0, c, p1, tolerance, points):
+    # Degree-elevate to the identical cubic
+    c1 = (p0[0] + 2 / 3 * (c[0] - p0[0]), p0[1] + 2 / 3 * (c[1] - p0[1]))
+    c2 = (p1[0] + 2 / 3 * (c[0] - p1[0]), p1[1] + 2 / 3 * (c[1] - p1[1]))
+    flatten_cubic(p0, c1, c2, p1, tolerance, points)
+
+def flatten_arc(p0, rx, ry, angle, large_arc, sweep, p1, tolerance, points):
+    """Append points approximating an SVG elliptical arc (after p0, ending on p1) within tolerance"""
+    
+    if p0 == p1:
+        return
+    if rx == 0 or ry == 0:
+        points.append(p1)
+        return
+    
+    # Endpoint to center parameterization (SVG 1.1 implementation notes F.6.5/F.6.6)
+    phi = math.radians(angle % 360)
+    cos_phi = math.cos(phi)
+    sin_phi = math.sin(phi)
+    
+    half_dx = (p0[0] - p1[0]) / 2
+    half_dy = (p0[1] - p1[1]) / 2
+    x1p = cos_phi * half_dx + sin_phi * half_dy
+    y1p = -sin_phi * half_dx + cos_phi * half_dy
+    
+    radii_check = (x1p * x1p) / (rx * rx) + (y1p * y1p) / (ry * ry)
+    if radii_check > 1:
+        # Radii too small to reach the endpoint - scale them up just enough
+        scale = math.sqrt(radii_check)
+        rx *= scale
+        ry *= scale
+    
+    numerator = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+    denominator = rx * rx * y1p * y1p + ry * ry * x1p * x1p
+    coefficient = math.sqrt(max(0.0, numerator / denominator))
+    if large_arc == sweep:
+        coefficient = -coefficient
+    
+    cxp = coefficient * rx * y1p / ry
+    cyp = -coefficient * ry * x1p / rx
+    cx = cos_phi * cxp - sin_phi * cyp + (p0[0] + p1[0]) / 2
+    cy = sin_phi * cxp + cos_phi * cyp + (p0[1] + p1[1]) / 2
+    
+    theta1 = math.atan2((y1p - cyp) / ry, (x1p - cxp) / rx)
+    theta2 = math.atan2((-y1p - cyp) / ry, (-x1p - cxp) / rx)
+    delta = theta2 - theta1
+    if sweep and delta < 0:
+        delta += 2 * math.pi
+    elif not sweep and delta > 0:
+        delta -= 2 * math.pi
+    
+    # Chord error of a step of angle a on radius r is r * (1 - cos(a / 2)), bounded by the larger radius
+    radius = max(rx, ry)
+    max_steps = 2 ** CURVE_FLATTEN_MAX_DEPTH
+    if tolerance >= radius:
+        steps = 1
+    elif tolerance <= 0:
+        steps = max_steps
+    else:
+        step_angle = 2 * math.acos(1 - tolerance / radius)
+        steps = min(max_steps, max(1, math.ceil(abs(delta) / step_angle)))
+    
+    for i in range(1, steps):
+        theta = theta1 + delta * i / steps
+        ex = rx * math.cos(theta)
+        ey = ry * math.sin(theta)
+        points.append((cx + ex * cos_phi - ey * sin_phi, cy + ex * sin_phi + ey * cos_phi))
+    
+    points.append(p1)
+
+def parse_path_data(path_data, tolerance=None):
+    """Flat [x, y, ...] outline of an SVG path in absolute coordinates
+    
+    Curves and arcs are flattened so the outline stays within tolerance (scene units, default
+    CURVE_TOLERANCE_PRODUCTION) of the true path once scaled by get_coordinate_scale_factor."""
+    
+    if tolerance is None:
+        tolerance = CURVE_TOLERANCE_PRODUCTION
+    
+    segments = list(iter_path_segments(path_data))
+    if not segments:
+        return []
+    
+    max_coord = max(abs(value) for segment in segments for value in segment[-1])
+    svg_tolerance = tolerance * get_coordinate_scale_factor(max_coord)
+    
+    coordinates = []
+    last = (0.0, 0.0)
+    subpath_start = 0
+    
+    for segment in segments:
+        kind = segment[0]
+        
+        if kind == 'Z':
+            # Closing back onto the first vertex would only add a zero-length edge
+            if last == segment[1] and len(coordinates) - subpath_start > 2:
+                del coordinates[-2:]
+            last = segment[1]
+            continue
+        
+        if kind == 'M':
+            subpath_start = len(coordinates)
+            coordinates.extend(segment[1])
+            last = segment[1]
+            continue
+        
+        if kind == 'L':
+            points = (segment[1],)
+        else:
+            points = []
+            if kind == 'C':
+                flatten_cubic(last, segment[1], segment[2], segment[3], svg_tolerance, points)
+            elif kind == 'Q':
+                flatten_quadratic(last, segment[1], segment[2], svg_tolerance, points)
+            else:
+                flatten_arc(last, *segment[1:], svg_tolerance, points)
+        
+        for point in points:
+            if point != last:
+                coordinates.extend(point)
+                last = point
+    
+    return coordinates
+
+def parse_polygon_points(points_data):
+    coordinates = []
+    numbers = SVG_NUMBER_RE.findall(points_data)
+    
+    for i in range(0, len(numbers)-1, 2):
+        if i+1 < len(numbers):
+            try:
+                x = float(numbers[i])
+                y = float(numbers[i+1])
+                coordinates.extend([x, y])
+            except ValueError:
+                continue
+    
+    return coordinates
+
+def get_outline_coordinates(elem, tag, tolerance=None):
+    """Coordinates of an element if it qualifies as the pattern outline, otherwise []"""
+    
+    if tag == 'polygon':
+        points_attr = elem.get('points')
+        elem_id = elem.get('id', '').lower()
+        if 'border' in elem_id or 'frame' in elem_id or 'viewbox' in elem_id:
+            return []
+        if points_attr:
+            poly_coords = parse_polygon_points(points_attr)
+            if poly_coords and len(poly_coords) >= 6: 
+                return poly_coords
+    
+    elif tag == 'polyline':
+        points_attr = elem.get('points')
+        if points_attr:
+            return parse_polygon_points(points_attr)
+    
+    elif tag == 'path':
+        d_attr = elem.get('d')
+        if d_attr:
+            return parse_path_data(d_attr, tolerance)
+    
+    elif tag == 'rect':
+        x = float(elem.get('x', 0))
+        y = float(elem.get('y', 0))
+        width = float(elem.get('width', 0))
+        height = float(elem.get('height', 0))
+        if width > 0 and height > 0:
+            return [
+                x, y,
+                x + width, y,
+                x + width, y + height,
+                x, y + height
+            ]
+    
+    elif tag == 'circle':
+        cx = float(elem.get('cx', 0))
+        cy = float(elem.get('cy', 0))
+        r = float(elem.get('r', 0))
+        if r > 0:
+            coordinates = []
+            for i in range(12):
+                angle = (i * 2 * math.pi) / 12
+                x = cx + r * math.cos(angle)
+                y = cy + r * math.sin(angle)
+                coordinates.extend([x, y])
+            return coordinates
+    
+    return []
+
+def extract_coordinates_from_svg_chunks(chunks, tolerance=None):
+    """First pattern outline in an SVG fed as text or byte chunks
+    
+    Elements are checked as their start tag arrives and dropped once they close, so the tree is
+    never held in memory and nothing after the outline is parsed. If no element qualifies, the
+    first polygon skipped as a border or as too short is used instead."""
+    
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    open_elements = []
+    fallback_coordinates = []
+    
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+            
+            for event, elem in parser.read_events():
+                if event == 'end':
+                    open_elements.pop()
+                    if open_elements:
+                        # Not necessarily the parent's newest child - one feed can leave later siblings
+                        # already built - but earlier siblings are gone, so remove() finds it first
+                        open_elements[-1].remove(elem)
+                    continue
+                
+                # The root <svg> element itself is never the outline
+                if open_elements:
+                    tag = elem.tag.rsplit('}', 1)[-1].lower()
+                    
+                    coordinates = get_outline_coordinates(elem, tag, tolerance)
+                    if coordinates:
+                        return coordinates
+                    
+                    if tag == 'polygon' and not fallback_coordinates:
+                        fallback_coordinates = parse_polygon_points(elem.get('points', ''))
+                
+                open_elements.append(elem)
+        
+        parser.close()
+        return fallback_coordinates
+        
+    except ET.ParseError as e:
+        return []
+    except Exception as e:
+        traceback.print_exc()
+        return []
+
+def extract_coordinates_from_svg(svg_content, tolerance=None):
+    if not svg_content:
+        return []
+    
+    chunks = (
+        svg_content[start:start + SVG_STREAM_CHUNK_SIZE]
+        for start in range(0, len(svg_content), SVG_STREAM_CHUNK_SIZE)
+    )
+    return extract_coordinates_from_svg_chunks(chunks, tolerance)
+
+def load_svg_from_file(file_path):
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception as e:
+        print(f"Error loading SVG file: {e}")
+        return None
+
+def get_coordinates_from_file(file_path, tolerance=None):
+    # Stream straight from disk - the whole file is never read into memory
+    try:
+        with open(file_path, 'rb') as f:
+            chunks = iter(lambda: f.read(SVG_STREAM_CHUNK_SIZE), b'')
+            return extract_coordinates_from_svg_chunks(chunks, tolerance)
+    except OSError as e:
+        print(f"Error loading SVG file: {e}")
+        return []
@@ -2,15 +2,54 @@ import bpy
 import urllib.request
 import ssl
 import re
+import os
+import sys
+import json
+import mmap
+import struct
+import hashlib
+import threading
+import time
 import math
-import bmesh
 import mathutils
-import xml.etree.ElementTree as ET
+import numpy as np
 import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from mathutils import Vector
 import requests
-from bpy.props import StringProperty, EnumProperty, IntProperty, BoolProperty
+from requests.adapters import HTTPAdapter
+from bpy.props import StringProperty, EnumProperty, IntProperty, BoolProperty, FloatProperty, CollectionProperty
 from bpy.types import Operator, Panel, PropertyGroup
+from bpy.app.handlers import persistent
+
+# fashionsynth_geometry sits next to this file - also find it when the script runs from Blender's text editor
+_addon_dir = os.path.dirname(os.path.realpath(__file__))
+if _addon_dir not in sys.path:
+    sys.path.append(_addon_dir)
+
+from fashionsynth_geometry import (
+    CURVE_TOLERANCE_PREVIEW,
+    CURVE_TOLERANCE_PRODUCTION,
+    extract_coordinates_from_svg,
+    get_coordinates_from_file,
+    orient_coordinates_for_part,
+    as_points_array,
+    pattern_vertices,
+    transform_points,
+    calculate_edge_curvature,
+    QUARTER_TURN_ROTATIONS,
+    quarter_turn_world_spans,
+    sleeve_horizontal_edges,
+    cuff_horizontal_edges,
+    edge_geometry,
+    edge_midpoint_z,
+    angles_from_axis,
+    ContourIndex,
+    CONTOUR_CORNER_TURN,
+    order_segments,
+    resample_segments,
+)
 
 # Don't auto-clear when loaded as addon
 # bpy.ops.object.select_all(action='SELECT')
@@ -18,6 +57,79 @@ from bpy.types import Operator, Panel, PropertyGroup
 
 INFURA_GATEWAY = "https://thedial.infura-ipfs.io/ipfs/"
 
+# Gateways tried for every CID, fastest first by rolling latency score
+IPFS_GATEWAYS = [
+    INFURA_GATEWAY,
+    "https://ipfs.io/ipfs/",
+    "https://dweb.link/ipfs/",
+    "https://gateway.pinata.cloud/ipfs/",
+]
+
+# A gateway slower than this percentile of its own recent latencies gets a hedged request to the next one
+GATEWAY_HEDGE_PERCENTILE = 90
+GATEWAY_HEDGE_DEFAULT_DELAY = 2.0  # Seconds, used until a gateway has latency history
+GATEWAY_HEDGE_MIN_DELAY = 0.25
+GATEWAY_LATENCY_WINDOW = 20
+
+# On-disk cache of downloaded pattern SVGs, keyed by IPFS CID (content never changes for a CID)
+SVG_CACHE_MAX_BYTES = 64 * 1024 * 1024
+SVG_CACHE_STATS = {"hits": 0, "misses": 0, "evictions": 0, "corrupt": 0}
+_svg_cache_lock = threading.Lock()
+_svg_cache_dir = None
+
+# Upper bound on concurrent pattern downloads per garment load
+MAX_DOWNLOAD_WORKERS = 8
+# Gateway requests in flight at once - each download plus the hedges racing it
+MAX_GATEWAY_REQUESTS = MAX_DOWNLOAD_WORKERS * 2
+# How often a waiting download checks whether the load was cancelled, in seconds
+DOWNLOAD_CANCEL_POLL_INTERVAL = 0.1
+
+# Shared keep-alive HTTP session used by every gateway download
+HTTP_CONNECT_TIMEOUT = 5
+HTTP_READ_TIMEOUT = 30
+# As many sockets per host as requests in flight, so a hedge never queues behind the pool
+HTTP_MAX_CONNECTIONS_PER_HOST = MAX_GATEWAY_REQUESTS
+HTTP_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+_http_session = None
+_http_session_lock = threading.Lock()
+_insecure_ssl_context = None
+_gateway_executor = None
+
+# Offline bundle of every default garment: SVGs plus parsed, oriented coordinates, memory-mapped at startup
+PATTERN_BUNDLE_FILENAME = "fashionsynth_patterns.bundle"
+PATTERN_BUNDLE_MAGIC = b"FSPATTRN"
+PATTERN_BUNDLE_FORMAT_VERSION = 2
+# Bump whenever fashionsynth_geometry's parse or orientation output changes so stale bundles fall back to their SVGs
+PATTERN_PARSER_VERSION = 5
+
+_pattern_bundle = None
+
+# World-space vertex/edge arrays per piece, keyed by object pointer and checked against its transform and mesh
+_world_geometry_cache = {}
+
+# ID property holding a piece's ContourIndex, written when the piece is created
+CONTOUR_PROPERTY = "fashionsynth_contour"
+# ID property naming the seam (a SEAM_SETUP_STEPS key) that added a spring or debug object
+SEAM_PROPERTY = "fashionsynth_seam"
+# Objects seam setup adds, never pattern pieces - also covers files built before SEAM_PROPERTY
+SEAM_OBJECT_PREFIXES = ("SewingSpring", "DebugStitch")
+
+# Spring density of each seam until the user changes it: (mode, count, springs per metre, fewest
+# springs in PER_METRE mode)
+SEAM_SPRING_DEFAULTS = {
+    "hood_center": ('COUNT', 5, 20.0, 3),
+    "sleeve_cuff": ('COUNT', 5, 20.0, 3),
+    "panel_side": ('PER_METRE', 10, 20.0, 3),
+    "waist_band": ('COUNT', 10, 20.0, 3),
+    "pocket": ('PER_METRE', 3, 20.0, 3),
+    "neck_binding": ('PER_METRE', 5, 20.0, 5),
+    "shoulder": ('PER_METRE', 3, 20.0, 3),
+    "sleeve": ('COUNT', 10, 20.0, 3),
+    "sleeve_cuff_closing": ('COUNT', 10, 20.0, 3),
+    "hood_to_panel": ('COUNT', 6, 20.0, 3),
+    "sleeve_to_panel": ('COUNT', 8, 20.0, 3),
+}
+
 HOODIE_DEFAULTS = {
     "front_panel": {
         "ipfs": "QmWwRYcuyNeXzNFbFHn6NomxerQJH7gpdv337uNkygvS3u",
@@ -90,264 +202,772 @@ TSHIRT_DEFAULTS = {
     }
 }
 
+GARMENT_DEFAULTS = {
+    "hoodie": HOODIE_DEFAULTS,
+    "tshirt": TSHIRT_DEFAULTS,
+}
+
 def get_garment_defaults(garment_type):
-    garment_map = {
-        "hoodie": HOODIE_DEFAULTS,
-        "tshirt": TSHIRT_DEFAULTS,
-    }
-    return garment_map.get(garment_type, {})
+    return GARMENT_DEFAULTS.get(garment_type, {})
 
-def ipfs_to_gateway_url(ipfs_hash):
+def normalize_ipfs_hash(ipfs_hash):
     if ipfs_hash.startswith("ipfs://"):
-        hash_only = ipfs_hash.replace("ipfs://", "")
-    else:
-        hash_only = ipfs_hash
-    return f"{INFURA_GATEWAY}{hash_only}"
+        return ipfs_hash.replace("ipfs://", "")
+    return ipfs_hash
 
-def download_svg_from_url(url):
-    try:
-        response = requests.get(url, verify=False, timeout=30)
-        content = response.text
-        return content
-    except ImportError:
-        print("Requests not available, using urllib")
-    except Exception as e:
-        print(f"Requests failed: {e}")
+def ipfs_to_gateway_url(ipfs_hash, gateway=None):
+    hash_only = normalize_ipfs_hash(ipfs_hash)
+    if gateway is None:
+        gateway = GATEWAY_LATENCY.ranked(IPFS_GATEWAYS)[0] if IPFS_GATEWAYS else INFURA_GATEWAY
+    return f"{gateway}{hash_only}"
+
+class GatewayLatencyTracker:
+    """Rolling per-gateway download latencies, used to rank gateways and time hedged requests"""
     
-    try:
+    def __init__(self, window=GATEWAY_LATENCY_WINDOW):
+        self.window = window
+        self._samples = {}
+        self._lock = threading.Lock()
+    
+    def record(self, gateway, seconds):
+        with self._lock:
+            if gateway not in self._samples:
+                self._samples[gateway] = deque(maxlen=self.window)
+            self._samples[gateway].append(seconds)
+    
+    def record_failure(self, gateway):
+        # A failed or invalid response counts as a full read timeout
+        self.record(gateway, HTTP_CONNECT_TIMEOUT + HTTP_READ_TIMEOUT)
+    
+    def percentile(self, gateway, percent):
+        with self._lock:
+            samples = sorted(self._samples.get(gateway, ()))
+        
+        if not samples:
+            return None
+        
+        rank = max(0, min(len(samples) - 1, math.ceil(percent / 100 * len(samples)) - 1))
+        return samples[rank]
+    
+    def score(self, gateway):
+        """Median recent latency in seconds, lower is better - unknown gateways sit at the default hedge delay"""
+        median = self.percentile(gateway, 50)
+        return GATEWAY_HEDGE_DEFAULT_DELAY if median is None else median
+    
+    def ranked(self, gateways):
+        # sorted() is stable, so ties keep the configured order
+        return sorted(gateways, key=self.score)
+    
+    def hedge_delay(self, gateway):
+        tail = self.percentile(gateway, GATEWAY_HEDGE_PERCENTILE)
+        if tail is None:
+            return GATEWAY_HEDGE_DEFAULT_DELAY
+        return max(GATEWAY_HEDGE_MIN_DELAY, tail)
+
+GATEWAY_LATENCY = GatewayLatencyTracker()
+
+def apply_network_settings(props):
+    """Hand the panel's gateway list and timeouts to the download code - call before a fetch starts"""
+    
+    set_ipfs_gateways(props.ipfs_gateways)
+    configure_http_session(props.http_connect_timeout, props.http_read_timeout)
+
+def set_ipfs_gateways(gateways_text):
+    """Replace the gateway list from a comma or whitespace separated string of URLs"""
+    
+    gateways = []
+    for gateway in re.split(r'[,\s]+', gateways_text or ""):
+        if not gateway.startswith(("https://", "http://")):
+            continue
+        if not gateway.endswith("/"):
+            gateway += "/"
+        if gateway not in gateways:
+            gateways.append(gateway)
+    
+    if gateways:
+        IPFS_GATEWAYS[:] = gateways
+
+def get_svg_cache_dir():
+    """Directory holding cached pattern SVGs (user config dir, overridable with FASHIONSYNTH_CACHE_DIR)"""
+    global _svg_cache_dir
+    
+    if _svg_cache_dir is None:
+        cache_dir = os.environ.get("FASHIONSYNTH_CACHE_DIR")
+        if not cache_dir:
+            cache_dir = bpy.utils.user_resource('CONFIG', path=os.path.join("fashionsynth", "svg_cache"), create=True)
+        os.makedirs(cache_dir, exist_ok=True)
+        _svg_cache_dir = cache_dir
+    
+    return _svg_cache_dir
+
+def get_svg_cache_path(ipfs_hash):
+    hash_only = normalize_ipfs_hash(ipfs_hash)
+    
+    # CIDs are plain base58/base32 - anything else never touches the filesystem
+    if not re.fullmatch(r'[A-Za-z0-9]+', hash_only):
+        return None
+    
+    return os.path.join(get_svg_cache_dir(), f"{hash_only}.svg")
+
+def read_svg_cache(ipfs_hash):
+    """Return cached SVG text for a CID, or None on a miss or a corrupt entry"""
+    
+    path = get_svg_cache_path(ipfs_hash)
+    if not path:
+        return None
+    
+    with _svg_cache_lock:
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            SVG_CACHE_STATS["misses"] += 1
+            return None
+        
+        # Entry layout: sha256 hex digest of the SVG bytes, newline, SVG bytes
+        digest, _, svg_bytes = data.partition(b"\n")
+        if digest.decode('ascii', 'replace') != hashlib.sha256(svg_bytes).hexdigest():
+            SVG_CACHE_STATS["corrupt"] += 1
+            SVG_CACHE_STATS["misses"] += 1
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        
+        # Touch the entry so eviction is least-recently-used
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        
+        SVG_CACHE_STATS["hits"] += 1
+    
+    return svg_bytes.decode('utf-8')
+
+def write_svg_cache(ipfs_hash, svg_content):
+    """Store SVG text for a CID and evict the oldest entries beyond SVG_CACHE_MAX_BYTES"""
+    
+    path = get_svg_cache_path(ipfs_hash)
+    if not path or not svg_content:
+        return
+    
+    svg_bytes = svg_content.encode('utf-8')
+    data = hashlib.sha256(svg_bytes).hexdigest().encode('ascii') + b"\n" + svg_bytes
+    
+    with _svg_cache_lock:
+        # Write to a temp file first so a crash never leaves a truncated entry behind
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Could not write SVG cache entry: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        
+        evict_svg_cache(SVG_CACHE_MAX_BYTES)
+
+def evict_svg_cache(max_bytes):
+    """Delete least-recently-used cache entries until the cache fits in max_bytes"""
+    
+    cache_dir = get_svg_cache_dir()
+    entries = []
+    for name in os.listdir(cache_dir):
+        if not name.endswith(".svg"):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    
+    total_bytes = sum(entry[1] for entry in entries)
+    entries.sort()
+    
+    for mtime, size, path in entries:
+        if total_bytes <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total_bytes -= size
+        SVG_CACHE_STATS["evictions"] += 1
+
+def get_svg_cache_stats():
+    with _svg_cache_lock:
+        return dict(SVG_CACHE_STATS)
+
+def clear_svg_cache():
+    with _svg_cache_lock:
+        evict_svg_cache(0)
+
+def get_http_session():
+    """Module-wide pooled session: connections to a gateway are kept alive and reused across parts and loads"""
+    global _http_session
+    
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            # pool_block keeps at most HTTP_MAX_CONNECTIONS_PER_HOST sockets open to any one host
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_MAX_CONNECTIONS_PER_HOST, pool_block=True)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.verify = False
+            session.headers['User-Agent'] = HTTP_USER_AGENT
+            _http_session = session
+        
+        return _http_session
+
+def configure_http_session(connect_timeout=None, read_timeout=None):
+    """Change the gateway connect and read timeouts (seconds) used by every later request"""
+    global HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT
+    
+    if connect_timeout is not None:
+        HTTP_CONNECT_TIMEOUT = connect_timeout
+    if read_timeout is not None:
+        HTTP_READ_TIMEOUT = read_timeout
+
+def get_insecure_ssl_context():
+    global _insecure_ssl_context
+    
+    if _insecure_ssl_context is None:
         ssl_context = ssl.create_default_context()
         ssl_context.check_hostname = False
         ssl_context.verify_mode = ssl.CERT_NONE
+        _insecure_ssl_context = ssl_context
+    
+    return _insecure_ssl_context
+
+def get_gateway_executor():
+    global _gateway_executor
+    
+    with _http_session_lock:
+        if _gateway_executor is None:
+            # Losing hedged requests finish in the background, so this pool outlives any one load
+            _gateway_executor = ThreadPoolExecutor(max_workers=MAX_GATEWAY_REQUESTS, thread_name_prefix="fashionsynth-gateway")
+        return _gateway_executor
+
+def download_svg_from_gateway(gateway, hash_only):
+    """Fetch one CID from one gateway, recording its latency - returns None unless the response is an SVG"""
+    
+    start = time.perf_counter()
+    try:
+        response = get_http_session().get(f"{gateway}{hash_only}", timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT))
+        content = response.text
+    except Exception as e:
+        print(f"Gateway {gateway} failed: {e}")
+        GATEWAY_LATENCY.record_failure(gateway)
+        return None
+    
+    if response.status_code != 200 or not re.search(r'<svg', content, re.IGNORECASE):
+        GATEWAY_LATENCY.record_failure(gateway)
+        return None
+    
+    GATEWAY_LATENCY.record(gateway, time.perf_counter() - start)
+    return content
+
+def download_svg_hedged(ipfs_hash, cancel_event=None):
+    """Fetch a CID from the fastest gateway, hedging to the next ones whenever the current wait passes its tail latency
+    
+    Returns None as soon as cancel_event is set - requests already sent finish in the background."""
+    
+    hash_only = normalize_ipfs_hash(ipfs_hash)
+    remaining = GATEWAY_LATENCY.ranked(IPFS_GATEWAYS)
+    if not remaining:
+        return None
+    
+    executor = get_gateway_executor()
+    pending = {}
+    
+    def launch_next():
+        gateway = remaining.pop(0)
+        pending[executor.submit(download_svg_from_gateway, gateway, hash_only)] = gateway
+        return time.perf_counter() + GATEWAY_LATENCY.hedge_delay(gateway)
+    
+    hedge_at = launch_next()
+    
+    while pending:
+        if cancel_event is not None and cancel_event.is_set():
+            return None
         
+        timeout = max(0.0, hedge_at - time.perf_counter()) if remaining else None
+        if cancel_event is not None:
+            timeout = DOWNLOAD_CANCEL_POLL_INTERVAL if timeout is None else min(timeout, DOWNLOAD_CANCEL_POLL_INTERVAL)
+        done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        
+        if not done:
+            # Slow past its percentile threshold - race the next gateway against it
+            if remaining and time.perf_counter() >= hedge_at:
+                hedge_at = launch_next()
+            continue
+        
+        for future in done:
+            pending.pop(future)
+            content = future.result()
+            if content:
+                return content
+        
+        # A request failed - hand its slot to the next gateway without waiting out a hedge delay
+        if remaining:
+            hedge_at = launch_next()
+    
+    return None
+
+def download_svg_from_url(url):
+    """Last resort once every gateway failed through the pooled session - one plain urllib request"""
+    
+    try:
         req = urllib.request.Request(
             url,
             headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+                'User-Agent': HTTP_USER_AGENT
             }
         )
-        with urllib.request.urlopen(req, timeout=30, context=ssl_context) as response:
+        with urllib.request.urlopen(req, timeout=HTTP_READ_TIMEOUT, context=get_insecure_ssl_context()) as response:
             content = response.read()
             decoded = content.decode('utf-8')
             return decoded
     except Exception as e:
         traceback.print_exc()
 
-def parse_path_data(path_data):
-    coordinates = []
-    commands = re.split(r'[MLCZHVSQTAmlczhvsqta]', path_data)
+def get_coordinates_from_ipfs(ipfs_hash, gateway_url, tolerance=None, cancel_event=None):
+    svg_content = read_svg_cache(ipfs_hash)
+    if svg_content is not None:
+        coordinates = extract_coordinates_from_svg(svg_content, tolerance)
+        if coordinates:
+            return coordinates
+    
+    bundle = get_pattern_bundle()
+    svg_content = bundle.svg(ipfs_hash) if bundle else None
+    if svg_content is not None:
+        coordinates = extract_coordinates_from_svg(svg_content, tolerance)
+        if coordinates:
+            return coordinates
+    
+    svg_content = download_svg_hedged(ipfs_hash, cancel_event)
+    if cancel_event is not None and cancel_event.is_set():
+        return []
+    if not svg_content:
+        # Every gateway failed through the pooled session - last try via urllib
+        svg_content = download_svg_from_url(gateway_url)
     
-    for command in commands:
-        if command.strip():
-            numbers = re.findall(r'-?\d+\.?\d*', command)
-            
-            for i in range(0, len(numbers)-1, 2):
-                if i+1 < len(numbers):
-                    try:
-                        x = float(numbers[i])
-                        y = float(numbers[i+1])
-                        coordinates.extend([x, y])
-                    except ValueError:
-                        continue
-    
-    return coordinates
-
-def parse_polygon_points(points_data):
-    coordinates = []
-    numbers = re.findall(r'-?\d+\.?\d*', points_data)
-    
-    for i in range(0, len(numbers)-1, 2):
-        if i+1 < len(numbers):
+    if svg_content:
+        coordinates = extract_coordinates_from_svg(svg_content, tolerance)
+        # Only cache content that produced a pattern - never a gateway error page
+        if coordinates:
+            write_svg_cache(ipfs_hash, svg_content)
+        return coordinates
+    else:
+        return []
+
+def fetch_garment_coordinates(defaults, progress=None, cancel_event=None, tolerance=None):
+    """Download and parse every part of a garment concurrently, returns {part_name: coordinates}
+    
+    progress is an optional [done, total] list updated as parts arrive, cancel_event an optional
+    threading.Event that stops the downloads still waiting on a gateway and returns {}."""
+    
+    part_hashes = {}
+    for part_name, part_info in defaults.items():
+        ipfs_hash = part_info.get("ipfs", "")
+        if ipfs_hash:
+            part_hashes[part_name] = ipfs_hash
+    
+    if not part_hashes:
+        return {}
+    
+    # Parts sharing a CID are fetched once
+    unique_hashes = list(dict.fromkeys(part_hashes.values()))
+    coordinates_by_hash = {}
+    if progress is not None:
+        progress[:] = [0, len(unique_hashes)]
+    
+    # Resolve the cache dir here: worker threads only do network I/O and parsing, no bpy access
+    get_svg_cache_dir()
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(unique_hashes))) as executor:
+        futures = {
+            executor.submit(get_coordinates_from_ipfs, ipfs_hash, ipfs_to_gateway_url(ipfs_hash), tolerance, cancel_event): ipfs_hash
+            for ipfs_hash in unique_hashes
+        }
+        
+        for future in as_completed(futures):
+            ipfs_hash = futures[future]
             try:
-                x = float(numbers[i])
-                y = float(numbers[i+1])
-                coordinates.extend([x, y])
-            except ValueError:
-                continue
+                coordinates_by_hash[ipfs_hash] = future.result()
+            except Exception:
+                traceback.print_exc()
+                coordinates_by_hash[ipfs_hash] = []
+            
+            if progress is not None:
+                progress[0] += 1
+            
+            if cancel_event is not None and cancel_event.is_set():
+                for pending in futures:
+                    pending.cancel()
+                return {}
     
-    return coordinates
+    return {part_name: coordinates_by_hash.get(ipfs_hash, []) for part_name, ipfs_hash in part_hashes.items()}
 
-def extract_coordinates_from_svg(svg_content):
-    if not svg_content:
-        return []
+def load_custom_coordinates(part_files, progress=None, cancel_event=None, tolerance=None):
+    """Parse and orient custom SVG files, returns {part_name: N×2 points array} - safe to run off the main thread"""
     
-    try:
-        root = ET.fromstring(svg_content)
-        coordinates = []
-        
-        namespaces = {
-            'svg': 'http://www.w3.org/2000/svg',
-            'xlink': 'http://www.w3.org/1999/xlink'
-        }
+    coordinates_by_part = {}
+    if progress is not None:
+        progress[:] = [0, len(part_files)]
+    
+    for part_name, file_path in part_files.items():
+        if cancel_event is not None and cancel_event.is_set():
+            return {}
         
-        all_elements = root.findall('.//*')
+        coordinates_by_part[part_name] = orient_coordinates_for_part(get_coordinates_from_file(file_path, tolerance), part_name)
         
-        for elem in all_elements:
-            tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-            
-            if tag.lower() == 'polygon':
-                points_attr = elem.get('points')
-                elem_id = elem.get('id', '').lower()
-                elem_class = elem.get('class', '').lower()
-                if 'border' in elem_id or 'frame' in elem_id or 'viewbox' in elem_id:
-                    continue
-                if points_attr:
-                    poly_coords = parse_polygon_points(points_attr)
-                    if poly_coords and len(poly_coords) >= 6: 
-                        coordinates.extend(poly_coords)
-                        break 
-            
-            elif tag.lower() == 'polyline':
-                points_attr = elem.get('points')
-                if points_attr:
-                    poly_coords = parse_polygon_points(points_attr)
-                    if poly_coords:
-                        coordinates.extend(poly_coords)
-                        break
-            
-            elif tag.lower() == 'path':
-                d_attr = elem.get('d')
-                if d_attr:
-                    path_coords = parse_path_data(d_attr)
-                    if path_coords:
-                        coordinates.extend(path_coords)
-                        break
+        if progress is not None:
+            progress[0] += 1
+    
+    return coordinates_by_part
+
+def load_default_coordinates(garment_type, defaults, progress=None, cancel_event=None, tolerance=None):
+    """{part_name: oriented N×2 points array} for a default garment - read from the offline bundle
+    where it has the part, otherwise downloaded, parsed and oriented. Safe to run off the main thread"""
+    
+    bundle = get_pattern_bundle()
+    coordinates_by_part = {}
+    missing_parts = {}
+    
+    for part_name, part_info in defaults.items():
+        coordinates = bundle.coordinates(garment_type, part_name, part_info.get("ipfs", ""), tolerance) if bundle else None
+        if coordinates is not None:
+            coordinates_by_part[part_name] = coordinates
+        else:
+            missing_parts[part_name] = part_info
+    
+    if not missing_parts:
+        if progress is not None:
+            progress[:] = [1, 1]
+        return coordinates_by_part
+    
+    fetched = fetch_garment_coordinates(missing_parts, progress, cancel_event, tolerance)
+    if cancel_event is not None and cancel_event.is_set():
+        return {}
+    
+    for part_name, coordinates in fetched.items():
+        coordinates_by_part[part_name] = orient_coordinates_for_part(coordinates, part_name)
+    
+    return coordinates_by_part
+
+class PatternBundle:
+    """Read-only view of a memory-mapped pattern bundle
+    
+    Layout: magic, little-endian uint32 header size, JSON header, zero padding to 8 bytes, then the
+    data section - float64 coordinate runs followed by SVG bytes, at the offsets the header lists."""
+    
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            self._file.close()
+            raise
+        
+        try:
+            magic_size = len(PATTERN_BUNDLE_MAGIC)
+            if self._mmap[:magic_size] != PATTERN_BUNDLE_MAGIC:
+                raise ValueError("not a FashionSynth pattern bundle")
             
-            elif tag.lower() == 'rect':
-                x = float(elem.get('x', 0))
-                y = float(elem.get('y', 0))
-                width = float(elem.get('width', 0))
-                height = float(elem.get('height', 0))
-                if width > 0 and height > 0:
-                    coordinates = [
-                        x, y,
-                        x + width, y,
-                        x + width, y + height,
-                        x, y + height
-                    ]
-                    break
+            (header_size,) = struct.unpack_from("<I", self._mmap, magic_size)
+            header_start = magic_size + 4
+            self.header = json.loads(self._mmap[header_start:header_start + header_size].decode('utf-8'))
             
-            elif tag.lower() == 'circle':
-                cx = float(elem.get('cx', 0))
-                cy = float(elem.get('cy', 0))
-                r = float(elem.get('r', 0))
-                if r > 0:
-                    for i in range(12):
-                        angle = (i * 2 * math.pi) / 12
-                        x = cx + r * math.cos(angle)
-                        y = cy + r * math.sin(angle)
-                        coordinates.extend([x, y])
-                    break
-        
-        if not coordinates:
-            for prefix in ['', 'svg:', '{http://www.w3.org/2000/svg}']:
-                for shape in ['polygon', 'polyline', 'path', 'rect', 'circle']:
-                    elements = root.findall(f'.//{prefix}{shape}')
-                    if elements:
-                        for elem in elements:
-                            if shape in ['polygon', 'polyline']:
-                                points = elem.get('points')
-                                if points:
-                                    coords = parse_polygon_points(points)
-                                    if coords:
-                                        coordinates = coords
-                                        break
-                            elif shape == 'path':
-                                d = elem.get('d')
-                                if d:
-                                    coords = parse_path_data(d)
-                                    if coords:
-                                        coordinates = coords
-                                        break
-                    if coordinates:
-                        break
-                if coordinates:
-                    break
+            if self.header.get("format") != PATTERN_BUNDLE_FORMAT_VERSION:
+                raise ValueError(f"unsupported bundle format {self.header.get('format')}")
+        except Exception:
+            self.close()
+            raise
+        
+        self.data_offset = (header_start + header_size + 7) // 8 * 8
+        # Coordinates from another parser version are ignored, the bundled SVGs are still used
+        self.coordinates_current = (
+            self.header.get("parser_version") == PATTERN_PARSER_VERSION
+            and self.header.get("byteorder") == sys.byteorder
+        )
+    
+    def coordinates(self, garment_type, part_name, ipfs_hash, tolerance=None):
+        """Oriented coordinates for a part flattened at tolerance, or None if the bundle has no
+        current entry for this CID and tolerance"""
         
-        return coordinates
+        if not self.coordinates_current:
+            return None
         
-    except ET.ParseError as e:
-        return []
-    except Exception as e:
-        traceback.print_exc()
-        return []
+        entry = self.header["parts"].get(f"{garment_type}/{part_name}")
+        if not entry or entry["ipfs"] != normalize_ipfs_hash(ipfs_hash):
+            return None
+        
+        entry = entry["coordinates"].get(get_curve_tolerance_key(tolerance))
+        if not entry:
+            return None
+        
+        # Copied out of the mapping so the bundle can be closed or rebuilt while arrays are alive
+        coords = np.frombuffer(self._mmap, dtype=np.float64, count=entry["count"], offset=self.data_offset + entry["offset"])
+        return coords.reshape(-1, 2).copy()
+    
+    def svg(self, ipfs_hash):
+        """Bundled SVG text for a CID, or None if it is missing or fails its checksum"""
+        
+        entry = self.header["svgs"].get(normalize_ipfs_hash(ipfs_hash))
+        if not entry:
+            return None
+        
+        start = self.data_offset + entry["offset"]
+        svg_bytes = self._mmap[start:start + entry["size"]]
+        if hashlib.sha256(svg_bytes).hexdigest() != entry["sha256"]:
+            return None
+        
+        return svg_bytes.decode('utf-8')
+    
+    def close(self):
+        self._mmap.close()
+        self._file.close()
 
-def get_coordinates_from_ipfs(ipfs_hash, gateway_url):
-    svg_content = download_svg_from_url(gateway_url)
+def get_pattern_bundle_path():
+    """Bundle location: FASHIONSYNTH_PATTERN_BUNDLE, else next to the addon, else the user config dir"""
     
-    if svg_content:
-        coordinates = extract_coordinates_from_svg(svg_content)
-        return coordinates
-    else:
-        return []
+    env_path = os.environ.get("FASHIONSYNTH_PATTERN_BUNDLE")
+    if env_path:
+        return env_path
+    
+    addon_dir = os.path.dirname(os.path.realpath(__file__))
+    addon_path = os.path.join(addon_dir, PATTERN_BUNDLE_FILENAME)
+    if os.path.isfile(addon_path) or (os.path.isdir(addon_dir) and os.access(addon_dir, os.W_OK)):
+        return addon_path
+    
+    config_dir = bpy.utils.user_resource('CONFIG', path="fashionsynth", create=True)
+    return os.path.join(config_dir, PATTERN_BUNDLE_FILENAME)
 
-def load_svg_from_file(file_path):
+def load_pattern_bundle(path=None):
+    """Memory-map the offline pattern bundle, returns it or None when there is no usable bundle"""
+    global _pattern_bundle
+    
+    close_pattern_bundle()
+    
+    path = path or get_pattern_bundle_path()
+    if not os.path.isfile(path):
+        return None
+    
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
-    except Exception as e:
-        print(f"Error loading SVG file: {e}")
+        _pattern_bundle = PatternBundle(path)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Ignoring pattern bundle {path}: {e}")
         return None
+    
+    return _pattern_bundle
+
+def get_pattern_bundle():
+    return _pattern_bundle
 
-def get_coordinates_from_file(file_path):
-    svg_content = load_svg_from_file(file_path)
+def close_pattern_bundle():
+    global _pattern_bundle
     
-    if svg_content:
-        coordinates = extract_coordinates_from_svg(svg_content)
-        return coordinates
-    else:
-        return []
+    if _pattern_bundle is not None:
+        _pattern_bundle.close()
+        _pattern_bundle = None
+
+def get_curve_tolerance_key(tolerance=None):
+    """Bundle key for a flattening tolerance - float32 property values round to the same key"""
+    
+    if tolerance is None:
+        tolerance = CURVE_TOLERANCE_PRODUCTION
+    return f"{tolerance:.6g}"
+
+def build_pattern_bundle(path=None, garment_types=None, tolerances=None, progress=None, cancel_event=None):
+    """Download, parse and orient every default garment into an offline bundle, returns its path
+    
+    Coordinates are stored once per flattening tolerance, preview and production by default. progress
+    and cancel_event work as for fetch_garment_coordinates - a cancelled build writes nothing and
+    returns None."""
+    
+    path = path or get_pattern_bundle_path()
+    garment_types = garment_types or list(GARMENT_DEFAULTS)
+    tolerances = tolerances or (CURVE_TOLERANCE_PREVIEW, CURVE_TOLERANCE_PRODUCTION)
+    
+    svg_by_hash = {}
+    parts = {}
+    coords_block = bytearray()
+    if progress is not None:
+        progress[:] = [0, sum(len(get_garment_defaults(garment_type)) for garment_type in garment_types)]
+    
+    for garment_type in garment_types:
+        for part_name, part_info in get_garment_defaults(garment_type).items():
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            if progress is not None:
+                progress[0] += 1
+            
+            ipfs_hash = normalize_ipfs_hash(part_info.get("ipfs", ""))
+            if not ipfs_hash:
+                continue
+            
+            if ipfs_hash not in svg_by_hash:
+                svg_content = read_svg_cache(ipfs_hash)
+                if svg_content is None and _pattern_bundle is not None:
+                    svg_content = _pattern_bundle.svg(ipfs_hash)
+                if svg_content is None:
+                    svg_content = download_svg_hedged(ipfs_hash, cancel_event)
+                    if cancel_event is not None and cancel_event.is_set():
+                        return None
+                    svg_content = svg_content or download_svg_from_url(ipfs_to_gateway_url(ipfs_hash))
+                if not svg_content:
+                    raise RuntimeError(f"Could not download {garment_type} {part_name} ({ipfs_hash})")
+                svg_by_hash[ipfs_hash] = svg_content
+            
+            runs = {}
+            for tolerance in tolerances:
+                coordinates = orient_coordinates_for_part(
+                    extract_coordinates_from_svg(svg_by_hash[ipfs_hash], tolerance),
+                    part_name
+                )
+                if len(coordinates) == 0:
+                    raise RuntimeError(f"No pattern coordinates in {garment_type} {part_name} ({ipfs_hash})")
+                
+                packed = np.ascontiguousarray(coordinates, dtype=np.float64)
+                runs[get_curve_tolerance_key(tolerance)] = {
+                    "offset": len(coords_block),
+                    "count": packed.size,
+                }
+                coords_block += packed.tobytes()
+            
+            parts[f"{garment_type}/{part_name}"] = {
+                "ipfs": ipfs_hash,
+                "coordinates": runs,
+            }
+    
+    svgs = {}
+    svg_block = bytearray()
+    for ipfs_hash, svg_content in svg_by_hash.items():
+        svg_bytes = svg_content.encode('utf-8')
+        svgs[ipfs_hash] = {
+            "offset": len(coords_block) + len(svg_block),
+            "size": len(svg_bytes),
+            "sha256": hashlib.sha256(svg_bytes).hexdigest(),
+        }
+        svg_block += svg_bytes
+    
+    header_bytes = json.dumps({
+        "format": PATTERN_BUNDLE_FORMAT_VERSION,
+        "parser_version": PATTERN_PARSER_VERSION,
+        "byteorder": sys.byteorder,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "parts": parts,
+        "svgs": svgs,
+    }).encode('utf-8')
+    prefix_size = len(PATTERN_BUNDLE_MAGIC) + 4 + len(header_bytes)
+    padding = b"\0" * ((prefix_size + 7) // 8 * 8 - prefix_size)
+    
+    # A mapped file can't be replaced on Windows, so unmap the live bundle first
+    reload_after = _pattern_bundle is None or os.path.abspath(_pattern_bundle.path) == os.path.abspath(path)
+    if reload_after:
+        close_pattern_bundle()
+    
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(PATTERN_BUNDLE_MAGIC)
+            f.write(struct.pack("<I", len(header_bytes)))
+            f.write(header_bytes)
+            f.write(padding)
+            f.write(coords_block)
+            f.write(svg_block)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    finally:
+        if reload_after:
+            load_pattern_bundle(path)
+    
+    return path
+
+def build_outline_mesh(mesh, verts):
+    """Fill an empty mesh with one n-gon over an N×3 outline, written straight from flat buffers"""
+    
+    count = len(verts)
+    indices = np.arange(count, dtype=np.int32)
+    
+    mesh.vertices.add(count)
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(verts, dtype=np.float32).ravel())
+    mesh.edges.add(count)
+    mesh.edges.foreach_set("vertices", np.column_stack((indices, np.roll(indices, -1))).ravel())
+    mesh.loops.add(count)
+    mesh.loops.foreach_set("vertex_index", indices)
+    mesh.polygons.add(1)
+    mesh.polygons.foreach_set("loop_start", np.zeros(1, dtype=np.int32))
+    # Blender 4 derives loop_total from the next polygon's loop_start
+    if bpy.app.version < (4, 0, 0):
+        mesh.polygons.foreach_set("loop_total", np.array([count], dtype=np.int32))
+    
+    # Same as from_pydata: links every loop to its edge
+    mesh.update(calc_edges=True)
+
+def build_outline_mesh_from_pydata(mesh, verts):
+    """The from_pydata equivalent of build_outline_mesh, kept as the benchmark reference"""
+    
+    vertex_list = [Vector(v) for v in verts.tolist()]
+    edges = [[i, (i + 1) % len(vertex_list)] for i in range(len(vertex_list))]
+    mesh.from_pydata(vertex_list, edges, [list(range(len(vertex_list)))])
+    mesh.update()
+
+def benchmark_outline_mesh_build(sizes=(1000, 10000, 50000, 200000), repeats=3):
+    """Time build_outline_mesh against from_pydata on wavy circular outlines, prints one row per size"""
+    
+    for size in sizes:
+        angles = np.linspace(0.0, 2 * math.pi, size, endpoint=False)
+        radius = 1.0 + 0.05 * np.sin(angles * 40)
+        verts = np.column_stack((radius * np.cos(angles), np.zeros(size), radius * np.sin(angles)))
+        
+        timings = {}
+        for label, build in (("foreach_set", build_outline_mesh), ("from_pydata", build_outline_mesh_from_pydata)):
+            best = float('inf')
+            for _ in range(repeats):
+                mesh = bpy.data.meshes.new(name=f"fashionsynth_benchmark_{label}")
+                start = time.perf_counter()
+                build(mesh, verts)
+                best = min(best, time.perf_counter() - start)
+                counts = (len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons))
+                bpy.data.meshes.remove(mesh)
+            timings[label] = best
+        
+        print(f"{size:>7} verts: foreach_set {timings['foreach_set'] * 1000:8.1f} ms | "
+              f"from_pydata {timings['from_pydata'] * 1000:8.1f} ms | "
+              f"{timings['from_pydata'] / timings['foreach_set']:5.1f}x | v/e/l/p {counts}")
 
-def create_mesh_from_coordinates(coordinates, part_name, collection_name, scale_factor=None):
-    if not coordinates or len(coordinates) < 6:  
+def create_mesh_from_coordinates(coordinates, part_name, collection_name, scale_factor=None, oriented=False):
+    if coordinates is None:
         return None
     
-    if "front_panel" in part_name.lower() or "back_panel" in part_name.lower():
-        coordinates = auto_orient_front_panel(coordinates)
-    elif "neck_binding" in part_name.lower() or "waist_band" in part_name.lower():
-        coordinates = auto_orient_horizontal_piece(coordinates)
-    elif "sleeve" in part_name.lower() and "cuff" not in part_name.lower():
-        coordinates = auto_orient_sleeve(coordinates)
-    
-    if scale_factor is None:
-        max_coord = max(abs(c) for c in coordinates)
-        if max_coord > 1000:
-            scale_factor = 1000  
-        elif max_coord > 100:
-            scale_factor = 100  
-        elif max_coord > 10:
-            scale_factor = 10   
-        else:
-            scale_factor = 1    
-
-    newVerts = []
-    for i in range(0, len(coordinates)-1, 2):
-        if i+1 < len(coordinates):
-            if "sleeve" in part_name.lower() and "cuff" not in part_name.lower():
-                y = float(coordinates[i]) / scale_factor    
-                z = -float(coordinates[i+1]) / scale_factor  
-                value = mathutils.Vector((0, y, z))         
-            else:
-                x = float(coordinates[i]) / scale_factor    
-                z = -float(coordinates[i+1]) / scale_factor  
-                value = mathutils.Vector((x, 0, z))         
-            newVerts.append(value)
-    
-    if newVerts:
-        min_x = min(v.x for v in newVerts)
-        max_x = max(v.x for v in newVerts)
-        min_y = min(v.y for v in newVerts)
-        max_y = max(v.y for v in newVerts)
-        min_z = min(v.z for v in newVerts)
-        max_z = max(v.z for v in newVerts)
-        
-        center_x = (min_x + max_x) / 2
-        center_y = (min_y + max_y) / 2
-        center_z = (min_z + max_z) / 2
-        
-        for v in newVerts:
-            v.x -= center_x
-            v.y -= center_y
-            v.z -= center_z
+    points = as_points_array(coordinates)
+    if len(points) < 3:  
+        return None
+    
+    # Loaders orient off the main thread (or read pre-oriented coordinates from the bundle)
+    if not oriented:
+        points = orient_coordinates_for_part(points, part_name)
+    
+    verts = pattern_vertices(points, part_name, scale_factor)
+    
+    # Sleeves keep their origin at the vertex median, as ORIGIN_GEOMETRY would place it
+    if "sleeve" in part_name.lower() and "cuff" not in part_name.lower():
+        verts -= verts.mean(axis=0)
     
     mesh = bpy.data.meshes.new(name=part_name)
     obj = bpy.data.objects.new(name=part_name, object_data=mesh)
@@ -362,18 +982,9 @@ def create_mesh_from_coordinates(coordinates, part_name, collection_name, scale_
     
     bpy.context.view_layer.objects.active = obj
     obj.select_set(True)
-
-    edges = []
-    for i in range(len(newVerts)):
-        if i == len(newVerts) - 1:
-            edges.append([i, 0]) 
-        else:
-            edges.append([i, i+1])
     
-    face = list(range(len(newVerts)))
-    
-    mesh.from_pydata(newVerts, edges, [face])
-    mesh.update()
+    build_outline_mesh(mesh, verts)
+    obj[CONTOUR_PROPERTY] = ContourIndex(verts).to_property()
     
     if "front_panel" in part_name.lower():
         obj.location.x = 0.5
@@ -428,18 +1039,7 @@ def create_mesh_from_coordinates(coordinates, part_name, collection_name, scale_
             else:
                 intended_y = sleeve_num * 2.0
         
-        # Set initial position
-        obj.location.y = intended_y
-        
-        # Set origin to geometry (this might change position)
-        bpy.context.view_layer.objects.active = obj
-        obj.select_set(True)
-        bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY')
-        
-        # Restore intended position after origin change
-        obj.location.x = 0.5
         obj.location.y = intended_y
-        obj.location.z = 0
         
         # Ensure curved edge faces the front panel
         ensure_sleeve_curved_edge_faces_panel(obj, sleeve_num)
@@ -461,15 +1061,15 @@ def ensure_sleeve_curved_edge_faces_panel(sleeve_obj, sleeve_num):
     if not mesh or not mesh.vertices:
         return
     
-    verts = mesh.vertices
+    verts = get_local_vertex_array(sleeve_obj)
     
     # Get the left and right edges of the sleeve (in Y direction)
-    min_y = min(v.co.y for v in verts)
-    max_y = max(v.co.y for v in verts)
+    min_y = verts[:, 1].min()
+    max_y = verts[:, 1].max()
     
     # Get points on left edge and right edge
-    left_edge_points = [v.co for v in verts if abs(v.co.y - min_y) < 0.1]
-    right_edge_points = [v.co for v in verts if abs(v.co.y - max_y) < 0.1]
+    left_edge_points = verts[np.abs(verts[:, 1] - min_y) < 0.1]
+    right_edge_points = verts[np.abs(verts[:, 1] - max_y) < 0.1]
     
     # Calculate curvature for both edges
     left_curvature = calculate_edge_curvature(left_edge_points)
@@ -502,34 +1102,6 @@ def ensure_sleeve_curved_edge_faces_panel(sleeve_obj, sleeve_num):
             sleeve_obj.location.y = intended_y
             sleeve_obj.location.z = intended_z
 
-def calculate_edge_curvature(edge_points):
-    """Calculate curvature of an edge based on its points"""
-    if len(edge_points) < 3:
-        return 0
-    
-    # Sort points by Z coordinate
-    sorted_points = sorted(edge_points, key=lambda p: p.z)
-    
-    if len(sorted_points) < 3:
-        return 0
-    
-    # Calculate total deviation from straight line
-    start = sorted_points[0]
-    end = sorted_points[-1]
-    
-    total_deviation = 0
-    for i in range(1, len(sorted_points) - 1):
-        point = sorted_points[i]
-        # Calculate distance from point to line between start and end
-        t = (point.z - start.z) / (end.z - start.z) if end.z != start.z else 0
-        line_x = start.x + t * (end.x - start.x)
-        line_y = start.y + t * (end.y - start.y)
-        
-        deviation = math.sqrt((point.x - line_x)**2 + (point.y - line_y)**2)
-        total_deviation += deviation
-    
-    return total_deviation / (len(sorted_points) - 2) if len(sorted_points) > 2 else 0
-
 def position_pocket_on_front_panel(pocket_obj):
     """Position pocket slightly in front of the front panel, above its bottom edge"""
     
@@ -545,8 +1117,7 @@ def position_pocket_on_front_panel(pocket_obj):
     
     # Get front panel bounds
     if front_panel.data and front_panel.data.vertices:
-        verts = front_panel.data.vertices
-        world_verts = [front_panel.matrix_world @ v.co for v in verts]
+        world_verts = get_world_geometry(front_panel).vectors
         
         # Find front panel's bottom edge (minimum Z)
         min_z = min(v.z for v in world_verts)
@@ -616,6 +1187,125 @@ def orient_pocket_longest_edge_horizontal(pocket_obj):
     # First make edge horizontal (along X), then add 90° to make it run along Y
     pocket_obj.rotation_euler[2] += required_rotation + math.pi/2
 
+def get_local_vertex_array(obj):
+    """N×3 float64 array of a mesh object's local vertex coordinates"""
+    
+    vertices = obj.data.vertices
+    coordinates = np.empty(len(vertices) * 3, dtype=np.float32)
+    vertices.foreach_get("co", coordinates)
+    return coordinates.reshape(-1, 3).astype(np.float64)
+
+def get_world_vertex_array(obj):
+    """N×3 float64 array of a mesh object's vertices in world space"""
+    return transform_points(np.array(obj.matrix_world, dtype=np.float64), get_local_vertex_array(obj))
+
+def get_edge_vertex_array(obj):
+    """M×2 array of the vertex indices of a mesh object's edges"""
+    
+    edges = obj.data.edges
+    vertex_indices = np.empty(len(edges) * 2, dtype=np.int32)
+    edges.foreach_get("vertices", vertex_indices)
+    return vertex_indices.reshape(-1, 2)
+
+class WorldGeometry:
+    """World-space vertex and edge arrays of one mesh object, read once and shared by every seam finder"""
+    
+    def __init__(self, obj, key):
+        self.key = key
+        self.vertices = get_world_vertex_array(obj)
+        self.edges = get_edge_vertex_array(obj)
+        self.contour = None
+        self._vectors = None
+        self._edge_geometry = None
+    
+    @property
+    def vectors(self):
+        """The world vertices as frozen mathutils Vectors, for the finders that still work per edge"""
+        
+        if self._vectors is None:
+            self._vectors = [Vector(co).freeze() for co in self.vertices.tolist()]
+        return self._vectors
+    
+    @property
+    def edge_geometry(self):
+        """(starts, ends, vectors, lengths) of every edge in world space, for the vectorised edge queries"""
+        
+        if self._edge_geometry is None:
+            self._edge_geometry = edge_geometry(self.vertices, self.edges)
+        return self._edge_geometry
+
+def get_world_geometry(obj):
+    """Cached WorldGeometry of a mesh object, rebuilt when its transform or mesh changes"""
+    
+    mesh = obj.data
+    key = (mesh.as_pointer(), len(mesh.vertices), len(mesh.edges), tuple(c for row in obj.matrix_world for c in row))
+    
+    geometry = _world_geometry_cache.get(obj.as_pointer())
+    if geometry is None or geometry.key != key:
+        geometry = WorldGeometry(obj, key)
+        _world_geometry_cache[obj.as_pointer()] = geometry
+    return geometry
+
+def clear_world_geometry_cache():
+    _world_geometry_cache.clear()
+
+def get_contour_index(obj):
+    """ContourIndex of a piece - the one stored at creation, rebuilt from the mesh if that was edited -
+    or None when the mesh has no simple outline. Cached with the piece's world geometry"""
+    
+    geometry = get_world_geometry(obj)
+    if geometry.contour is None:
+        points = get_local_vertex_array(obj)
+        stored = obj.get(CONTOUR_PROPERTY)
+        contour = ContourIndex.from_property(points, geometry.edges, stored.to_dict()) if stored is not None else None
+        
+        if contour is None:
+            contour = ContourIndex.from_mesh_loop(points, geometry.edges)
+            if contour is None:
+                # Loop cuts and added edges leave more than the outline - keep to its outer boundary
+                contour = ContourIndex.from_edge_graph(points, geometry.edges)
+            if contour is not None:
+                obj[CONTOUR_PROPERTY] = contour.to_property()
+        
+        geometry.contour = contour
+    return geometry.contour
+
+def get_local_up(obj):
+    """World Z in a piece's local frame, the up its contour runs are oriented against"""
+    
+    rotation = np.array(obj.matrix_world, dtype=np.float64)[:3, :3]
+    return np.linalg.solve(rotation, (0.0, 0.0, 1.0))
+
+def get_contour_runs(obj):
+    """Straight and curved runs of a piece's outline (see ContourIndex.runs), oriented against world Z"""
+    
+    contour = get_contour_index(obj)
+    if contour is None:
+        return []
+    return contour.runs(get_local_up(obj))
+
+@persistent
+def invalidate_world_geometry(scene, depsgraph):
+    """depsgraph_update_post handler - drops the cached geometry of objects whose mesh was edited"""
+    
+    for update in depsgraph.updates:
+        if update.is_updated_geometry and isinstance(update.id, bpy.types.Object):
+            _world_geometry_cache.pop(update.id.original.as_pointer(), None)
+
+@persistent
+def clear_world_geometry_on_load(*args):
+    clear_world_geometry_cache()
+
+def get_edge_data(obj, edge_index):
+    """(edge, v1, v2, length, avg_z) of a mesh edge, v1/v2 in world space, as the seam finders pass edges around"""
+    
+    mesh = obj.data
+    edge = mesh.edges[edge_index]
+    world_verts = get_world_geometry(obj).vectors
+    v1 = world_verts[edge.vertices[0]]
+    v2 = world_verts[edge.vertices[1]]
+    return (edge, v1, v2, (v2 - v1).length, (v1.z + v2.z) / 2)
+
 def position_hood_safely(hood_obj):
     """Position hood above back panel using only object locations - NO matrix_world"""
     
@@ -648,66 +1338,32 @@ def position_hood_safely(hood_obj):
         back_top_world_z = back_z + 1.0  # Fallback
     
     # Orient hood so width (shortest cross-section) runs along Y axis
+    best_rotation = None
+    hood_width = 0
     if hood_obj.data and hood_obj.data.vertices:
-        hood_verts = hood_obj.data.vertices
+        hood_local = get_local_vertex_array(hood_obj)
+        local_spans = np.ptp(hood_local, axis=0) * np.abs(np.array(hood_obj.scale, dtype=np.float64))
         
-        # Test all possible 90-degree rotations to find the hood's width along Y axis
-        best_rotation_x = 0
-        best_rotation_y = 0  
-        best_rotation_z = 0
+        # Quarter turns only permute the local spans, so every rotation is scored from the local
+        # bounds - no rotation writes or scene updates until the winner is applied
         best_score = -1
+        for rotation, matrix in QUARTER_TURN_ROTATIONS:
+            x_span, y_span, z_span = quarter_turn_world_spans(local_spans, matrix)
+            
+            # Score: want Y=width (smaller) and Z=height (larger)
+            # Higher score = better orientation
+            score = 0
+            if y_span > 0.01 and z_span > 0.01:  # Both Y and Z have meaningful spans
+                if y_span < z_span:  # Y is width, Z is height
+                    score = 1000 / y_span  # Prefer smaller Y span (smaller width)
+            
+            # Keep track of best rotation
+            if score > best_score:
+                best_score = score
+                best_rotation = rotation
+                hood_width = y_span
         
-        
-        # Test rotations around X, Y, Z axes
-        for rot_x in [0, 90, 180, 270]:
-            for rot_y in [0, 90, 180, 270]:
-                for rot_z in [0, 90, 180, 270]:
-                    # Apply test rotation
-                    hood_obj.rotation_euler[0] = math.radians(rot_x)
-                    hood_obj.rotation_euler[1] = math.radians(rot_y)
-                    hood_obj.rotation_euler[2] = math.radians(rot_z)
-                    
-                    # Update mesh to get new coordinates
-                    bpy.context.view_layer.update()
-                    
-                    # Calculate spans in all dimensions using WORLD coordinates
-                    world_verts = [hood_obj.matrix_world @ v.co for v in hood_verts]
-                    min_x = min(v.x for v in world_verts)
-                    max_x = max(v.x for v in world_verts)
-                    min_y = min(v.y for v in world_verts)
-                    max_y = max(v.y for v in world_verts)
-                    min_z = min(v.z for v in world_verts)
-                    max_z = max(v.z for v in world_verts)
-                    
-                    x_span = max_x - min_x
-                    y_span = max_y - min_y
-                    z_span = max_z - min_z
-                    
-                    # Score: want Y=width (smaller) and Z=height (larger)
-                    # Higher score = better orientation
-                    score = 0
-                    if y_span > 0.01 and z_span > 0.01:  # Both Y and Z have meaningful spans
-                        if y_span < z_span:  # Y is width, Z is height
-                            score = 1000 / y_span  # Prefer smaller Y span (smaller width)
-                    
-                    
-                    # Keep track of best rotation
-                    if score > best_score:
-                        best_score = score
-                        best_rotation_x = rot_x
-                        best_rotation_y = rot_y
-                        best_rotation_z = rot_z
-        
-        # Apply the best rotation
-        hood_obj.rotation_euler[0] = math.radians(best_rotation_x)
-        hood_obj.rotation_euler[1] = math.radians(best_rotation_y)
-        hood_obj.rotation_euler[2] = math.radians(best_rotation_z)
-        
-        
-        # Update mesh and get final bounds
-        bpy.context.view_layer.update()
-        min_z = min(v.co.z for v in hood_verts)
-        hood_local_min_z = min_z
+        hood_local_min_z = float(hood_local[:, 2].min())
     else:
         hood_local_min_z = 0
     
@@ -721,13 +1377,6 @@ def position_hood_safely(hood_obj):
     if "hood_2" in hood_obj.name.lower():
         hood_num = 2
     
-    # Calculate hood width after orientation
-    bpy.context.view_layer.update()
-    world_verts = [hood_obj.matrix_world @ v.co for v in hood_obj.data.vertices]
-    min_y = min(v.y for v in world_verts)
-    max_y = max(v.y for v in world_verts)
-    hood_width = max_y - min_y
-    
     # Position hoods side by side
     hood_offset = hood_width / 2 + 0.1  # Small gap between hoods
     
@@ -735,11 +1384,17 @@ def position_hood_safely(hood_obj):
         # Hood 1: negative Y side, straight edge faces toward center (Y=0)
         hood_obj.location.y = -hood_offset
     else:
-        # Hood 2: positive Y side, FLIP so straight edge faces toward center (Y=0)
-        # Flip hood 2 around Z axis (180 degrees) to mirror it
-        hood_obj.rotation_euler[2] += math.pi  # Add 180 degrees
+        # Hood 2: positive Y side, straight edge faces toward center (Y=0)
         hood_obj.location.y = hood_offset
     
+    if best_rotation is not None:
+        rot_x, rot_y, rot_z = (math.radians(angle) for angle in best_rotation)
+        if hood_num == 2:
+            # FLIP hood 2 around Z axis (180 degrees) to mirror it
+            rot_z += math.pi
+        hood_obj.rotation_euler = (rot_x, rot_y, rot_z)
+    
+    bpy.context.view_layer.update()
 
 def orient_sleeve_cuff_longest_edge_y(cuff_obj):
     """Orient sleeve cuff so longest edge runs along Z axis (up-down) and shortest on Y axis (left-right)"""
@@ -747,87 +1402,52 @@ def orient_sleeve_cuff_longest_edge_y(cuff_obj):
     if not cuff_obj.data or not cuff_obj.data.vertices:
         return
     
-    cuff_verts = cuff_obj.data.vertices
+    cuff_local = get_local_vertex_array(cuff_obj)
+    local_spans = np.ptp(cuff_local, axis=0) * np.abs(np.array(cuff_obj.scale, dtype=np.float64))
     
-    # Test all possible 90-degree rotations to find Z=longest, Y=shortest
-    best_rotation_x = 0
-    best_rotation_y = 0  
-    best_rotation_z = 0
+    # Axis-aligned rotations only permute the local spans, so each one is scored from them
+    # without touching the object
+    best_rotation = (0, 0, 0)
     best_score = -1
     
-    
-    # Test rotations around X, Y, Z axes
-    for rot_x in [0, 90, 180, 270]:
-        for rot_y in [0, 90, 180, 270]:
-            for rot_z in [0, 90, 180, 270]:
-                # Apply test rotation
-                cuff_obj.rotation_euler[0] = math.radians(rot_x)
-                cuff_obj.rotation_euler[1] = math.radians(rot_y)
-                cuff_obj.rotation_euler[2] = math.radians(rot_z)
-                
-                # Update mesh to get new coordinates
-                bpy.context.view_layer.update()
-                
-                # Calculate spans in all dimensions using WORLD coordinates
-                world_verts = [cuff_obj.matrix_world @ v.co for v in cuff_verts]
-                min_x = min(v.x for v in world_verts)
-                max_x = max(v.x for v in world_verts)
-                min_y = min(v.y for v in world_verts)
-                max_y = max(v.y for v in world_verts)
-                min_z = min(v.z for v in world_verts)
-                max_z = max(v.z for v in world_verts)
-                
-                x_span = max_x - min_x
-                y_span = max_y - min_y
-                z_span = max_z - min_z
-                
-                # Calculate score: want Y to be largest dimension and Z to be smallest
-                # For flat objects, Z might be 0, which is perfectly fine as "shortest"
-                dimensions = [x_span, y_span, z_span]
-                max_dim = max(dimensions)
-                min_dim = min(dimensions)
-                
-                score = 0
-                
-
-                # We want the cuff oriented in Y-Z plane (not X-Y plane!)
-                # X should be minimal (thickness), Z should be longest (height), Y should be shortest (width)
-                
-                # Check if X is minimal (close to 0 for flat garment piece)
-                # AND Z is the longest dimension AND Y is the shortest dimension
-                if x_span <= 0.1 and z_span == max_dim and y_span == min_dim:
-                    # Perfect score - oriented in Y-Z plane with Z=longest, Y=shortest
-                    score = 1000 + z_span  # High base score plus Z span
-                elif x_span <= 0.1 and z_span == max_dim:
-                    # In Y-Z plane with Z longest but Y not shortest
-                    score = 500 + z_span - (y_span * 10)  # Penalize non-shortest Y
-                elif x_span <= 0.1 and y_span == min_dim:
-                    # In Y-Z plane with Y shortest but Z not longest
-                    score = 300 + z_span - (abs(z_span - max_dim) * 10)  # Penalize Z not being longest
-                elif x_span <= 0.1:
-                    # At least in Y-Z plane
-                    score = 100 + z_span
-                
-                
-                # Keep track of best rotation
-                if score > best_score:
-                    best_score = score
-                    best_rotation_x = rot_x
-                    best_rotation_y = rot_y
-                    best_rotation_z = rot_z
+    for rotation, matrix in QUARTER_TURN_ROTATIONS:
+        x_span, y_span, z_span = quarter_turn_world_spans(local_spans, matrix)
+        
+        # Calculate score: want Y to be largest dimension and Z to be smallest
+        # For flat objects, Z might be 0, which is perfectly fine as "shortest"
+        dimensions = [x_span, y_span, z_span]
+        max_dim = max(dimensions)
+        min_dim = min(dimensions)
+        
+        score = 0
+        
+        # We want the cuff oriented in Y-Z plane (not X-Y plane!)
+        # X should be minimal (thickness), Z should be longest (height), Y should be shortest (width)
+        
+        # Check if X is minimal (close to 0 for flat garment piece)
+        # AND Z is the longest dimension AND Y is the shortest dimension
+        if x_span <= 0.1 and z_span == max_dim and y_span == min_dim:
+            # Perfect score - oriented in Y-Z plane with Z=longest, Y=shortest
+            score = 1000 + z_span  # High base score plus Z span
+        elif x_span <= 0.1 and z_span == max_dim:
+            # In Y-Z plane with Z longest but Y not shortest
+            score = 500 + z_span - (y_span * 10)  # Penalize non-shortest Y
+        elif x_span <= 0.1 and y_span == min_dim:
+            # In Y-Z plane with Y shortest but Z not longest
+            score = 300 + z_span - (abs(z_span - max_dim) * 10)  # Penalize Z not being longest
+        elif x_span <= 0.1:
+            # At least in Y-Z plane
+            score = 100 + z_span
+        
+        # Keep track of best rotation
+        if score > best_score:
+            best_score = score
+            best_rotation = rotation
     
     # Apply the best rotation (Z=longest height, Y=shortest width)
-    cuff_obj.rotation_euler[0] = math.radians(best_rotation_x)
-    cuff_obj.rotation_euler[1] = math.radians(best_rotation_y)
-    cuff_obj.rotation_euler[2] = math.radians(best_rotation_z)
+    cuff_obj.rotation_euler = tuple(math.radians(angle) for angle in best_rotation)
     
-    
-    # Update mesh one final time and log final dimensions
     bpy.context.view_layer.update()
-    world_verts = [cuff_obj.matrix_world @ v.co for v in cuff_verts]
-    final_x = max(v.x for v in world_verts) - min(v.x for v in world_verts)
-    final_y = max(v.y for v in world_verts) - min(v.y for v in world_verts)
-    final_z = max(v.z for v in world_verts) - min(v.z for v in world_verts)
 
 def position_sleeve_cuff_next_to_sleeve(cuff_obj):
     """Position sleeve cuff next to its corresponding sleeve at same X and Z, offset in Y"""
@@ -872,8 +1492,7 @@ def position_sleeve_cuff_next_to_sleeve(cuff_obj):
     
     # Get sleeve dimensions and position
     if sleeve_obj.data and sleeve_obj.data.vertices:
-        sleeve_verts = sleeve_obj.data.vertices
-        sleeve_world_verts = [sleeve_obj.matrix_world @ v.co for v in sleeve_verts]
+        sleeve_world_verts = get_world_geometry(sleeve_obj).vectors
         
         # Get sleeve bounds
         sleeve_min_y = min(v.y for v in sleeve_world_verts)
@@ -882,8 +1501,7 @@ def position_sleeve_cuff_next_to_sleeve(cuff_obj):
         
         # Get cuff width to calculate offset
         if cuff_obj.data and cuff_obj.data.vertices:
-            cuff_verts = cuff_obj.data.vertices  
-            cuff_world_verts = [cuff_obj.matrix_world @ v.co for v in cuff_verts]
+            cuff_world_verts = get_world_geometry(cuff_obj).vectors
             cuff_width = max(v.y for v in cuff_world_verts) - min(v.y for v in cuff_world_verts)
         else:
             cuff_width = 1.0  # Default
@@ -904,6 +1522,43 @@ def position_sleeve_cuff_next_to_sleeve(cuff_obj):
         
     
 
+def edge_chain_points(vertex_pairs, count, axis=None, start=0.0, end=1.0):
+    """count stitch points as Vectors, at equal arc length along world-space (v1, v2) edge pairs - chained
+    along a world axis (0 = X, 1 = Y, 2 = Z), or as given when axis is None - see resample_segments"""
+    
+    pairs = np.array([(tuple(v1), tuple(v2)) for v1, v2 in vertex_pairs], dtype=np.float64).reshape(-1, 2, 3)
+    starts, ends = pairs[:, 0], pairs[:, 1]
+    if axis is not None:
+        starts, ends = order_segments(starts, ends, axis)
+    return [Vector(point) for point in resample_segments(starts, ends, count, start, end).tolist()]
+
+def edge_chain_length(vertex_pairs):
+    """Total length of world-space (v1, v2) edge pairs"""
+    return sum((v2 - v1).length for v1, v2 in vertex_pairs)
+
+def seam_spring_count(seam, length):
+    """Springs to place along a seam of the given length, from the seam's density setting in the scene
+    (SEAM_SPRING_DEFAULTS before the first garment load fills the settings in)"""
+    
+    mode, count, per_metre, minimum = SEAM_SPRING_DEFAULTS[seam]
+    
+    props = getattr(bpy.context.scene, "fashionsynth_props", None)
+    settings = props.seam_springs.get(seam) if props is not None else None
+    if settings is not None:
+        mode, count, per_metre = settings.density_mode, settings.count, settings.per_metre
+    
+    if mode == 'COUNT':
+        return count
+    return max(minimum, int(length * per_metre))
+
+def garment_pieces():
+    """Pattern piece objects in the file - everything but the springs and debug stitches seams add"""
+    
+    return [
+        obj for obj in bpy.data.objects
+        if obj.get(SEAM_PROPERTY) is None and not obj.name.startswith(SEAM_OBJECT_PREFIXES)
+    ]
+
 def create_sewing_springs_between_edges(obj1, edge1, obj2, edge2):
     """Create visual sewing spring connections between two edges"""
     
@@ -916,59 +1571,30 @@ def create_sewing_springs_between_edges(obj1, edge1, obj2, edge2):
     else:
         bpy.context.collection.objects.link(spring_obj)
     
-    # Get edge vertices in world space
-    mesh1 = obj1.data
-    mesh2 = obj2.data
-    
-    # We need to get the edge vertex indices from the bmesh edge
-    # Since we passed the edge from bmesh, we need to get back to object mode first
-    bpy.ops.object.mode_set(mode='OBJECT')
-    
-    # Get vertices for each edge
-    edge1_verts = []
-    edge2_verts = []
-    
-    # Find the edge vertices by checking all edges
-    for e in mesh1.edges:
-        v1_co = obj1.matrix_world @ mesh1.vertices[e.vertices[0]].co
-        v2_co = obj1.matrix_world @ mesh1.vertices[e.vertices[1]].co
-        
-        # Check if this edge is vertical and near center
-        edge_vector = v2_co - v1_co
-        if abs(edge_vector.z) > 0.5 and abs(edge_vector.y) < 0.3 and abs(edge_vector.x) < 0.1:
-            avg_y = (v1_co.y + v2_co.y) / 2
-            if abs(avg_y) < 0.3:  # Close to center
-                edge1_verts = [v1_co, v2_co]
-                break
+    # Get edge vertices in world space - the first vertical edge near the center line of each piece
+    def center_edge_verts(obj):
+        geometry = get_world_geometry(obj)
+        starts, ends, vectors, _ = geometry.edge_geometry
+        extents = np.abs(vectors)
+        near_center = np.abs((starts[:, 1] + ends[:, 1]) / 2) < 0.3
+        matches = np.flatnonzero((extents[:, 2] > 0.5) & (extents[:, 1] < 0.3) & (extents[:, 0] < 0.1) & near_center)
+        if len(matches) == 0:
+            return []
+        return [geometry.vectors[vertex] for vertex in geometry.edges[matches[0]].tolist()]
     
-    for e in mesh2.edges:
-        v1_co = obj2.matrix_world @ mesh2.vertices[e.vertices[0]].co
-        v2_co = obj2.matrix_world @ mesh2.vertices[e.vertices[1]].co
-        
-        # Check if this edge is vertical and near center
-        edge_vector = v2_co - v1_co
-        if abs(edge_vector.z) > 0.5 and abs(edge_vector.y) < 0.3 and abs(edge_vector.x) < 0.1:
-            avg_y = (v1_co.y + v2_co.y) / 2
-            if abs(avg_y) < 0.3:  # Close to center
-                edge2_verts = [v1_co, v2_co]
-                break
+    edge1_verts = center_edge_verts(obj1)
+    edge2_verts = center_edge_verts(obj2)
     
     if not edge1_verts or not edge2_verts:
         return
     
     # Create spring connections - subdivide edges for more connection points
-    num_springs = 5  # Number of spring connections along the edge
+    num_springs = seam_spring_count("hood_center", (edge1_verts[1] - edge1_verts[0]).length)
     
     spring_verts = []
     spring_edges = []
     
-    for i in range(num_springs):
-        t = i / (num_springs - 1) if num_springs > 1 else 0.5
-        
-        # Interpolate along each edge
-        p1 = edge1_verts[0].lerp(edge1_verts[1], t)
-        p2 = edge2_verts[0].lerp(edge2_verts[1], t)
-        
+    for p1, p2 in zip(edge_chain_points([edge1_verts], num_springs), edge_chain_points([edge2_verts], num_springs)):
         # Add vertices for this spring
         v_idx = len(spring_verts)
         spring_verts.append(p1)
@@ -1031,7 +1657,7 @@ def setup_hood_center_seam():
     hood_1 = None
     hood_2 = None
     
-    for obj in bpy.data.objects:
+    for obj in garment_pieces():
         if "_hood_" in obj.name.lower():
             if "hood_1" in obj.name.lower():
                 hood_1 = obj
@@ -1046,57 +1672,28 @@ def setup_hood_center_seam():
     # These are the edges closest to Y=0 (center line where hoods meet)
     
     def find_center_facing_edge(hood_obj):
-        """Find the straight vertical edge closest to Y=0"""
+        """Index of the straight vertical edge closest to Y=0, marked as a seam"""
         if not hood_obj.data or not hood_obj.data.edges:
             return None
         
-        mesh = hood_obj.data
-        bpy.context.view_layer.objects.active = hood_obj
-        hood_obj.select_set(True)
-        
-        # Switch to edit mode to work with edges
-        bpy.ops.object.mode_set(mode='EDIT')
-        bm = bmesh.from_edit_mesh(mesh)
-        bm.edges.ensure_lookup_table()
-        
-        best_edge = None
-        min_y_distance = float('inf')
-        
-        # Find edge closest to Y=0 that's also vertical (runs in Z direction)
-        for edge in bm.edges:
-            v1 = hood_obj.matrix_world @ edge.verts[0].co
-            v2 = hood_obj.matrix_world @ edge.verts[1].co
-            
-            # Check if edge is mostly vertical (Z direction)
-            edge_vector = v2 - v1
-            z_component = abs(edge_vector.z)
-            y_component = abs(edge_vector.y)
-            x_component = abs(edge_vector.x)
-            
-            # Edge should be primarily vertical (Z) with minimal Y and X
-            if z_component > 0.5 and y_component < 0.3 and x_component < 0.1:
-                # Calculate average Y position (distance from center)
-                avg_y = (v1.y + v2.y) / 2
-                distance_from_center = abs(avg_y)
-                
-                if distance_from_center < min_y_distance:
-                    min_y_distance = distance_from_center
-                    best_edge = edge
-                    
-        
-        # Mark the best edge as seam
-        if best_edge:
-            best_edge.seam = True
-            bmesh.update_edit_mesh(mesh)
+        # Edge should be primarily vertical (Z) with minimal Y and X
+        starts, ends, vectors, _ = get_world_geometry(hood_obj).edge_geometry
+        extents = np.abs(vectors)
+        vertical_edges = np.flatnonzero((extents[:, 2] > 0.5) & (extents[:, 1] < 0.3) & (extents[:, 0] < 0.1))
+        if len(vertical_edges) == 0:
+            return None
         
-        bpy.ops.object.mode_set(mode='OBJECT')
+        # Average Y position (distance from center)
+        distance_from_center = np.abs((starts[vertical_edges, 1] + ends[vertical_edges, 1]) / 2)
+        best_edge = int(vertical_edges[distance_from_center.argmin()])
+        hood_obj.data.edges[best_edge].use_seam = True
         return best_edge
     
     # Find and mark the center-facing edges on both hoods
     edge1 = find_center_facing_edge(hood_1)
     edge2 = find_center_facing_edge(hood_2) 
     
-    if edge1 and edge2:
+    if edge1 is not None and edge2 is not None:
         # Create visual sewing connection
         create_sewing_springs_between_edges(hood_1, edge1, hood_2, edge2)
     
@@ -1109,7 +1706,7 @@ def setup_sleeve_cuff_seams():
     sleeves = []
     cuffs = []
     
-    for obj in bpy.data.objects:
+    for obj in garment_pieces():
         obj_name = obj.name.lower()
         if "sleeve" in obj_name and "cuff" not in obj_name:
             sleeves.append(obj)
@@ -1147,68 +1744,38 @@ def connect_sleeve_to_cuff(sleeve_obj, cuff_obj):
 def find_closest_vertical_edges(sleeve_obj, cuff_obj):
     """Find the closest vertical edges between sleeve and cuff"""
     
-    sleeve_mesh = sleeve_obj.data
-    cuff_mesh = cuff_obj.data
+    sleeve_geometry = get_world_geometry(sleeve_obj)
+    cuff_geometry = get_world_geometry(cuff_obj)
     
-    # Find all vertical edges in sleeve
-    sleeve_vertical_edges = []
-    for edge in sleeve_mesh.edges:
-        v1 = sleeve_obj.matrix_world @ sleeve_mesh.vertices[edge.vertices[0]].co
-        v2 = sleeve_obj.matrix_world @ sleeve_mesh.vertices[edge.vertices[1]].co
-        
-        edge_vector = v2 - v1
-        z_component = abs(edge_vector.z)
-        edge_length = edge_vector.length
+    def vertical_edges(geometry):
+        """Indices and centres of the edges running in Z - over 0.3 and at least 70% vertical"""
         
-        # Check if edge is vertical (runs in Z direction)
-        if z_component > 0.3 and z_component / edge_length > 0.7:  # At least 70% vertical
-            edge_center = (v1 + v2) / 2
-            sleeve_vertical_edges.append((edge, edge_center, edge_length, v1, v2))
+        starts, ends, vectors, lengths = geometry.edge_geometry
+        z_components = np.abs(vectors[:, 2])
+        edges = np.flatnonzero((z_components > 0.3) & (z_components > 0.7 * lengths))
+        return edges, (starts[edges] + ends[edges]) / 2
     
-    # Find all vertical edges in cuff
-    cuff_vertical_edges = []
-    for edge in cuff_mesh.edges:
-        v1 = cuff_obj.matrix_world @ cuff_mesh.vertices[edge.vertices[0]].co
-        v2 = cuff_obj.matrix_world @ cuff_mesh.vertices[edge.vertices[1]].co
-        
-        edge_vector = v2 - v1
-        z_component = abs(edge_vector.z)
-        edge_length = edge_vector.length
-        
-        # Check if edge is vertical (runs in Z direction)
-        if z_component > 0.3 and z_component / edge_length > 0.7:  # At least 70% vertical
-            edge_center = (v1 + v2) / 2
-            cuff_vertical_edges.append((edge, edge_center, edge_length, v1, v2))
+    sleeve_edges, sleeve_centers = vertical_edges(sleeve_geometry)
+    cuff_edges, cuff_centers = vertical_edges(cuff_geometry)
     
-    if not sleeve_vertical_edges or not cuff_vertical_edges:
+    if len(sleeve_edges) == 0 or len(cuff_edges) == 0:
         return None, None
     
-    # Find the pair of edges that are closest to each other
-    min_distance = float('inf')
-    best_sleeve_edge = None
-    best_cuff_edge = None
+    # Find the pair of edges whose centres are closest to each other
+    offsets = sleeve_centers[:, None, :] - cuff_centers[None, :, :]
+    best_sleeve, best_cuff = np.unravel_index((offsets * offsets).sum(axis=2).argmin(), offsets.shape[:2])
     
-    for sleeve_edge in sleeve_vertical_edges:
-        sleeve_center = sleeve_edge[1]
-        
-        for cuff_edge in cuff_vertical_edges:
-            cuff_center = cuff_edge[1]
-            
-            # Calculate distance between edge centers
-            distance = (sleeve_center - cuff_center).length
-            
-            if distance < min_distance:
-                min_distance = distance
-                best_sleeve_edge = sleeve_edge
-                best_cuff_edge = cuff_edge
+    def edge_tuple(obj, geometry, edge_index):
+        edge = obj.data.edges[edge_index]
+        world_verts = geometry.vectors
+        return edge, float(geometry.edge_geometry[3][edge_index]), world_verts[edge.vertices[0]], world_verts[edge.vertices[1]]
     
-    if best_sleeve_edge and best_cuff_edge:
- 
-        # Return tuples with the data needed for spring creation
-        return (best_sleeve_edge[0], 0, best_sleeve_edge[2], best_sleeve_edge[3], best_sleeve_edge[4]), \
-               (best_cuff_edge[0], 0, best_cuff_edge[2], 0, best_cuff_edge[3], best_cuff_edge[4])
+    sleeve_edge, sleeve_length, sleeve_v1, sleeve_v2 = edge_tuple(sleeve_obj, sleeve_geometry, int(sleeve_edges[best_sleeve]))
+    cuff_edge, cuff_length, cuff_v1, cuff_v2 = edge_tuple(cuff_obj, cuff_geometry, int(cuff_edges[best_cuff]))
     
-    return None, None
+    # Return tuples with the data needed for spring creation
+    return (sleeve_edge, 0, sleeve_length, sleeve_v1, sleeve_v2), \
+           (cuff_edge, 0, cuff_length, 0, cuff_v1, cuff_v2)
 
 def create_sleeve_cuff_springs(sleeve_obj, sleeve_edge_data, cuff_obj, cuff_edge_data):
     """Create sewing springs between sleeve and cuff edges"""
@@ -1236,17 +1803,14 @@ def create_sleeve_cuff_springs(sleeve_obj, sleeve_edge_data, cuff_obj, cuff_edge
         bpy.context.collection.objects.link(spring_obj)
     
     # Create spring connections
-    num_springs = 5
+    num_springs = seam_spring_count("sleeve_cuff", (sleeve_v2 - sleeve_v1).length)
     spring_verts = []
     spring_edges = []
     
-    for i in range(num_springs):
-        t = i / (num_springs - 1) if num_springs > 1 else 0.5
-        
-        # Interpolate along each edge
-        p_sleeve = sleeve_v1.lerp(sleeve_v2, t)
-        p_cuff = cuff_v1.lerp(cuff_v2, t)
-        
+    sleeve_points = edge_chain_points([(sleeve_v1, sleeve_v2)], num_springs)
+    cuff_points = edge_chain_points([(cuff_v1, cuff_v2)], num_springs)
+    
+    for p_sleeve, p_cuff in zip(sleeve_points, cuff_points):
         # Add vertices
         v_idx = len(spring_verts)
         spring_verts.append(p_sleeve)
@@ -1281,7 +1845,7 @@ def setup_front_back_panel_seams():
     front_panel = None
     back_panel = None
     
-    for obj in bpy.data.objects:
+    for obj in garment_pieces():
         obj_name = obj.name.lower()
         if "front_panel" in obj_name:
             front_panel = obj
@@ -1317,12 +1881,15 @@ def find_panel_straight_side_edges(front_panel, back_panel, side):
     def find_all_vertical_edges_until_armhole(panel_obj, y_side):
         """Find the main vertical side edge, then trace upward until hitting armhole"""
         mesh = panel_obj.data
-        
+        geometry = get_world_geometry(panel_obj)
+        contour = get_contour_index(panel_obj)
+        if contour is None:
+            return None
         
         # First, find the actual Y boundaries of the panel to remove hardcoded values
-        all_world_verts = [panel_obj.matrix_world @ v.co for v in mesh.vertices]
-        min_y = min(v.y for v in all_world_verts)
-        max_y = max(v.y for v in all_world_verts)
+        all_world_verts = geometry.vectors
+        min_y = geometry.vertices[:, 1].min()
+        max_y = geometry.vertices[:, 1].max()
         center_y = (min_y + max_y) / 2
         
         # Define dynamic thresholds based on actual panel geometry
@@ -1333,97 +1900,39 @@ def find_panel_straight_side_edges(front_panel, back_panel, side):
             # Left side: look for edges on the left half  
             y_threshold = center_y + (min_y - center_y) * 0.3  # 30% into left side
         
-        # Step 1: Find the main vertical side edge (the longest vertical edge on this side)
-        main_side_edge = None
-        best_length = 0
-        vertical_edges_found = 0
-        
-        for edge in mesh.edges:
-            v1 = panel_obj.matrix_world @ mesh.vertices[edge.vertices[0]].co
-            v2 = panel_obj.matrix_world @ mesh.vertices[edge.vertices[1]].co
-            
-            edge_vector = v2 - v1
-            z_component = abs(edge_vector.z)
-            edge_length = edge_vector.length
-            avg_y = (v1.y + v2.y) / 2
-            
-            # Check if this is a vertical edge on the correct side
-            if edge_length > 0:
-                vertical_ratio = z_component / edge_length
-                angle_from_vertical = math.degrees(math.acos(min(1.0, vertical_ratio)))
-                
-                # Must be vertical (within 30 degrees) and on correct side
-                if angle_from_vertical < 30:
-                    vertical_edges_found += 1
-                    
-                    if y_side > 0 and avg_y > y_threshold:  # Right side - dynamic threshold
-                        if edge_length > best_length:
-                            best_length = edge_length
-                            main_side_edge = (edge, v1, v2, avg_y)
-                    elif y_side < 0 and avg_y < y_threshold:  # Left side - dynamic threshold
-                        if edge_length > best_length:
-                            best_length = edge_length
-                            main_side_edge = (edge, v1, v2, avg_y)
-                    
-        
-        
-        if not main_side_edge:
+        starts, ends, vectors, lengths = geometry.edge_geometry
+        avg_y = (starts[:, 1] + ends[:, 1]) / 2
+        on_side = avg_y > y_threshold if y_side > 0 else avg_y < y_threshold
+        
+        # Step 1: Find the main vertical side edge - the longest edge on this side in a vertical run of the outline
+        up = get_local_up(panel_obj)
+        candidates = np.array([
+            edge_index
+            for run in contour.runs(up) if run['orientation'] == 'vertical'
+            for edge_index in run['edges'] if on_side[edge_index]
+        ], dtype=np.int64)
+        if len(candidates) == 0:
             return None
-            
         
-        # Step 2: Find the bottom vertex of this main edge
-        edge, v1, v2, avg_y = main_side_edge
-        bottom_vertex = v1 if v1.z < v2.z else v2
-        top_vertex = v2 if v1.z < v2.z else v1
+        main_index = int(candidates[lengths[candidates].argmax()])
+        edge = mesh.edges[main_index]
+        v1 = all_world_verts[edge.vertices[0]]
+        v2 = all_world_verts[edge.vertices[1]]
         
+        # Step 2: Follow the vertical runs upward from the top of the main edge, stopping before the armhole -
+        # a corner, a run leaning more than 30 degrees or an edge crossing to the other side
+        top_index = edge.vertices[1] if v1.z < v2.z else edge.vertices[0]
+        run_edges, _ = contour.walk_runs(main_index, contour.leads_to(main_index, top_index), up, orientation='vertical')
         
-        # Step 3: Starting from bottom, collect connected vertical edges going upward
         vertical_edges = []
-        current_top_z = top_vertex.z
-        processed_edges = {edge}
-        
-        # Add the main edge first
-        vertical_edges.append((edge, best_length, v1, v2, avg_y, (bottom_vertex.z + top_vertex.z) / 2))
-        
-        # Step 4: Look for connected edges going upward
-        while True:
-            found_next = False
-            
-            for next_edge in mesh.edges:
-                if next_edge in processed_edges:
-                    continue
-                    
-                nv1 = panel_obj.matrix_world @ mesh.vertices[next_edge.vertices[0]].co
-                nv2 = panel_obj.matrix_world @ mesh.vertices[next_edge.vertices[1]].co
-                
-                # Check if this edge connects to the top of our current chain
-                connects_to_top = (abs(nv1.z - current_top_z) < 0.1 or abs(nv2.z - current_top_z) < 0.1)
-                
-                if connects_to_top:
-                    edge_vector = nv2 - nv1
-                    z_component = abs(edge_vector.z)
-                    edge_length = edge_vector.length
-                    navg_y = (nv1.y + nv2.y) / 2
-                    
-                    if edge_length > 0:
-                        vertical_ratio = z_component / edge_length
-                        angle_from_vertical = math.degrees(math.acos(min(1.0, vertical_ratio)))
-                        
-                        # Check if it's still on the same side
-                        on_same_side = (y_side > 0 and navg_y > y_threshold) or (y_side < 0 and navg_y < y_threshold)
-                        
-                        if angle_from_vertical > 35:  # Stop BEFORE armhole (more conservative)
-                            found_next = False
-                            break
-                        elif angle_from_vertical < 30 and on_same_side:  # Must be truly vertical and on same side
-                            vertical_edges.append((next_edge, edge_length, nv1, nv2, navg_y, (nv1.z + nv2.z) / 2))
-                            current_top_z = max(nv1.z, nv2.z)
-                            processed_edges.add(next_edge)
-                            found_next = True
-                            break
-            
-            if not found_next:
+        for edge_index in run_edges:
+            if not on_side[edge_index]:
                 break
+            
+            next_edge = mesh.edges[edge_index]
+            nv1 = all_world_verts[next_edge.vertices[0]]
+            nv2 = all_world_verts[next_edge.vertices[1]]
+            vertical_edges.append((next_edge, float(lengths[edge_index]), nv1, nv2, float(avg_y[edge_index]), (nv1.z + nv2.z) / 2))
         
         return vertical_edges if vertical_edges else None
     
@@ -1451,101 +1960,22 @@ def create_panel_side_springs(front_panel, front_edges_data, back_panel, back_ed
     all_spring_verts = []
     all_spring_edges = []
     
-    # Step 1: Build continuous paths for both front and back edges
+    # Step 1: Chain both sides' edges bottom to top
     min_edges = min(len(front_edges_data), len(back_edges_data))
+    front_pairs = [(edge[2], edge[3]) for edge in front_edges_data[:min_edges]]
+    back_pairs = [(edge[2], edge[3]) for edge in back_edges_data[:min_edges]]
     
-    # Sort edges by Z position (bottom to top)
-    front_edges_sorted = sorted(front_edges_data[:min_edges], key=lambda edge: edge[5])  # Sort by avg_z
-    back_edges_sorted = sorted(back_edges_data[:min_edges], key=lambda edge: edge[5])
-    
-    # Build continuous front path
-    front_path = []
-    for i, front_edge in enumerate(front_edges_sorted):
-        front_v1, front_v2 = front_edge[2], front_edge[3]
-        
-        # Order vertices by Z (bottom to top)
-        if front_v1.z < front_v2.z:
-            front_path.append(front_v1)
-            if i == len(front_edges_sorted) - 1:  # Last edge, add top vertex
-                front_path.append(front_v2)
-        else:
-            front_path.append(front_v2)
-            if i == len(front_edges_sorted) - 1:  # Last edge, add top vertex
-                front_path.append(front_v1)
-    
-    # Build continuous back path
-    back_path = []
-    for i, back_edge in enumerate(back_edges_sorted):
-        back_v1, back_v2 = back_edge[2], back_edge[3]
-        
-        # Order vertices by Z (bottom to top)
-        if back_v1.z < back_v2.z:
-            back_path.append(back_v1)
-            if i == len(back_edges_sorted) - 1:  # Last edge, add top vertex
-                back_path.append(back_v2)
-        else:
-            back_path.append(back_v2)
-            if i == len(back_edges_sorted) - 1:  # Last edge, add top vertex
-                back_path.append(back_v1)
-    
-    # Step 2: Calculate seam length and determine Z range
-    min_z = min(min(v.z for v in front_path), min(v.z for v in back_path))
-    max_z = max(max(v.z for v in front_path), max(v.z for v in back_path))
-    total_z_range = max_z - min_z
+    # Step 2: Determine Z range
+    all_z = [v.z for pair in front_pairs + back_pairs for v in pair]
+    total_z_range = max(all_z) - min(all_z)
     
+    # Step 3: Place stitches evenly along each side's arc length
+    num_stitches = seam_spring_count("panel_side", total_z_range)
     
-    # Step 3: Place stitches evenly along Z axis
-    desired_stitch_spacing = 0.05  # 5cm spacing
-    num_stitches = max(3, int(total_z_range / desired_stitch_spacing))
+    front_points = edge_chain_points(front_pairs, num_stitches, axis=2)
+    back_points = edge_chain_points(back_pairs, num_stitches, axis=2)
     
-    
-    # Step 4: Find positions at specific Z levels
-    for i in range(num_stitches):
-        target_z = min_z + (i / (num_stitches - 1)) * total_z_range if num_stitches > 1 else (min_z + max_z) / 2
-        
-        # Find position along front path at this Z level
-        front_pos = None
-        for j in range(len(front_path) - 1):
-            v1, v2 = front_path[j], front_path[j + 1]
-            z1, z2 = v1.z, v2.z
-            
-            # Check if target_z is between these two vertices
-            if (z1 <= target_z <= z2) or (z2 <= target_z <= z1):
-                # Interpolate between the vertices
-                if abs(z2 - z1) > 0.001:  # Avoid division by zero
-                    t = (target_z - z1) / (z2 - z1)
-                    front_pos = v1.lerp(v2, t)
-                else:
-                    front_pos = v1
-                break
-        
-        # Find position along back path at this same Z level
-        back_pos = None
-        for j in range(len(back_path) - 1):
-            v1, v2 = back_path[j], back_path[j + 1]
-            z1, z2 = v1.z, v2.z
-            
-            # Check if target_z is between these two vertices
-            if (z1 <= target_z <= z2) or (z2 <= target_z <= z1):
-                # Interpolate between the vertices
-                if abs(z2 - z1) > 0.001:  # Avoid division by zero
-                    t = (target_z - z1) / (z2 - z1)
-                    back_pos = v1.lerp(v2, t)
-                else:
-                    back_pos = v1
-                break
-        
-        # Use fallback positions if exact Z match not found
-        if front_pos is None:
-            # Find closest Z position
-            closest_front = min(front_path, key=lambda v: abs(v.z - target_z))
-            front_pos = closest_front
-        
-        if back_pos is None:
-            # Find closest Z position
-            closest_back = min(back_path, key=lambda v: abs(v.z - target_z))
-            back_pos = closest_back
-        
+    for front_pos, back_pos in zip(front_points, back_points):
         # Add stitch vertices and edge
         v_idx = len(all_spring_verts)
         all_spring_verts.append(front_pos)
@@ -1580,7 +2010,7 @@ def setup_waist_band_seam():
     front_panel = None
     back_panel = None
     
-    for obj in bpy.data.objects:
+    for obj in garment_pieces():
         obj_name = obj.name.lower()
         if "waist_band" in obj_name or "waistband" in obj_name:
             waist_band = obj
@@ -1611,39 +2041,24 @@ def setup_waist_band_seam():
     # Create continuous seam connecting waist band to both panels
     create_waist_band_springs(waist_band, waist_band_edge, front_panel, front_bottom_edges, back_panel, back_bottom_edges)
 
-def find_longest_horizontal_edge(obj, position="top"):
-    """Find the single longest horizontal edge at top or bottom of object"""
-    mesh = obj.data
+def horizontal_run_edges_at_level(obj, position="top", level_tolerance=0.05):
+    """Edges of the horizontal runs of a piece's outline whose midpoint is within level_tolerance of its
+    top (or bottom) z, in edge order"""
     
-    horizontal_edges = []
-    target_z = None
-    
-    # Get all vertices in world coordinates
-    world_verts = [obj.matrix_world @ v.co for v in mesh.vertices]
-    
-    if position == "top":
-        target_z = max(v.z for v in world_verts)
-    else:  # bottom
-        target_z = min(v.z for v in world_verts)
+    geometry = get_world_geometry(obj)
+    edges = [edge_index for run in get_contour_runs(obj) if run['orientation'] == 'horizontal' for edge_index in run['edges']]
+    if not edges:
+        return []
     
+    target_z = geometry.vertices[:, 2].max() if position == "top" else geometry.vertices[:, 2].min()
+    edges = np.sort(np.array(edges, dtype=np.int64))
+    avg_z = edge_midpoint_z(geometry.vertices, geometry.edges, edges)
+    return edges[np.abs(avg_z - target_z) < level_tolerance].tolist()
+
+def find_longest_horizontal_edge(obj, position="top"):
+    """Find the single longest horizontal edge at top or bottom of object"""
     
-    for edge in mesh.edges:
-        v1 = obj.matrix_world @ mesh.vertices[edge.vertices[0]].co
-        v2 = obj.matrix_world @ mesh.vertices[edge.vertices[1]].co
-        
-        edge_vector = v2 - v1
-        edge_length = edge_vector.length
-        avg_z = (v1.z + v2.z) / 2
-        
-        # Check if this edge is at the target Z level (within tolerance)
-        if abs(avg_z - target_z) < 0.05 and edge_length > 0:
-            # Check if it's horizontal (runs along Y axis)
-            y_component = abs(edge_vector.y)
-            horizontal_ratio = y_component / edge_length
-            angle_from_horizontal = math.degrees(math.acos(min(1.0, horizontal_ratio)))
-            
-            if angle_from_horizontal < 30:  # Within 30 degrees of horizontal
-                horizontal_edges.append((edge, v1, v2, edge_length, avg_z))
+    horizontal_edges = [get_edge_data(obj, edge_index) for edge_index in horizontal_run_edges_at_level(obj, position)]
     
     if horizontal_edges:
         # Return only the longest edge
@@ -1654,37 +2069,8 @@ def find_longest_horizontal_edge(obj, position="top"):
 
 def find_all_horizontal_edges(obj, position="bottom"):
     """Find ALL horizontal edges at bottom of object (for mirrored panels)"""
-    mesh = obj.data
-    
-    horizontal_edges = []
-    target_z = None
     
-    # Get all vertices in world coordinates
-    world_verts = [obj.matrix_world @ v.co for v in mesh.vertices]
-    
-    if position == "top":
-        target_z = max(v.z for v in world_verts)
-    else:  # bottom
-        target_z = min(v.z for v in world_verts)
-    
-    
-    for edge in mesh.edges:
-        v1 = obj.matrix_world @ mesh.vertices[edge.vertices[0]].co
-        v2 = obj.matrix_world @ mesh.vertices[edge.vertices[1]].co
-        
-        edge_vector = v2 - v1
-        edge_length = edge_vector.length
-        avg_z = (v1.z + v2.z) / 2
-        
-        # Check if this edge is at the target Z level (within tolerance)
-        if abs(avg_z - target_z) < 0.05 and edge_length > 0:
-            # Check if it's horizontal (runs along Y axis)
-            y_component = abs(edge_vector.y)
-            horizontal_ratio = y_component / edge_length
-            angle_from_horizontal = math.degrees(math.acos(min(1.0, horizontal_ratio)))
-            
-            if angle_from_horizontal < 30:  # Within 30 degrees of horizontal
-                horizontal_edges.append((edge, v1, v2, edge_length, avg_z))
+    horizontal_edges = [get_edge_data(obj, edge_index) for edge_index in horizontal_run_edges_at_level(obj, position)]
     
     if horizontal_edges:
         # Sort edges by Y position to create continuous path
@@ -1715,118 +2101,21 @@ def create_waist_band_springs(waist_band, wb_edge_data, front_panel, front_edges
     if wb_v1.y > wb_v2.y:
         wb_v1, wb_v2 = wb_v2, wb_v1
     
-    # Build continuous path from all front panel bottom edges
-    front_vertices = []
-    for edge_data in front_edges_data:
-        edge, v1, v2, length, z = edge_data
-        front_vertices.append(v1)
-        front_vertices.append(v2)
-    
-    # Remove duplicates and sort
-    front_path = []
-    for v in front_vertices:
-        is_new = True
-        for existing in front_path:
-            if (existing - v).length < 0.001:
-                is_new = False
-                break
-        if is_new:
-            front_path.append(v)
-    front_path.sort(key=lambda v: v.y)
-    
-    # Build continuous path from all back panel bottom edges
-    back_vertices = []
-    for edge_data in back_edges_data:
-        edge, v1, v2, length, z = edge_data
-        back_vertices.append(v1)
-        back_vertices.append(v2)
-    
-    # Remove duplicates and sort
-    back_path = []
-    for v in back_vertices:
-        is_new = True
-        for existing in back_path:
-            if (existing - v).length < 0.001:
-                is_new = False
-                break
-        if is_new:
-            back_path.append(v)
-    back_path.sort(key=lambda v: v.y)
-    
-    # Get Y ranges for front and back panels
-    front_y_min = min(v.y for v in front_path)
-    front_y_max = max(v.y for v in front_path)
-    back_y_min = min(v.y for v in back_path)
-    back_y_max = max(v.y for v in back_path)
-    
-
-    # Create stitches for FIRST HALF of waist band to ENTIRE front panel
-    num_stitches_per_panel = 10  # Even spacing
-    
-    
-    # FIRST HALF of waist band (0 to 0.5) connects to ENTIRE front panel
-    for i in range(num_stitches_per_panel):
-        # Position on waist band (first half)
-        wb_t = (i / (num_stitches_per_panel - 1)) * 0.5  # 0 to 0.5
-        wb_pos = wb_v1.lerp(wb_v2, wb_t)
-        
-        # Position on front panel (entire width)
-        front_t = i / (num_stitches_per_panel - 1)  # 0 to 1
-        
-        # Interpolate along front panel path
-        if len(front_path) > 1:
-            total_length = sum((front_path[j+1] - front_path[j]).length for j in range(len(front_path)-1))
-            target_length = front_t * total_length
-            
-            current_length = 0
-            panel_pos = front_path[0]
-            for j in range(len(front_path) - 1):
-                segment_length = (front_path[j+1] - front_path[j]).length
-                if current_length + segment_length >= target_length:
-                    local_t = (target_length - current_length) / segment_length if segment_length > 0 else 0
-                    panel_pos = front_path[j].lerp(front_path[j+1], local_t)
-                    break
-                current_length += segment_length
-        else:
-            panel_pos = front_path[0]
-        
-        # Add stitch
-        v_idx = len(all_spring_verts)
-        all_spring_verts.append(wb_pos)
-        all_spring_verts.append(panel_pos)
-        all_spring_edges.append((v_idx, v_idx + 1))
-    
+    # FIRST HALF of waist band (0 to 0.5) connects to ENTIRE front panel, each panel chained left to right
     # SECOND HALF of waist band (0.5 to 1.0) connects to ENTIRE back panel
-    for i in range(num_stitches_per_panel):
-        # Position on waist band (second half)
-        wb_t = 0.5 + (i / (num_stitches_per_panel - 1)) * 0.5  # 0.5 to 1.0
-        wb_pos = wb_v1.lerp(wb_v2, wb_t)
-        
-        # Position on back panel (entire width)
-        back_t = i / (num_stitches_per_panel - 1)  # 0 to 1
-        
-        # Interpolate along back panel path
-        if len(back_path) > 1:
-            total_length = sum((back_path[j+1] - back_path[j]).length for j in range(len(back_path)-1))
-            target_length = back_t * total_length
-            
-            current_length = 0
-            panel_pos = back_path[0]
-            for j in range(len(back_path) - 1):
-                segment_length = (back_path[j+1] - back_path[j]).length
-                if current_length + segment_length >= target_length:
-                    local_t = (target_length - current_length) / segment_length if segment_length > 0 else 0
-                    panel_pos = back_path[j].lerp(back_path[j+1], local_t)
-                    break
-                current_length += segment_length
-        else:
-            panel_pos = back_path[0]
+    for panel_edges_data, wb_start, wb_end in ((front_edges_data, 0.0, 0.5), (back_edges_data, 0.5, 1.0)):
+        panel_pairs = [(v1, v2) for _, v1, v2, _, _ in panel_edges_data]
+        num_stitches_per_panel = seam_spring_count("waist_band", edge_chain_length(panel_pairs))
         
-        # Add stitch
-        v_idx = len(all_spring_verts)
-        all_spring_verts.append(wb_pos)
-        all_spring_verts.append(panel_pos)
-        all_spring_edges.append((v_idx, v_idx + 1))
+        wb_points = edge_chain_points([(wb_v1, wb_v2)], num_stitches_per_panel, start=wb_start, end=wb_end)
+        panel_points = edge_chain_points(panel_pairs, num_stitches_per_panel, axis=1)
+        
+        for wb_pos, panel_pos in zip(wb_points, panel_points):
+            # Add stitch
+            v_idx = len(all_spring_verts)
+            all_spring_verts.append(wb_pos)
+            all_spring_verts.append(panel_pos)
+            all_spring_edges.append((v_idx, v_idx + 1))
     
     # Create mesh
     spring_mesh.from_pydata(all_spring_verts, all_spring_edges, [])
@@ -1855,7 +2144,7 @@ def setup_pocket_seam():
     pocket = None
     front_panel = None
     
-    for obj in bpy.data.objects:
+    for obj in garment_pieces():
         obj_name = obj.name.lower()
         if "pocket" in obj_name:
             pocket = obj
@@ -1895,49 +2184,14 @@ def create_pocket_springs(pocket, top_edges, bottom_edges, front_panel):
     all_spring_verts = []
     all_spring_edges = []
     
-    # Process top edges
-    for edge_data in top_edges:
-        edge, v1, v2, length, z = edge_data
-        
-        # Order vertices by Y
-        if v1.y > v2.y:
-            v1, v2 = v2, v1
-        
-        # Create stitches along this edge
-        num_stitches = max(3, int(length / 0.05))  # 5cm spacing
-        
-        for i in range(num_stitches):
-            t = i / (num_stitches - 1) if num_stitches > 1 else 0.5
-            
-            # Position on pocket edge
-            pocket_pos = v1.lerp(v2, t)
-            
-            # Find corresponding position on front panel (same X, Y, but on panel surface)
-            panel_pos = Vector((front_panel.location.x, pocket_pos.y, pocket_pos.z))
-            
-            # Add stitch
-            v_idx = len(all_spring_verts)
-            all_spring_verts.append(pocket_pos)
-            all_spring_verts.append(panel_pos)
-            all_spring_edges.append((v_idx, v_idx + 1))
-    
-    # Process bottom edges
-    for edge_data in bottom_edges:
+    # Process top edges, then bottom edges
+    for edge_data in top_edges + bottom_edges:
         edge, v1, v2, length, z = edge_data
         
-        # Order vertices by Y
-        if v1.y > v2.y:
-            v1, v2 = v2, v1
+        # Create stitches along this edge, ordered by Y
+        num_stitches = seam_spring_count("pocket", length)
         
-        # Create stitches along this edge
-        num_stitches = max(3, int(length / 0.05))  # 5cm spacing
-        
-        for i in range(num_stitches):
-            t = i / (num_stitches - 1) if num_stitches > 1 else 0.5
-            
-            # Position on pocket edge
-            pocket_pos = v1.lerp(v2, t)
-            
+        for pocket_pos in edge_chain_points([(v1, v2)], num_stitches, axis=1):
             # Find corresponding position on front panel (same X, Y, but on panel surface)
             panel_pos = Vector((front_panel.location.x, pocket_pos.y, pocket_pos.z))
             
@@ -1974,7 +2228,7 @@ def setup_neck_binding_seam():
     front_panel = None
     back_panel = None
     
-    for obj in bpy.data.objects:
+    for obj in garment_pieces():
         obj_name = obj.name.lower()
         if "neck" in obj_name and "bind" in obj_name:
             neck_binding = obj
@@ -2010,10 +2264,11 @@ def find_neckline_curve(panel_obj):
     """Find the curved neckline edges between shoulder drop-offs"""
     
     mesh = panel_obj.data
-    world_verts = [panel_obj.matrix_world @ v.co for v in mesh.vertices]
+    geometry = get_world_geometry(panel_obj)
+    world_verts = geometry.vectors
     
     # Find approximate top Z (but not absolute max, as shoulders might be higher)
-    max_z = max(v.z for v in world_verts)
+    max_z = geometry.vertices[:, 2].max()
     
     # Different threshold for front vs back panel
     is_front = "front" in panel_obj.name.lower()
@@ -2023,32 +2278,24 @@ def find_neckline_curve(panel_obj):
     else:
         neckline_z_threshold = max_z - 0.15  # Look within 15cm of top for back
     
+    # Find all edges near the top, with their angle from horizontal
+    starts, ends, vectors, lengths = geometry.edge_geometry
+    avg_z = (starts[:, 2] + ends[:, 2]) / 2
+    avg_y = (starts[:, 1] + ends[:, 1]) / 2
+    angles = angles_from_axis(vectors, lengths, 1)
     
-    # Find all edges near the top
     top_edges = []
-    for edge in mesh.edges:
-        v1 = panel_obj.matrix_world @ mesh.vertices[edge.vertices[0]].co
-        v2 = panel_obj.matrix_world @ mesh.vertices[edge.vertices[1]].co
-        avg_z = (v1.z + v2.z) / 2
-        
-        if avg_z > neckline_z_threshold:
-            edge_vector = v2 - v1
-            edge_length = edge_vector.length
-            if edge_length > 0:
-                # Calculate angle from horizontal
-                y_component = abs(edge_vector.y)
-                horizontal_ratio = y_component / edge_length
-                angle_from_horizontal = math.degrees(math.acos(min(1.0, horizontal_ratio)))
-                
-                top_edges.append({
-                    'edge': edge,
-                    'v1': v1,
-                    'v2': v2,
-                    'avg_z': avg_z,
-                    'avg_y': (v1.y + v2.y) / 2,
-                    'angle': angle_from_horizontal,
-                    'length': edge_length
-                })
+    for edge_index in np.flatnonzero((avg_z > neckline_z_threshold) & (lengths > 0)).tolist():
+        edge = mesh.edges[edge_index]
+        top_edges.append({
+            'edge': edge,
+            'v1': world_verts[edge.vertices[0]],
+            'v2': world_verts[edge.vertices[1]],
+            'avg_z': float(avg_z[edge_index]),
+            'avg_y': float(avg_y[edge_index]),
+            'angle': float(angles[edge_index]),
+            'length': float(lengths[edge_index])
+        })
     
     # Sort edges by Y position
     top_edges.sort(key=lambda e: e['avg_y'])
@@ -2169,212 +2416,31 @@ def create_neck_binding_springs(neck_binding, nb_edges_data, front_panel, front_
     all_spring_verts = []
     all_spring_edges = []
     
-    # Build complete neck binding path from ALL edges
-    nb_vertices = []
-    for edge_data in nb_edges_data:
-        edge, v1, v2, length, z = edge_data
-        nb_vertices.append(v1)
-        nb_vertices.append(v2)
-    
-    # Remove duplicates and sort by Y to create continuous path
-    unique_nb = []
-    for v in nb_vertices:
-        is_new = True
-        for existing in unique_nb:
-            if (existing - v).length < 0.001:
-                is_new = False
-                break
-        if is_new:
-            unique_nb.append(v)
-    unique_nb.sort(key=lambda v: v.y)
+    # Neck binding and neckline edges, each chained left to right
+    nb_pairs = [(v1, v2) for _, v1, v2, _, _ in nb_edges_data]
+    front_pairs = [(v1, v2) for _, v1, v2, _, _ in front_neckline]
+    back_pairs = [(v1, v2) for _, v1, v2, _, _ in back_neckline]
     
     # Get the full neck binding Y range
-    nb_y_min = min(v.y for v in unique_nb)
-    nb_y_max = max(v.y for v in unique_nb)
-    nb_total_length = nb_y_max - nb_y_min
-    
-    
-    # Build front neckline path - need to create a connected curve
-    front_edges = []
-    for edge_data in front_neckline:
-        edge, v1, v2, length, z = edge_data
-        front_edges.append((v1, v2))
-    
-    # Build connected path from edges
-    unique_front = []
-    if front_edges:
-        # Start from leftmost edge
-        all_verts = []
-        for v1, v2 in front_edges:
-            all_verts.extend([v1, v2])
-        
-        # Find leftmost vertex as starting point
-        start_vert = min(all_verts, key=lambda v: v.y)
-        unique_front = [start_vert]
-        used_edges = []
-        
-        # Build connected path
-        current = start_vert
-        for _ in range(len(front_edges)):
-            found_next = False
-            for i, (v1, v2) in enumerate(front_edges):
-                if i in used_edges:
-                    continue
-                
-                # Check if this edge connects to current vertex
-                if (current - v1).length < 0.001:
-                    if not any((v2 - existing).length < 0.001 for existing in unique_front):
-                        unique_front.append(v2)
-                        current = v2
-                        used_edges.append(i)
-                        found_next = True
-                        break
-                elif (current - v2).length < 0.001:
-                    if not any((v1 - existing).length < 0.001 for existing in unique_front):
-                        unique_front.append(v1)
-                        current = v1
-                        used_edges.append(i)
-                        found_next = True
-                        break
-            
-            if not found_next:
-                break
-    
-    # If path building failed, fall back to Y-sorting
-    if len(unique_front) < 2:
-        front_path = []
-        for v1, v2 in front_edges:
-            front_path.extend([v1, v2])
-        unique_front = []
-        for v in front_path:
-            is_new = True
-            for existing in unique_front:
-                if (existing - v).length < 0.001:
-                    is_new = False
-                    break
-            if is_new:
-                unique_front.append(v)
-        unique_front.sort(key=lambda v: v.y)
-    
-    # Build back neckline path
-    back_path = []
-    for edge_data in back_neckline:
-        edge, v1, v2, length, z = edge_data
-        back_path.append(v1)
-        back_path.append(v2)
-    
-    # Remove duplicates and sort
-    unique_back = []
-    for v in back_path:
-        is_new = True
-        for existing in unique_back:
-            if (existing - v).length < 0.001:
-                is_new = False
-                break
-        if is_new:
-            unique_back.append(v)
-    unique_back.sort(key=lambda v: v.y)
+    nb_y = [v.y for pair in nb_pairs for v in pair]
+    nb_total_length = max(nb_y) - min(nb_y)
     
     # Calculate how many stitches to create based on neck binding length
     half_nb_length = nb_total_length / 2
-    stitch_spacing = 0.05  # 5cm spacing
-    num_stitches_per_half = max(5, int(half_nb_length / stitch_spacing))
-    
-    
-    # First FULL half of neck binding to ENTIRE front neckline
-    for i in range(num_stitches_per_half):
-        # Position on neck binding - spread across FULL first half
-        nb_t = (i / (num_stitches_per_half - 1) if num_stitches_per_half > 1 else 0) * 0.5  # 0 to 0.5
-        
-        # Interpolate along the complete neck binding path
-        if len(unique_nb) > 1:
-            path_length = sum((unique_nb[j+1] - unique_nb[j]).length for j in range(len(unique_nb)-1))
-            target_length = nb_t * path_length
-            
-            current_length = 0
-            nb_pos = unique_nb[0]
-            for j in range(len(unique_nb) - 1):
-                segment_length = (unique_nb[j+1] - unique_nb[j]).length
-                if current_length + segment_length >= target_length:
-                    local_t = (target_length - current_length) / segment_length if segment_length > 0 else 0
-                    nb_pos = unique_nb[j].lerp(unique_nb[j+1], local_t)
-                    break
-                current_length += segment_length
-        else:
-            nb_pos = unique_nb[0] if unique_nb else Vector((0, 0, 0))
-        
-        # Position on front neckline - spread across ENTIRE front neckline
-        if len(unique_front) > 1:
-            front_t = i / (num_stitches_per_half - 1)  # 0 to 1 across full front neckline
-            total_length = sum((unique_front[j+1] - unique_front[j]).length for j in range(len(unique_front)-1))
-            target_length = front_t * total_length
-            
-            current_length = 0
-            panel_pos = unique_front[0]
-            for j in range(len(unique_front) - 1):
-                segment_length = (unique_front[j+1] - unique_front[j]).length
-                if current_length + segment_length >= target_length:
-                    local_t = (target_length - current_length) / segment_length if segment_length > 0 else 0
-                    panel_pos = unique_front[j].lerp(unique_front[j+1], local_t)
-                    break
-                current_length += segment_length
-        else:
-            panel_pos = unique_front[0] if unique_front else nb_pos
-        
-        # Add stitch
-        v_idx = len(all_spring_verts)
-        all_spring_verts.append(nb_pos)
-        all_spring_verts.append(panel_pos)
-        all_spring_edges.append((v_idx, v_idx + 1))
-        
-
+    num_stitches_per_half = seam_spring_count("neck_binding", half_nb_length)
     
-    # Second FULL half of neck binding to ENTIRE back neckline
-    for i in range(num_stitches_per_half):
-        # Position on neck binding - spread across FULL second half
-        nb_t = 0.5 + (i / (num_stitches_per_half - 1) if num_stitches_per_half > 1 else 0) * 0.5  # 0.5 to 1.0
-        
-        # Interpolate along the complete neck binding path
-        if len(unique_nb) > 1:
-            path_length = sum((unique_nb[j+1] - unique_nb[j]).length for j in range(len(unique_nb)-1))
-            target_length = nb_t * path_length
-            
-            current_length = 0
-            nb_pos = unique_nb[0]
-            for j in range(len(unique_nb) - 1):
-                segment_length = (unique_nb[j+1] - unique_nb[j]).length
-                if current_length + segment_length >= target_length:
-                    local_t = (target_length - current_length) / segment_length if segment_length > 0 else 0
-                    nb_pos = unique_nb[j].lerp(unique_nb[j+1], local_t)
-                    break
-                current_length += segment_length
-        else:
-            nb_pos = unique_nb[-1] if unique_nb else Vector((0, 0, 0))
-        
-        # Position on back neckline - spread across ENTIRE back neckline
-        if len(unique_back) > 1:
-            back_t = i / (num_stitches_per_half - 1) if num_stitches_per_half > 1 else 0.5  # 0 to 1 across full back neckline
-            total_length = sum((unique_back[j+1] - unique_back[j]).length for j in range(len(unique_back)-1))
-            target_length = back_t * total_length
-            
-            current_length = 0
-            panel_pos = unique_back[0]
-            for j in range(len(unique_back) - 1):
-                segment_length = (unique_back[j+1] - unique_back[j]).length
-                if current_length + segment_length >= target_length:
-                    local_t = (target_length - current_length) / segment_length if segment_length > 0 else 0
-                    panel_pos = unique_back[j].lerp(unique_back[j+1], local_t)
-                    break
-                current_length += segment_length
-        else:
-            panel_pos = unique_back[0] if unique_back else nb_pos
-        
-        v_idx = len(all_spring_verts)
-        all_spring_verts.append(nb_pos)
-        all_spring_verts.append(panel_pos)
-        all_spring_edges.append((v_idx, v_idx + 1))
+    # First FULL half of neck binding to ENTIRE front neckline,
+    # second FULL half of neck binding to ENTIRE back neckline
+    for panel_pairs, nb_start, nb_end in ((front_pairs, 0.0, 0.5), (back_pairs, 0.5, 1.0)):
+        nb_points = edge_chain_points(nb_pairs, num_stitches_per_half, axis=1, start=nb_start, end=nb_end)
+        panel_points = edge_chain_points(panel_pairs, num_stitches_per_half, axis=1) if panel_pairs else nb_points
         
-
+        for nb_pos, panel_pos in zip(nb_points, panel_points):
+            # Add stitch
+            v_idx = len(all_spring_verts)
+            all_spring_verts.append(nb_pos)
+            all_spring_verts.append(panel_pos)
+            all_spring_edges.append((v_idx, v_idx + 1))
     
     # Create mesh
     spring_mesh.from_pydata(all_spring_verts, all_spring_edges, [])
@@ -2403,7 +2469,7 @@ def setup_shoulder_seams():
     front_panel = None
     back_panel = None
     
-    for obj in bpy.data.objects:
+    for obj in garment_pieces():
         obj_name = obj.name.lower()
         if "front_panel" in obj_name:
             front_panel = obj
@@ -2429,75 +2495,34 @@ def setup_shoulder_seams():
     create_shoulder_springs(front_panel, front_left, back_panel, back_left, "left")
     create_shoulder_springs(front_panel, front_right, back_panel, back_right, "right")
 
-def find_shoulder_edges(panel_obj):
-    """Find the left and right shoulder edges (the diagonal edges we excluded from neckline)"""
-    
-    mesh = panel_obj.data
-    world_verts = [panel_obj.matrix_world @ v.co for v in mesh.vertices]
-    
-    # Find approximate top Z
-    max_z = max(v.z for v in world_verts)
-    shoulder_z_threshold = max_z - 0.15  # Look within 15cm of top
-    
-    
-    # Find all edges near the top
-    top_edges = []
-    for edge in mesh.edges:
-        v1 = panel_obj.matrix_world @ mesh.vertices[edge.vertices[0]].co
-        v2 = panel_obj.matrix_world @ mesh.vertices[edge.vertices[1]].co
-        avg_z = (v1.z + v2.z) / 2
-        
-        if avg_z > shoulder_z_threshold:
-            edge_vector = v2 - v1
-            edge_length = edge_vector.length
-            if edge_length > 0:
-                # Calculate angle from horizontal
-                y_component = abs(edge_vector.y)
-                horizontal_ratio = y_component / edge_length
-                angle_from_horizontal = math.degrees(math.acos(min(1.0, horizontal_ratio)))
-                
-                top_edges.append({
-                    'edge': edge,
-                    'v1': v1,
-                    'v2': v2,
-                    'avg_z': avg_z,
-                    'avg_y': (v1.y + v2.y) / 2,
-                    'angle': angle_from_horizontal,
-                    'length': edge_length
-                })
-    
-    # Find shoulder edges (diagonal, relatively straight - what we excluded from neckline)
-    shoulder_threshold = 45  # Degrees
-    potential_shoulders = [e for e in top_edges if 15 < e['angle'] < shoulder_threshold]
-    
-    if len(potential_shoulders) < 2:
+def find_shoulder_edges(panel_obj, top_band=0.15, min_angle=15, max_angle=45):
+    """Find the left and right shoulder edges (the diagonal edges we excluded from neckline) - the
+    edge_data lists of the outermost outline runs in y within top_band of the top that slope min_angle..max_angle
+    degrees from horizontal"""
+    
+    geometry = get_world_geometry(panel_obj)
+    runs = get_contour_runs(panel_obj)
+    if not runs:
         return None
     
-    # Find leftmost and rightmost shoulders
-    left_shoulder = min(potential_shoulders, key=lambda e: e['avg_y'])
-    right_shoulder = max(potential_shoulders, key=lambda e: e['avg_y'])
-    
-    
-    # Convert to edge data format
-    left_edge_data = (
-        left_shoulder['edge'],
-        left_shoulder['v1'],
-        left_shoulder['v2'],
-        left_shoulder['length'],
-        left_shoulder['avg_z']
-    )
+    # Runs sloping like a shoulder whose chord midpoint is within 15cm of the top - what we excluded from neckline
+    top_z = geometry.vertices[:, 2].max()
+    candidates = []
+    for run in runs:
+        ends = geometry.vertices[[run['vertices'][0], run['vertices'][-1]]]
+        mid_y, mid_z = ends[:, 1].mean(), ends[:, 2].mean()
+        if mid_z > top_z - top_band and 90 - max_angle < run['angle'] < 90 - min_angle:
+            candidates.append((mid_y, run['edges']))
     
-    right_edge_data = (
-        right_shoulder['edge'],
-        right_shoulder['v1'],
-        right_shoulder['v2'],
-        right_shoulder['length'],
-        right_shoulder['avg_z']
-    )
+    if len(candidates) < 2:
+        return None
     
-    return (left_edge_data, right_edge_data)
+    left = min(candidates, key=lambda candidate: candidate[0])[1]
+    right = max(candidates, key=lambda candidate: candidate[0])[1]
+    return ([get_edge_data(panel_obj, edge_index) for edge_index in left],
+            [get_edge_data(panel_obj, edge_index) for edge_index in right])
 
-def create_shoulder_springs(front_panel, front_edge_data, back_panel, back_edge_data, side):
+def create_shoulder_springs(front_panel, front_edges_data, back_panel, back_edges_data, side):
     """Create sewing springs between shoulder edges"""
     
     # Create spring mesh
@@ -2513,35 +2538,24 @@ def create_shoulder_springs(front_panel, front_edge_data, back_panel, back_edge_
     all_spring_edges = []
     
     # Extract edge vertices
-    front_edge, front_v1, front_v2, front_length, front_z = front_edge_data
-    back_edge, back_v1, back_v2, back_length, back_z = back_edge_data
+    front_pairs = [(edge[1], edge[2]) for edge in front_edges_data]
+    back_pairs = [(edge[1], edge[2]) for edge in back_edges_data]
     
-    # Order vertices consistently (by Y position)
-    if front_v1.y > front_v2.y:
-        front_v1, front_v2 = front_v2, front_v1
-    if back_v1.y > back_v2.y:
-        back_v1, back_v2 = back_v2, back_v1
+    # Create stitches along each shoulder, both chained by Y position
+    num_stitches = seam_spring_count("shoulder", min(edge_chain_length(front_pairs), edge_chain_length(back_pairs)))
     
-    # Check alignment to prevent crossing
-    dist_same = (front_v1 - back_v1).length + (front_v2 - back_v2).length
-    dist_crossed = (front_v1 - back_v2).length + (front_v2 - back_v1).length
     
-    if dist_crossed < dist_same:
-        back_v1, back_v2 = back_v2, back_v1
+    front_points = edge_chain_points(front_pairs, num_stitches, axis=1)
+    back_points = edge_chain_points(back_pairs, num_stitches, axis=1)
     
-    # Create stitches along shoulder edge
-    num_stitches = max(3, int(min(front_length, back_length) / 0.05))  # 5cm spacing
+    # Check alignment to prevent crossing
+    dist_same = (front_points[0] - back_points[0]).length + (front_points[-1] - back_points[-1]).length
+    dist_crossed = (front_points[0] - back_points[-1]).length + (front_points[-1] - back_points[0]).length
     
+    if dist_crossed < dist_same:
+        back_points.reverse()
     
-    for i in range(num_stitches):
-        t = i / (num_stitches - 1) if num_stitches > 1 else 0.5
-        
-        # Position on front shoulder
-        front_pos = front_v1.lerp(front_v2, t)
-        
-        # Position on back shoulder
-        back_pos = back_v1.lerp(back_v2, t)
-        
+    for front_pos, back_pos in zip(front_points, back_points):
         # Add stitch
         v_idx = len(all_spring_verts)
         all_spring_verts.append(front_pos)
@@ -2570,8 +2584,7 @@ def get_front_panel_edges():
     for obj in bpy.data.objects:
         if "front_panel" in obj.name.lower():
             if obj.data and obj.data.vertices:
-                verts = obj.data.vertices
-                world_verts = [obj.matrix_world @ v.co for v in verts]
+                world_verts = get_world_geometry(obj).vectors
                 min_y = min(v.y for v in world_verts)
                 max_y = max(v.y for v in world_verts)
                 return (min_y, max_y)
@@ -2582,7 +2595,7 @@ def setup_sleeve_horizontal_seams():
     """Connect top and bottom horizontal edges of each sleeve"""
     
     sleeve_objects = []
-    for obj in bpy.data.objects:
+    for obj in garment_pieces():
         if "_sleeve_" in obj.name.lower() and "_sleeve_cuff_" not in obj.name.lower() and obj.data and obj.data.vertices and not obj.name.startswith("SewingSpring"):
             sleeve_objects.append(obj)
     
@@ -2603,86 +2616,16 @@ def find_sleeve_horizontal_edges(sleeve_obj):
     if not sleeve_obj.data or not sleeve_obj.data.edges:
         return None, None
     
-    mesh = sleeve_obj.data
-    bpy.context.view_layer.objects.active = sleeve_obj
-    sleeve_obj.select_set(True)
-    
-    bpy.ops.object.mode_set(mode='EDIT')
-    bm = bmesh.from_edit_mesh(mesh)
-    bm.edges.ensure_lookup_table()
-    
-    horizontal_edges = []
- 
-    for edge in bm.edges:
-        v1 = sleeve_obj.matrix_world @ edge.verts[0].co
-        v2 = sleeve_obj.matrix_world @ edge.verts[1].co
-        
-        edge_vector = v2 - v1
-        y_component = abs(edge_vector.y)
-        z_component = abs(edge_vector.z)
-        x_component = abs(edge_vector.x)
-        avg_z = (v1.z + v2.z) / 2
-        
-        # More relaxed for sleeves: Y should be dominant but allow more Z variation for curves
-        if y_component > 0.1 and y_component > z_component * 0.7 and y_component > x_component:
-            edge_data = {
-                'v1_world': v1,
-                'v2_world': v2,
-                'avg_z': avg_z,
-                'length': edge_vector.length
-            }
-            horizontal_edges.append(edge_data)
-        
-    
-    total_edges = len(bm.edges)
-    bpy.ops.object.mode_set(mode='OBJECT')
-    
-    
-    if not horizontal_edges:
+    geometry = get_world_geometry(sleeve_obj)
+    top_indices, bottom_indices = sleeve_horizontal_edges(geometry.vertices, geometry.edges)
+    if top_indices is None:
         return None, None
     
-    # Sort by Z position to find top and bottom
-    horizontal_edges.sort(key=lambda e: e['avg_z'])
+    def edge_dict(edge_index):
+        _, v1, v2, length, avg_z = get_edge_data(sleeve_obj, edge_index)
+        return {'v1_world': v1, 'v2_world': v2, 'avg_z': avg_z, 'length': length}
     
-    # For curved sleeves with Z-dipping, we need to group by Y position, not just Z level
-    if len(horizontal_edges) >= 2:
-        
-        # Group edges by Y overlap regions
-        def get_y_range(edge):
-            y1, y2 = edge['v1_world'].y, edge['v2_world'].y
-            return min(y1, y2), max(y1, y2)
-        
-        # Find overall Y span
-        all_y_coords = []
-        for edge in horizontal_edges:
-            y_min, y_max = get_y_range(edge)
-            all_y_coords.extend([y_min, y_max])
-        
-        overall_y_min = min(all_y_coords)
-        overall_y_max = max(all_y_coords)
-        
-        
-        # Separate into top and bottom based on Z at each Y position
-        # Find Z range first
-        all_z_coords = [edge['avg_z'] for edge in horizontal_edges]
-        z_mid = (min(all_z_coords) + max(all_z_coords)) / 2
-        
-        top_edges = [e for e in horizontal_edges if e['avg_z'] >= z_mid]
-        bottom_edges = [e for e in horizontal_edges if e['avg_z'] < z_mid]
-        
-        
-        if len(top_edges) == 0 or len(bottom_edges) == 0:
-            # Fallback to original method if split doesn't work
-            z_tolerance = 0.2
-            bottom_candidates = [e for e in horizontal_edges if abs(e['avg_z'] - horizontal_edges[0]['avg_z']) < z_tolerance]
-            top_candidates = [e for e in horizontal_edges if abs(e['avg_z'] - horizontal_edges[-1]['avg_z']) < z_tolerance]
-            
-            
-            return top_candidates, bottom_candidates
-        
-        return top_edges, bottom_edges
-    else:
-        return None, None
+    return [edge_dict(i) for i in top_indices], [edge_dict(i) for i in bottom_indices]
 
 def create_sleeve_horizontal_springs(sleeve_obj, top_edges, bottom_edges):
     """Create sewing springs between top and bottom horizontal edges - same as cuff approach"""
@@ -2702,73 +2645,19 @@ def create_sleeve_horizontal_springs(sleeve_obj, top_edges, bottom_edges):
     all_spring_edges = []
     vert_index = 0
     
-    # Combine all edge segments into continuous paths with proper interpolation
-    def create_interpolated_points(edges, num_points=10):
-        # Sort edges by Y position
-        edges.sort(key=lambda e: min(e['v1_world'].y, e['v2_world'].y))
-        
-        # Find overall Y range
-        all_y_coords = []
-        for edge in edges:
-            all_y_coords.extend([edge['v1_world'].y, edge['v2_world'].y])
-        
-        y_min = min(all_y_coords)
-        y_max = max(all_y_coords)
-        
-        
-        interpolated_points = []
-        
-        # Create evenly spaced points across the Y range
-        for i in range(num_points):
-            if num_points == 1:
-                target_y = (y_min + y_max) / 2
-            else:
-                t = i / (num_points - 1)
-                target_y = y_min + t * (y_max - y_min)
-            
-            # Find the edge segment that contains this Y position
-            best_point = None
-            for edge in edges:
-                v1, v2 = edge['v1_world'], edge['v2_world']
-                edge_y_min = min(v1.y, v2.y)
-                edge_y_max = max(v1.y, v2.y)
-                
-                # If target Y is within this edge's Y range
-                if edge_y_min <= target_y <= edge_y_max:
-                    # Interpolate along this edge
-                    if abs(v2.y - v1.y) > 0.001:  # Avoid division by zero
-                        t_edge = (target_y - v1.y) / (v2.y - v1.y)
-                        t_edge = max(0, min(1, t_edge))  # Clamp to [0,1]
-                        best_point = v1 + t_edge * (v2 - v1)
-                        break
-            
-            # If no edge contains this Y, find closest edge endpoint
-            if best_point is None:
-                min_dist = float('inf')
-                for edge in edges:
-                    for vertex in [edge['v1_world'], edge['v2_world']]:
-                        dist = abs(vertex.y - target_y)
-                        if dist < min_dist:
-                            min_dist = dist
-                            best_point = vertex
-            
-            if best_point:
-                interpolated_points.append(best_point)
-        
-        return interpolated_points
-    
-    # Create interpolated points for top and bottom edges
-    num_stitches = 10
-    top_points = create_interpolated_points(top_edges, num_stitches)
-    bottom_points = create_interpolated_points(bottom_edges, num_stitches)
-    
-    
-    # Create vertical stitches connecting corresponding points
-    num_connections = min(len(top_points), len(bottom_points))
-    
-    for i in range(num_connections):
-        top_point = top_points[i]
-        bottom_point = bottom_points[i]
+    # Create evenly spaced points along the top and bottom edges, chained along Y
+    top_pairs = [(e['v1_world'], e['v2_world']) for e in top_edges]
+    num_stitches = seam_spring_count("sleeve", edge_chain_length(top_pairs))
+    top_points = edge_chain_points(top_pairs, num_stitches, axis=1)
+    bottom_points = edge_chain_points([(e['v1_world'], e['v2_world']) for e in bottom_edges], num_stitches, axis=1)
+    
+    
+    # Create vertical stitches connecting corresponding points
+    num_connections = min(len(top_points), len(bottom_points))
+    
+    for i in range(num_connections):
+        top_point = top_points[i]
+        bottom_point = bottom_points[i]
         
         
         all_spring_verts.extend([top_point, bottom_point])
@@ -2807,7 +2696,7 @@ def setup_sleeve_cuff_horizontal_seams():
     
     
     cuff_objects = []
-    for obj in bpy.data.objects:
+    for obj in garment_pieces():
         if "_sleeve_cuff_" in obj.name.lower() and obj.data and obj.data.vertices and not obj.name.startswith("SewingSpring"):
             cuff_objects.append(obj)
     
@@ -2830,79 +2719,16 @@ def find_sleeve_cuff_horizontal_edges(cuff_obj):
     if not cuff_obj.data or not cuff_obj.data.edges:
         return None, None
     
-    mesh = cuff_obj.data
-    bpy.context.view_layer.objects.active = cuff_obj
-    cuff_obj.select_set(True)
-    
-    bpy.ops.object.mode_set(mode='EDIT')
-    bm = bmesh.from_edit_mesh(mesh)
-    bm.edges.ensure_lookup_table()
-    
-    horizontal_edges = []
-    
-    # Get mesh X bounds for back side detection
-    all_x_coords = [cuff_obj.matrix_world @ v.co for v in cuff_obj.data.vertices]
-    min_x = min(coord.x for coord in all_x_coords)
-    max_x = max(coord.x for coord in all_x_coords)
-    x_threshold = min_x + (max_x - min_x) * 0.5
-    
-    # Analyze ALL edges first
-    all_edges_info = []
-    
-    for edge in bm.edges:
-        v1 = cuff_obj.matrix_world @ edge.verts[0].co
-        v2 = cuff_obj.matrix_world @ edge.verts[1].co
-        
-        edge_vector = v2 - v1
-        y_component = abs(edge_vector.y)
-        z_component = abs(edge_vector.z)
-        x_component = abs(edge_vector.x)
-        avg_z = (v1.z + v2.z) / 2
-        avg_x = (v1.x + v2.x) / 2
-        
-        all_edges_info.append({
-            'y': y_component,
-            'z': z_component, 
-            'x': x_component,
-            'avg_z': avg_z,
-            'avg_x': avg_x,
-            'length': edge_vector.length
-        })
-        
-        # More relaxed: Y should be dominant component (removed back side filter - cuff is too thin)
-        if y_component > 0.1 and y_component > z_component and y_component > x_component:
-            edge_data = {
-                'edge': edge,
-                'v1_world': v1,
-                'v2_world': v2,
-                'avg_z': avg_z,
-                'length': edge_vector.length
-            }
-            horizontal_edges.append(edge_data)
-        
-    
-    bpy.ops.object.mode_set(mode='OBJECT')
-    
-    
-    if not horizontal_edges:
-        # Show the edge with highest Y component for debugging
-        if all_edges_info:
-            best_y = max(all_edges_info, key=lambda e: e['y'])
+    geometry = get_world_geometry(cuff_obj)
+    top_indices, bottom_indices = cuff_horizontal_edges(geometry.vertices, geometry.edges)
+    if top_indices is None:
         return None, None
     
-    # Sort by Z position to find top and bottom
-    horizontal_edges.sort(key=lambda e: e['avg_z'])
+    def edge_dict(edge_index):
+        edge, v1, v2, length, avg_z = get_edge_data(cuff_obj, edge_index)
+        return {'edge': edge, 'v1_world': v1, 'v2_world': v2, 'avg_z': avg_z, 'length': length}
     
-    # Filter to get only the actual top and bottom edges (collect ALL edges at each Z level)
-    if len(horizontal_edges) >= 2:
-        # Group edges by similar Z values 
-        bottom_candidates = [e for e in horizontal_edges if abs(e['avg_z'] - horizontal_edges[0]['avg_z']) < 0.05]
-        top_candidates = [e for e in horizontal_edges if abs(e['avg_z'] - horizontal_edges[-1]['avg_z']) < 0.05]
-        
-   
-        return top_candidates, bottom_candidates
-    else:
-        return None, None
+    return [edge_dict(i) for i in top_indices], [edge_dict(i) for i in bottom_indices]
 
 def create_sleeve_cuff_horizontal_springs(cuff_obj, top_edges, bottom_edges):
     """Create sewing springs between top and bottom horizontal edges"""
@@ -2921,65 +2747,11 @@ def create_sleeve_cuff_horizontal_springs(cuff_obj, top_edges, bottom_edges):
     all_spring_edges = []
     vert_index = 0
     
-    # Combine all edge segments into continuous paths with proper interpolation
-    def create_interpolated_points(edges, num_points=12):
-        # Sort edges by Y position
-        edges.sort(key=lambda e: min(e['v1_world'].y, e['v2_world'].y))
-        
-        # Find overall Y range
-        all_y_coords = []
-        for edge in edges:
-            all_y_coords.extend([edge['v1_world'].y, edge['v2_world'].y])
-        
-        y_min = min(all_y_coords)
-        y_max = max(all_y_coords)
-        
-        
-        interpolated_points = []
-        
-        # Create evenly spaced points across the Y range
-        for i in range(num_points):
-            if num_points == 1:
-                target_y = (y_min + y_max) / 2
-            else:
-                t = i / (num_points - 1)
-                target_y = y_min + t * (y_max - y_min)
-            
-            # Find the edge segment that contains this Y position
-            best_point = None
-            for edge in edges:
-                v1, v2 = edge['v1_world'], edge['v2_world']
-                edge_y_min = min(v1.y, v2.y)
-                edge_y_max = max(v1.y, v2.y)
-                
-                # If target Y is within this edge's Y range
-                if edge_y_min <= target_y <= edge_y_max:
-                    # Interpolate along this edge
-                    if abs(v2.y - v1.y) > 0.001:  # Avoid division by zero
-                        t_edge = (target_y - v1.y) / (v2.y - v1.y)
-                        t_edge = max(0, min(1, t_edge))  # Clamp to [0,1]
-                        best_point = v1 + t_edge * (v2 - v1)
-                        break
-            
-            # If no edge contains this Y, find closest edge endpoint
-            if best_point is None:
-                min_dist = float('inf')
-                for edge in edges:
-                    for vertex in [edge['v1_world'], edge['v2_world']]:
-                        dist = abs(vertex.y - target_y)
-                        if dist < min_dist:
-                            min_dist = dist
-                            best_point = vertex
-            
-            if best_point:
-                interpolated_points.append(best_point)
-        
-        return interpolated_points
-    
-    # Create interpolated points for top and bottom edges
-    num_stitches = 10
-    top_points = create_interpolated_points(top_edges, num_stitches)
-    bottom_points = create_interpolated_points(bottom_edges, num_stitches)
+    # Create evenly spaced points along the top and bottom edges, chained along Y
+    top_pairs = [(e['v1_world'], e['v2_world']) for e in top_edges]
+    num_stitches = seam_spring_count("sleeve_cuff_closing", edge_chain_length(top_pairs))
+    top_points = edge_chain_points(top_pairs, num_stitches, axis=1)
+    bottom_points = edge_chain_points([(e['v1_world'], e['v2_world']) for e in bottom_edges], num_stitches, axis=1)
     
     
     # Create vertical stitches connecting corresponding points
@@ -3021,223 +2793,17 @@ def create_sleeve_cuff_horizontal_springs(cuff_obj, top_edges, bottom_edges):
         cloth_mod.settings.use_sewing_springs = True
         cloth_mod.settings.sewing_force_max = 0.5
 
-def markSeam(mesh_obj):
-    if not mesh_obj:
-        return None
-        
-    bpy.context.view_layer.objects.active = mesh_obj
-    mesh_obj.select_set(True)
-    
-    bpy.ops.object.mode_set(mode='EDIT')
-    bpy.ops.mesh.select_mode(type='EDGE')
-    bpy.ops.mesh.select_all(action='SELECT')
+def mark_seams(mesh_objs):
+    """Mark every edge of each piece as a seam - written to the edge data, no operators or edit mode"""
     
-    bpy.ops.mesh.mark_seam(clear=False)
-    bpy.ops.object.mode_set(mode='OBJECT')
-    
-    return mesh_obj
+    for mesh_obj in mesh_objs:
+        mesh = mesh_obj.data
+        mesh.edges.foreach_set("use_seam", np.ones(len(mesh.edges), dtype=bool))
+        mesh.update()
 
 
 
 
-def find_mirror_line_and_visualize(coordinates, part_name="test"):
-    points = []
-    for i in range(0, len(coordinates)-1, 2):
-        if i+1 < len(coordinates):
-            points.append((coordinates[i], coordinates[i+1]))
-    
-    if len(points) < 4:
-        return None
-    
-    min_x = min(p[0] for p in points)
-    max_x = max(p[0] for p in points)
-    min_y = min(p[1] for p in points)
-    max_y = max(p[1] for p in points)
-    
-    center_x = (min_x + max_x) / 2
-    center_y = (min_y + max_y) / 2
-    
-    best_mirror_line = None
-    best_symmetry_score = 0
-    best_angle = 0
-    
-    num_test_angles = 18
-    for i in range(num_test_angles):
-        angle = i * math.pi / num_test_angles
-        
-        line_direction = (math.cos(angle), math.sin(angle))
-        line_length = max(max_x - min_x, max_y - min_y) * 2
-        
-        line_start = (center_x - line_direction[0] * line_length, center_y - line_direction[1] * line_length)
-        line_end = (center_x + line_direction[0] * line_length, center_y + line_direction[1] * line_length)
-        
-        symmetry_score = calculate_mirror_symmetry_score(points, (line_start, line_end))
-        
-        
-        if symmetry_score > best_symmetry_score:
-            best_symmetry_score = symmetry_score
-            best_mirror_line = (line_start, line_end)
-            best_angle = angle
-    
-    
-    if best_mirror_line and best_symmetry_score > 0.4:
-        return best_mirror_line
-    else:
-        return None
-
-def calculate_mirror_symmetry_score(points, mirror_line):
-    line_start, line_end = mirror_line
-    
-    matches = 0
-    total_points = len(points)
-    
-    for point in points:
-        mirrored_point = mirror_point_across_line(point, line_start, line_end)
-        
-        min_distance = float('inf')
-        for other_point in points:
-            distance = math.sqrt((mirrored_point[0] - other_point[0])**2 + (mirrored_point[1] - other_point[1])**2)
-            min_distance = min(min_distance, distance)
-        
-        tolerance = 50
-        if min_distance < tolerance:
-            matches += 1
-    
-    return matches / total_points if total_points > 0 else 0
-
-def mirror_point_across_line(point, line_start, line_end):
-    px, py = point
-    x1, y1 = line_start
-    x2, y2 = line_end
-    
-    dx = x2 - x1
-    dy = y2 - y1
-    
-    if dx == 0 and dy == 0:
-        return point
-    
-    t = ((px - x1) * dx + (py - y1) * dy) / (dx * dx + dy * dy)
-    
-    closest_x = x1 + t * dx
-    closest_y = y1 + t * dy
-    
-    mirrored_x = 2 * closest_x - px
-    mirrored_y = 2 * closest_y - py
-    
-    return (mirrored_x, mirrored_y)
-
-def auto_orient_sleeve(coordinates):
-    
-    mirror_line = find_mirror_line_and_visualize(coordinates, "sleeve")
-    if mirror_line:
-        
-        aligned_coords = align_mirror_line_to_y_axis(coordinates, mirror_line)
-        return aligned_coords
-    else:
-        return coordinates
-
-def align_mirror_line_to_y_axis(coordinates, mirror_line):
-    line_start, line_end = mirror_line
-    
-    mirror_dx = line_end[0] - line_start[0]
-    mirror_dy = line_end[1] - line_start[1]
-    current_angle = math.atan2(mirror_dy, mirror_dx)
-    
-    target_angle = 0
-    rotation_needed = target_angle - current_angle
-
-    points = []
-    for i in range(0, len(coordinates)-1, 2):
-        if i+1 < len(coordinates):
-            points.append((coordinates[i], coordinates[i+1]))
-    
-    mirror_center_x = (line_start[0] + line_end[0]) / 2
-    mirror_center_y = (line_start[1] + line_end[1]) / 2
-    
-    rotated_points = []
-    for x, y in points:
-        temp_x = x - mirror_center_x
-        temp_y = y - mirror_center_y
-        
-        cos_angle = math.cos(rotation_needed)
-        sin_angle = math.sin(rotation_needed)
-        new_x = temp_x * cos_angle - temp_y * sin_angle
-        new_y = temp_x * sin_angle + temp_y * cos_angle
-        
-        final_x = new_x + mirror_center_x
-        final_y = new_y + mirror_center_y
-        rotated_points.append((final_x, final_y))
-    
-    final_coords = []
-    for x, y in rotated_points:
-        final_coords.extend([x, y])
-    
-    return final_coords
-
-
-def auto_orient_horizontal_piece(coordinates):
-    points = []
-    for i in range(0, len(coordinates)-1, 2):
-        if i+1 < len(coordinates):
-            points.append((coordinates[i], coordinates[i+1]))
-        
-    best_rotation = 0
-    best_horizontal_span = 0
-    
-    for rotation in [0, 90, 180, 270]:
-        if rotation == 0:
-            test_coords = coordinates
-        else:
-            test_coords = rotate_coordinates(coordinates, rotation)
-        
-        test_points = []
-        for i in range(0, len(test_coords)-1, 2):
-            if i+1 < len(test_coords):
-                test_points.append((test_coords[i], test_coords[i+1]))
-        
-        min_x = min(p[0] for p in test_points)
-        max_x = max(p[0] for p in test_points)
-        horizontal_span = max_x - min_x
-        
-        if horizontal_span > best_horizontal_span:
-            best_horizontal_span = horizontal_span
-            best_rotation = rotation
-    
-    if best_rotation == 0:
-        return coordinates
-    else:
-        return rotate_coordinates(coordinates, best_rotation)
-
-def auto_orient_front_panel(coordinates):
-    for rotation in [0, 90, 180, 270]:
-        if rotation == 0:
-            test_coords = coordinates
-        else:
-            test_coords = rotate_coordinates(coordinates, rotation)
-        
-        points = []
-        for i in range(0, len(test_coords)-1, 2):
-            if i+1 < len(test_coords):
-                points.append((test_coords[i], test_coords[i+1]))
-        
-        if len(points) < 4:
-            continue
-            
-        min_x = min(p[0] for p in points)
-        max_x = max(p[0] for p in points)
-        min_y = min(p[1] for p in points)
-        max_y = max(p[1] for p in points)
-        
-        width = max_x - min_x
-        height = max_y - min_y
-        
-        if height > width:
-            mirrored_coords = mirror_vertically(test_coords)
-            return mirrored_coords
-    
-    mirrored_coords = mirror_vertically(coordinates)
-    return mirrored_coords
-
 def setup_hood_to_panel_connection():
     """Connect hood bottom edge to front and back panel neck curves"""
     
@@ -3247,7 +2813,7 @@ def setup_hood_to_panel_connection():
     front_panel = None
     back_panel = None
     
-    for obj in bpy.data.objects:
+    for obj in garment_pieces():
         obj_name = obj.name.lower()
         if "_hood_" in obj_name and obj.data and obj.data.vertices and not obj.name.startswith("SewingSpring"):
             hood_objects.append(obj)
@@ -3351,7 +2917,7 @@ def setup_sleeve_to_panel_connection():
     
     # Find sleeve objects
     sleeve_objects = []
-    for obj in bpy.data.objects:
+    for obj in garment_pieces():
         obj_name = obj.name.lower()
         if "_sleeve_" in obj_name and not "_cuff_" in obj_name and obj.data and obj.data.vertices and not obj.name.startswith("SewingSpring"):
             sleeve_objects.append(obj)
@@ -3392,7 +2958,7 @@ def setup_sleeve_to_panel_connection():
         front_panel = None
         back_panel = None
         
-        for obj in bpy.data.objects:
+        for obj in garment_pieces():
             obj_name = obj.name.lower()
             if "_front_panel" in obj_name and not obj.name.startswith("SewingSpring"):
                 front_panel = obj
@@ -3446,98 +3012,14 @@ def create_sleeve_to_panel_springs(sleeve_name, sleeve_edges, panel_curve_edges,
     all_spring_edges = []
     vert_index = 0
     
-    # Convert panel curve edges from tuples to dictionary format to match sleeve edges
-    panel_edges = []
-    for edge_data in panel_curve_edges:
-        # Panel curve is a tuple: (edge, v1, v2, length, avg_z)
-        edge, v1, v2, length, avg_z = edge_data
-        panel_edges.append({
-            'v1_world': v1,
-            'v2_world': v2,
-            'avg_z': avg_z,
-            'avg_y': (v1.y + v2.y) / 2,
-            'length': length
-        })
+    # Chain both edge sets by Z coordinate (height) to get proper spatial order
+    sleeve_pairs = [(e['v1_world'], e['v2_world']) for e in sleeve_edges]
+    panel_pairs = [(v1, v2) for _, v1, v2, _, _ in panel_curve_edges]
     
-    # Create horizontal stitch points along Y axis
-    def create_horizontal_stitch_points(edges, num_points=6):
-        if not edges:
-            return []
-        
-        # Find Y range of the edges
-        all_y_coords = []
-        for edge in edges:
-            all_y_coords.extend([edge['v1_world'].y, edge['v2_world'].y])
-        
-        if not all_y_coords:
-            return []
-            
-        min_y = min(all_y_coords)
-        max_y = max(all_y_coords)
-        y_range = max_y - min_y
-        
-        if y_range == 0:
-            # All points at same Y, use center points
-            center_points = []
-            for edge in edges[:num_points]:
-                center = (edge['v1_world'] + edge['v2_world']) / 2
-                center_points.append(center)
-            return center_points
-        
-        # Create evenly spaced Y coordinates
-        stitch_points = []
-        for i in range(num_points):
-            if num_points == 1:
-                target_y = (min_y + max_y) / 2
-            else:
-                target_y = min_y + (i / (num_points - 1)) * y_range
-            
-            # Find the edge closest to this Y coordinate
-            best_edge = None
-            best_distance = float('inf')
-            
-            for edge in edges:
-                edge_center_y = (edge['v1_world'].y + edge['v2_world'].y) / 2
-                distance = abs(edge_center_y - target_y)
-                if distance < best_distance:
-                    best_distance = distance
-                    best_edge = edge
-            
-            if best_edge:
-                # Use center of the best edge
-                center = (best_edge['v1_world'] + best_edge['v2_world']) / 2
-                stitch_points.append(center)
-        
-        return stitch_points
-    
-    # Sort both edge sets by Z coordinate (height) to get proper spatial order
-    sleeve_edges_sorted = sorted(sleeve_edges, key=lambda e: e['avg_z'])
-    panel_edges_sorted = sorted(panel_edges, key=lambda e: e['avg_z'])
-    
-    # Create more stitches for better distribution
-    num_stitches = max(8, min(len(sleeve_edges_sorted), len(panel_edges_sorted)))
-    sleeve_points = []
-    panel_points = []
-    
-    # Get evenly spaced points from sorted sleeve edges
-    for i in range(num_stitches):
-        if len(sleeve_edges_sorted) == 1:
-            edge = sleeve_edges_sorted[0]
-        else:
-            edge_index = int(i * (len(sleeve_edges_sorted) - 1) / (num_stitches - 1))
-            edge = sleeve_edges_sorted[edge_index]
-        center = (edge['v1_world'] + edge['v2_world']) / 2
-        sleeve_points.append(center)
-    
-    # Get evenly spaced points from sorted panel edges  
-    for i in range(num_stitches):
-        if len(panel_edges_sorted) == 1:
-            edge = panel_edges_sorted[0]
-        else:
-            edge_index = int(i * (len(panel_edges_sorted) - 1) / (num_stitches - 1))
-            edge = panel_edges_sorted[edge_index]
-        center = (edge['v1_world'] + edge['v2_world']) / 2
-        panel_points.append(center)
+    # Evenly spaced along each side
+    num_stitches = seam_spring_count("sleeve_to_panel", edge_chain_length(sleeve_pairs))
+    sleeve_points = edge_chain_points(sleeve_pairs, num_stitches, axis=2)
+    panel_points = edge_chain_points(panel_pairs, num_stitches, axis=2)
     
     if len(sleeve_points) != len(panel_points):
         min_points = min(len(sleeve_points), len(panel_points))
@@ -3577,67 +3059,40 @@ def find_sleeve_side_start_edge(sleeve_obj):
     if not sleeve_obj.data or not sleeve_obj.data.edges:
         return None
     
-    mesh = sleeve_obj.data
-    bpy.context.view_layer.objects.active = sleeve_obj
-    sleeve_obj.select_set(True)
-    
-    bpy.ops.object.mode_set(mode='EDIT')
-    bm = bmesh.from_edit_mesh(mesh)
-    bm.edges.ensure_lookup_table()
-    
-    # First pass: find ALL valid vertical edges and their Z values
-    valid_edges = []
-    
-    for edge in bm.edges:
-        v1 = sleeve_obj.matrix_world @ edge.verts[0].co
-        v2 = sleeve_obj.matrix_world @ edge.verts[1].co
-        edge_vector = v2 - v1
-        
-        # Check if edge runs mostly vertical on Z
-        z_component = abs(edge_vector.z)
-        y_component = abs(edge_vector.y)
-        x_component = abs(edge_vector.x)
-        
-        # CONDITION 1: Edge must be more vertical (Z) than horizontal (Y)
-        if z_component <= y_component:
-            continue  # Skip horizontal edges
-        
-        # CONDITION 2: Original criteria - edge runs mostly vertical on Z
-        if z_component > 0.02 and z_component > x_component:
-            min_z = min(v1.z, v2.z)  # Lowest Z (bottom of sleeve)
-            avg_y = abs((v1.y + v2.y) / 2)  # Distance from Y=0
-            
-            valid_edges.append({
-                'v1_world': v1,
-                'v2_world': v2,
-                'avg_y': (v1.y + v2.y) / 2,
-                'min_z': min_z,
-                'z_component': z_component,
-                'y_distance': avg_y
-            })
-            
+    geometry = get_world_geometry(sleeve_obj)
+    world_verts = geometry.vectors
+    starts, ends, vectors, lengths = geometry.edge_geometry
+    extents = np.abs(vectors)
     
-    if not valid_edges:
-        bpy.ops.object.mode_set(mode='OBJECT')
+    # Valid edges run mostly vertical on Z - more than on Y (not horizontal) and on X, and over 0.02
+    valid_edges = np.flatnonzero(
+        (extents[:, 2] > extents[:, 1])
+        & (extents[:, 2] > 0.02)
+        & (extents[:, 2] > extents[:, 0])
+    )
+    if len(valid_edges) == 0:
         return None
     
-    # Find the absolute lowest Z among all valid edges
-    lowest_z = min(edge['min_z'] for edge in valid_edges)
-    
-    # Filter edges that are at or very close to the lowest Z (within 0.005 tolerance)
+    # Keep the edges whose bottom is at or very close to the lowest Z (within 0.005 tolerance)
+    min_z = np.minimum(starts[valid_edges, 2], ends[valid_edges, 2])
     z_tolerance = 0.005
-    lowest_z_edges = [edge for edge in valid_edges if edge['min_z'] <= lowest_z + z_tolerance]
-    
+    lowest_z_edges = valid_edges[min_z <= min_z.min() + z_tolerance]
     
     # Among the lowest Z edges, pick the one closest to Y=0
-    best_edge = min(lowest_z_edges, key=lambda e: e['y_distance'])
-    
-    
-    bpy.ops.object.mode_set(mode='OBJECT')
-    
-
-    
-    return best_edge
+    avg_y = (starts[lowest_z_edges, 1] + ends[lowest_z_edges, 1]) / 2
+    best = int(np.abs(avg_y).argmin())
+    edge_index = int(lowest_z_edges[best])
+    vertex_indices = geometry.edges[edge_index]
+    
+    return {
+        'edge_index': edge_index,
+        'v1_world': world_verts[vertex_indices[0]],
+        'v2_world': world_verts[vertex_indices[1]],
+        'avg_y': float(avg_y[best]),
+        'min_z': float(min(starts[edge_index, 2], ends[edge_index, 2])),
+        'z_component': float(extents[edge_index, 2]),
+        'y_distance': float(abs(avg_y[best]))
+    }
 
 def collect_sleeve_side_edges(sleeve_obj, start_edge_data):
     """Collect connected edges moving UP on Z until diagonal change > 60° towards Y axis"""
@@ -3646,48 +3101,24 @@ def collect_sleeve_side_edges(sleeve_obj, start_edge_data):
         return None
     
     mesh = sleeve_obj.data
-    bpy.context.view_layer.objects.active = sleeve_obj
-    sleeve_obj.select_set(True)
-    
-    bpy.ops.object.mode_set(mode='EDIT')
-    bm = bmesh.from_edit_mesh(mesh)
-    bm.edges.ensure_lookup_table()
-    bm.verts.ensure_lookup_table()
-    
-    
-    # Find the start edge in the current bmesh context
-    start_edge = None
-    start_v1_world = start_edge_data['v1_world']
-    start_v2_world = start_edge_data['v2_world']
-    
-    # Find the corresponding edge in current bmesh
-    for edge in bm.edges:
-        v1 = sleeve_obj.matrix_world @ edge.verts[0].co
-        v2 = sleeve_obj.matrix_world @ edge.verts[1].co
-        
-        min_z = min(v1.z, v2.z)
-        
-        # Check if this matches our start edge (within tolerance)
-        if ((v1 - start_v1_world).length < 0.001 and (v2 - start_v2_world).length < 0.001) or \
-           ((v1 - start_v2_world).length < 0.001 and (v2 - start_v1_world).length < 0.001):
-            start_edge = edge
-            break
-    
-    if not start_edge:
-        bpy.ops.object.mode_set(mode='OBJECT')
+    world_verts = get_world_geometry(sleeve_obj).vectors
+    contour = get_contour_index(sleeve_obj)
+    if contour is None:
         return None
     
+    start_edge = start_edge_data['edge_index']
+    
     # Start from the found edge
     sleeve_edges = []
     current_edge = start_edge
     visited_edges = set()
     
     # Debug: show actual starting edge Z
-    start_v1 = sleeve_obj.matrix_world @ start_edge.verts[0].co
-    start_v2 = sleeve_obj.matrix_world @ start_edge.verts[1].co
+    start_v1 = world_verts[mesh.edges[start_edge].vertices[0]]
+    start_v2 = world_verts[mesh.edges[start_edge].vertices[1]]
     start_avg_z = (start_v1.z + start_v2.z) / 2
     
-    # Store debug stitch data for later creation (after we exit edit mode)
+    # Debug stitch data for the collection start point
     collection_start_data = {
         'v1_world': start_v1,
         'v2_world': start_v2,
@@ -3695,33 +3126,18 @@ def collect_sleeve_side_edges(sleeve_obj, start_edge_data):
         'name': f"COLLECT_{sleeve_obj.name}"
     }
     
-    def get_edge_vector(edge):
-        v1 = sleeve_obj.matrix_world @ edge.verts[0].co
-        v2 = sleeve_obj.matrix_world @ edge.verts[1].co
-        return v2 - v1
-    
-    def angle_between_vectors(v1, v2):
-        dot_product = v1.dot(v2)
-        mag1 = v1.length
-        mag2 = v2.length
-        if mag1 == 0 or mag2 == 0:
-            return 0
-        cos_angle = max(-1, min(1, dot_product / (mag1 * mag2)))
-        return math.degrees(math.acos(cos_angle))
-    
-    while current_edge and current_edge not in visited_edges:
+    while current_edge is not None and current_edge not in visited_edges:
         visited_edges.add(current_edge)
         
         # Add current edge to sleeve edges
-        v1 = sleeve_obj.matrix_world @ current_edge.verts[0].co
-        v2 = sleeve_obj.matrix_world @ current_edge.verts[1].co
-        current_vector = get_edge_vector(current_edge)
+        v1 = world_verts[mesh.edges[current_edge].vertices[0]]
+        v2 = world_verts[mesh.edges[current_edge].vertices[1]]
         edge_data = {
             'v1_world': v1,
             'v2_world': v2,
             'avg_z': (v1.z + v2.z) / 2,
             'avg_y': (v1.y + v2.y) / 2,
-            'length': current_vector.length
+            'length': (v2 - v1).length
         }
         sleeve_edges.append(edge_data)
         
@@ -3732,30 +3148,25 @@ def collect_sleeve_side_edges(sleeve_obj, start_edge_data):
         
         # Collect ALL connected edges that go UP on Z
         candidates = []
-        for vert in current_edge.verts:
-            for connected_edge in vert.link_edges:
-                if connected_edge == current_edge or connected_edge in visited_edges:
-                    continue
-                
-                # Get the Z position of this connected edge
-                connected_v1 = sleeve_obj.matrix_world @ connected_edge.verts[0].co
-                connected_v2 = sleeve_obj.matrix_world @ connected_edge.verts[1].co
-                connected_avg_z = (connected_v1.z + connected_v2.z) / 2
-                
-                # Only consider edges that move UP on Z gradually (not big jumps)
-                z_diff = connected_avg_z - current_avg_z
-                if z_diff > 0:
-                    if z_diff < 0.1:  # Gradual UP movement, not big jumps
-                        # Calculate angle between current and next edge
-                        next_vector = get_edge_vector(connected_edge)
-                        angle_change = angle_between_vectors(current_vector, next_vector)
-                        perpendicular_angle = min(angle_change, 180 - angle_change)
-                        
-                        candidates.append({
-                            'edge': connected_edge,
-                            'angle': perpendicular_angle,
-                            'z': connected_avg_z
-                        })
+        for connected_edge in contour.linked_edges(current_edge):
+            if connected_edge in visited_edges:
+                continue
+            
+            # Get the Z position of this connected edge
+            connected_v1 = world_verts[mesh.edges[connected_edge].vertices[0]]
+            connected_v2 = world_verts[mesh.edges[connected_edge].vertices[1]]
+            connected_avg_z = (connected_v1.z + connected_v2.z) / 2
+            
+            # Only consider edges that move UP on Z gradually (not big jumps)
+            z_diff = connected_avg_z - current_avg_z
+            if z_diff > 0:
+                if z_diff < 0.1:  # Gradual UP movement, not big jumps
+                    # The angle between current and next edge, either direction, where they meet
+                    candidates.append({
+                        'edge': connected_edge,
+                        'angle': contour.bend_at(contour.join_vertex(current_edge, connected_edge)),
+                        'z': connected_avg_z
+                    })
         
         # Pick the best candidate (smallest angle change)
         if candidates:
@@ -3772,8 +3183,6 @@ def collect_sleeve_side_edges(sleeve_obj, start_edge_data):
         # Move to next edge or stop
         current_edge = next_edge
     
-    bpy.ops.object.mode_set(mode='OBJECT')
-    
     # Create debug stitch for collection start point
     if 'collection_start_data' in locals():
         create_debug_stitch_at_edge(collection_start_data, collection_start_data['name'])
@@ -3803,6 +3212,19 @@ def split_sleeve_edge_by_z(sleeve_edges):
     
     return bottom_edges, top_edges
 
+def count_rising_edges(obj, edge_indices, vertex):
+    """How many leading edges of a chain walked from a vertex climb in world z, and the vertex they reach"""
+    
+    geometry = get_world_geometry(obj)
+    z = geometry.vertices[:, 2]
+    for count, edge_index in enumerate(edge_indices):
+        first, second = geometry.edges[edge_index].tolist()
+        far = second if first == vertex else first
+        if z[far] <= z[vertex]:
+            return count, vertex
+        vertex = far
+    return len(edge_indices), vertex
+
 def find_sleeve_hole_curve(panel_obj, sleeve_y_side):
     """
     Find the armhole curve on a panel using simple bottom-up edge following
@@ -3818,55 +3240,35 @@ def find_sleeve_hole_curve(panel_obj, sleeve_y_side):
     # STEP 1: Find the bottom horizontal running part of the panel
     
     # Find all horizontal edges with lowest Z values
-    all_world_verts = [panel_obj.matrix_world @ v.co for v in mesh.vertices]
-    min_z_global = min(v.z for v in all_world_verts)
-    max_z_global = max(v.z for v in all_world_verts)
+    geometry = get_world_geometry(panel_obj)
+    all_world_verts = geometry.vectors
+    contour = get_contour_index(panel_obj)
+    if contour is None:
+        return None
+    
+    min_z_global = geometry.vertices[:, 2].min()
+    max_z_global = geometry.vertices[:, 2].max()
     garment_height = max_z_global - min_z_global
     z_tolerance = garment_height * 0.02  # Within 2% of garment height from bottom
-    connection_tolerance = garment_height * 0.001  # Connection tolerance scales with garment size
     
-    horizontal_edges = []
-    for edge in mesh.edges:
-        v1 = panel_obj.matrix_world @ mesh.vertices[edge.vertices[0]].co
-        v2 = panel_obj.matrix_world @ mesh.vertices[edge.vertices[1]].co
-        
-        edge_vector = v2 - v1
-        edge_length = edge_vector.length
-        avg_z = (v1.z + v2.z) / 2
-        
-        if edge_length == 0:
-            continue
-            
-        # Check if edge runs horizontal on Y (not vertical on Z)
-        y_component = abs(edge_vector.y)
-        z_component = abs(edge_vector.z)
-        is_horizontal = y_component > z_component
-        
-        # Check if edge is near the bottom
-        is_at_bottom = abs(avg_z - min_z_global) < z_tolerance
-        
-        if is_horizontal and is_at_bottom:
-            horizontal_edges.append({
-                'edge': edge,
-                'v1': v1,
-                'v2': v2,
-                'avg_y': (v1.y + v2.y) / 2,
-                'avg_z': avg_z,
-                'length': edge_length
-            })
-    
-    if not horizontal_edges:
+    # Edges running horizontal on Y (not vertical on Z) near the bottom
+    starts, ends, vectors, lengths = geometry.edge_geometry
+    avg_z = (starts[:, 2] + ends[:, 2]) / 2
+    horizontal_edges = np.flatnonzero(
+        (lengths > 0)
+        & (np.abs(vectors[:, 1]) > np.abs(vectors[:, 2]))
+        & (np.abs(avg_z - min_z_global) < z_tolerance)
+    )
+    
+    if len(horizontal_edges) == 0:
         return None
     
     
     # STEP 2: Find the ENDS of the horizontal part (leftmost and rightmost VERTICES)
-    all_vertices = []
-    for edge_data in horizontal_edges:
-        all_vertices.extend([edge_data['v1'], edge_data['v2']])
-    
-    # Find the leftmost and rightmost vertices
-    left_end_vertex = min(all_vertices, key=lambda v: v.y)
-    right_end_vertex = max(all_vertices, key=lambda v: v.y)
+    all_vertices = geometry.edges[horizontal_edges].ravel()
+    vertex_y = geometry.vertices[all_vertices, 1]
+    left_end_vertex = int(all_vertices[vertex_y.argmin()])
+    right_end_vertex = int(all_vertices[vertex_y.argmax()])
     
     
     # STEP 3: Find the starting vertical edge on the specified side
@@ -3884,41 +3286,36 @@ def find_sleeve_hole_curve(panel_obj, sleeve_y_side):
     starting_vertical_edge = None
     best_z_component = 0
     
-    for edge in mesh.edges:
-        v1 = panel_obj.matrix_world @ mesh.vertices[edge.vertices[0]].co
-        v2 = panel_obj.matrix_world @ mesh.vertices[edge.vertices[1]].co
+    for edge_index in contour.edges_at(target_vertex):
+        edge = mesh.edges[edge_index]
+        v1 = all_world_verts[edge.vertices[0]]
+        v2 = all_world_verts[edge.vertices[1]]
         
-        # Check if this edge connects to the target vertex
-        connects_to_vertex = (
-            (v1 - target_vertex).length < connection_tolerance or (v2 - target_vertex).length < connection_tolerance
-        )
+        edge_vector = v2 - v1
+        edge_length = edge_vector.length
         
-        if connects_to_vertex:
-            edge_vector = v2 - v1
-            edge_length = edge_vector.length
-            
-            if edge_length == 0:
-                continue
-                
-            # Check if edge moves UP (positive Z direction) and is mostly vertical
-            z_component = abs(edge_vector.z)
-            y_component = abs(edge_vector.y)
-            
-            # Determine which vertex is the target and check if edge goes UP from it
-            if (v1 - target_vertex).length < 0.01:
-                # v1 is target, check if v2 is higher
-                moves_up = v2.z > v1.z
-            else:
-                # v2 is target, check if v1 is higher
-                moves_up = v1.z > v2.z
-                
-            is_mostly_vertical = z_component > y_component
+        if edge_length == 0:
+            continue
             
+        # Check if edge moves UP (positive Z direction) and is mostly vertical
+        z_component = abs(edge_vector.z)
+        y_component = abs(edge_vector.y)
+        
+        # Determine which vertex is the target and check if edge goes UP from it
+        if edge.vertices[0] == target_vertex:
+            # v1 is target, check if v2 is higher
+            moves_up = v2.z > v1.z
+        else:
+            # v2 is target, check if v1 is higher
+            moves_up = v1.z > v2.z
             
-            # Must move upward and be mostly vertical
-            if moves_up and is_mostly_vertical and z_component > best_z_component:
-                best_z_component = z_component
-                starting_vertical_edge = (edge, v1, v2)
+        is_mostly_vertical = z_component > y_component
+        
+        
+        # Must move upward and be mostly vertical
+        if moves_up and is_mostly_vertical and z_component > best_z_component:
+            best_z_component = z_component
+            starting_vertical_edge = (edge, v1, v2)
     
     if not starting_vertical_edge:
         return None
@@ -3939,133 +3336,29 @@ def find_sleeve_hole_curve(panel_obj, sleeve_y_side):
     debug_mesh.from_pydata(verts, [], [])
     debug_mesh.update()
     
-    bottom_edge = starting_vertical_edge
-    
-    # STEP 2: Follow edges upward until we hit a 35° curve (armhole start)
-    vertical_edges = [bottom_edge]
-    current_edge, current_v1, current_v2 = bottom_edge
-    processed_edges = {current_edge}
-    
-    # Start from the top vertex of the bottom edge
-    current_top = current_v1 if current_v1.z > current_v2.z else current_v2
-    previous_vector = current_v2 - current_v1
-    
-    
-    # Follow vertical edges upward
-    max_iterations = 50
-    iteration = 0
-    
-    while iteration < max_iterations:
-        iteration += 1
-        found_next = False
-        
-        for next_edge in mesh.edges:
-            if next_edge in processed_edges:
-                continue
-                
-            nv1 = panel_obj.matrix_world @ mesh.vertices[next_edge.vertices[0]].co
-            nv2 = panel_obj.matrix_world @ mesh.vertices[next_edge.vertices[1]].co
-            
-            # Check if this edge connects to our current top vertex
-            # Use same connection tolerance as before (scales with garment)
-            connects_to_top = (nv1 - current_top).length < connection_tolerance or (nv2 - current_top).length < connection_tolerance
-            
-            if connects_to_top:
-                edge_vector = nv2 - nv1
-                edge_length = edge_vector.length
-                
-                if edge_length == 0:
-                    continue
-                
-                # Calculate angle change between previous edge and this edge
-                if previous_vector.length > 0:
-                    prev_norm = previous_vector.normalized()
-                    curr_norm = edge_vector.normalized()
-                    dot_product = max(-1.0, min(1.0, prev_norm.dot(curr_norm)))
-                    angle_change = math.degrees(math.acos(abs(dot_product)))
-                    
-                    
-                    # If angle > 35°, this is the start of the armhole
-                    if angle_change > 35:
-                        avg_z = (nv1.z + nv2.z) / 2
-                        armhole_start_edge = (next_edge, nv1, nv2, edge_length, avg_z)
-                        break
-                
-                # Continue vertical trace
-                vertical_edges.append((next_edge, nv1, nv2))
-                processed_edges.add(next_edge)
-                current_edge = next_edge
-                current_v1, current_v2 = nv1, nv2
-                current_top = nv1 if nv1.z > nv2.z else nv2
-                previous_vector = edge_vector
-                found_next = True
-                break
-        
-        if not found_next:
-            break
+    # STEP 2: Follow the outline upward to the first corner turning more than 35° (armhole start)
+    up = get_local_up(panel_obj)
+    top_index = edge.vertices[0] if v1.z > v2.z else edge.vertices[1]
+    forward = contour.leads_to(edge.index, top_index)
+    vertical_edges, armhole_start_index = contour.walk_runs(edge.index, forward, up, CONTOUR_CORNER_TURN)
     
-    # Check if we found an armhole start
-    if 'armhole_start_edge' not in locals():
+    # Check if we found an armhole start, climbing all the way
+    rising, armhole_bottom = count_rising_edges(panel_obj, vertical_edges, target_vertex)
+    if armhole_start_index is None or rising < len(vertical_edges):
         return None
     
     
-    # STEP 3: Follow the armhole curve until we hit a 60° angle change (armhole end)
-    armhole_edges = [armhole_start_edge]
-    current_edge, current_v1, current_v2, _, _ = armhole_start_edge
-    processed_edges.add(current_edge)
+    # STEP 3: Follow the armhole curve on to a run boundary turning more than 60° (armhole end), or up
+    # to the first edge that stops climbing
+    armhole_run_edges, _ = contour.walk_runs(armhole_start_index, forward, up, 60)
+    rising, _ = count_rising_edges(panel_obj, armhole_run_edges, armhole_bottom)
     
-    # Start from the endpoint of the armhole start edge (highest Z)
-    current_endpoint = current_v1 if current_v1.z > current_v2.z else current_v2
-    previous_vector = current_v2 - current_v1
-    
-    
-    iteration = 0
-    while iteration < max_iterations:
-        iteration += 1
-        found_next = False
-        
-        for next_edge in mesh.edges:
-            if next_edge in processed_edges:
-                continue
-                
-            nv1 = panel_obj.matrix_world @ mesh.vertices[next_edge.vertices[0]].co
-            nv2 = panel_obj.matrix_world @ mesh.vertices[next_edge.vertices[1]].co
-            
-            # Check if this edge connects to our current endpoint
-            connects_to_current = (nv1 - current_endpoint).length < 0.01 or (nv2 - current_endpoint).length < 0.01
-            
-            if connects_to_current:
-                edge_vector = nv2 - nv1
-                edge_length = edge_vector.length
-                
-                if edge_length == 0:
-                    continue
-                
-                # Calculate angle change between current edge and next edge
-                if previous_vector.length > 0:
-                    prev_norm = previous_vector.normalized()
-                    curr_norm = edge_vector.normalized()
-                    dot_product = max(-1.0, min(1.0, prev_norm.dot(curr_norm)))
-                    angle_change = math.degrees(math.acos(abs(dot_product)))
-                    
-                    
-                    # If angle > 60°, we've reached the end of the armhole
-                    if angle_change > 60:
-                        break
-                
-                # Continue armhole trace
-                avg_z = (nv1.z + nv2.z) / 2
-                armhole_edges.append((next_edge, nv1, nv2, edge_length, avg_z))
-                processed_edges.add(next_edge)
-                current_edge = next_edge
-                current_v1, current_v2 = nv1, nv2
-                current_endpoint = nv1 if nv1.z > nv2.z else nv2
-                previous_vector = edge_vector
-                found_next = True
-                break
-        
-        if not found_next:
-            break
+    armhole_edges = []
+    for edge_index in armhole_run_edges[:rising + 1]:
+        next_edge = mesh.edges[edge_index]
+        nv1 = all_world_verts[next_edge.vertices[0]]
+        nv2 = all_world_verts[next_edge.vertices[1]]
+        armhole_edges.append((next_edge, nv1, nv2, float(lengths[edge_index]), float(avg_z[edge_index])))
     
     
     if len(armhole_edges) < 2:
@@ -4097,86 +3390,62 @@ def find_hood_bottom_edge(hood_obj):
         return None
     
     mesh = hood_obj.data
-    bpy.context.view_layer.objects.active = hood_obj
-    hood_obj.select_set(True)
-    
-    bpy.ops.object.mode_set(mode='EDIT')
-    bm = bmesh.from_edit_mesh(mesh)
-    bm.edges.ensure_lookup_table()
-    bm.verts.ensure_lookup_table()
+    geometry = get_world_geometry(hood_obj)
+    world_verts = geometry.vectors
+    contour = get_contour_index(hood_obj)
+    if contour is None:
+        return None
     
     
     # Step 1: Find the lowest Z level (bottom of hood)
-    all_z_coords = []
-    for edge in bm.edges:
-        v1 = hood_obj.matrix_world @ edge.verts[0].co
-        v2 = hood_obj.matrix_world @ edge.verts[1].co
-        all_z_coords.extend([v1.z, v2.z])
-    
-    min_z = min(all_z_coords)
-    max_z = max(all_z_coords)
+    all_z_coords = geometry.vertices[geometry.edges.ravel(), 2]
+    min_z = all_z_coords.min()
+    max_z = all_z_coords.max()
     hood_height = max_z - min_z
     bottom_z_threshold = min_z + (hood_height * 0.1)  # Look within 10% of hood height from bottom
     
     
     # Step 2: Find starting edge properly - longest vertical edge, then its lowest perpendicular Y edge
     
-    # First, find the longest vertical edge (runs in Z direction)
-    vertical_edges = []
-    for edge in bm.edges:
-        v1 = hood_obj.matrix_world @ edge.verts[0].co
-        v2 = hood_obj.matrix_world @ edge.verts[1].co
-        edge_vector = v2 - v1
-        
-        z_component = abs(edge_vector.z)
-        y_component = abs(edge_vector.y)
-        x_component = abs(edge_vector.x)
-        
-        # Check if edge is mostly vertical (Z dominant)
-        if z_component > 0.1 and z_component > y_component and z_component > x_component:
-            vertical_edges.append({
-                'edge': edge,
-                'length': edge_vector.length,
-                'v1_world': v1,
-                'v2_world': v2
-            })
-    
-    if not vertical_edges:
-        bpy.ops.object.mode_set(mode='OBJECT')
+    # First, find the longest vertical edge (runs in Z direction, mostly vertical - Z dominant)
+    _, _, vectors, lengths = geometry.edge_geometry
+    extents = np.abs(vectors)
+    vertical_edges = np.flatnonzero(
+        (extents[:, 2] > 0.1)
+        & (extents[:, 2] > extents[:, 1])
+        & (extents[:, 2] > extents[:, 0])
+    )
+    
+    if len(vertical_edges) == 0:
         return None
     
-    # Find the longest vertical edge
-    longest_vertical = max(vertical_edges, key=lambda e: e['length'])
+    longest_vertical = int(vertical_edges[lengths[vertical_edges].argmax()])
     
     # Step 3: Find perpendicular Y edges connected to this vertical edge that are at bottom level
     start_edge = None
     lowest_z = float('inf')
     
-    for vert in longest_vertical['edge'].verts:
-        for connected_edge in vert.link_edges:
-            if connected_edge == longest_vertical['edge']:
-                continue
-                
-            cv1 = hood_obj.matrix_world @ connected_edge.verts[0].co
-            cv2 = hood_obj.matrix_world @ connected_edge.verts[1].co
-            cavg_z = (cv1.z + cv2.z) / 2
+    for connected_index in contour.linked_edges(longest_vertical):
+        connected_edge = mesh.edges[connected_index]
+        cv1 = world_verts[connected_edge.vertices[0]]
+        cv2 = world_verts[connected_edge.vertices[1]]
+        cavg_z = (cv1.z + cv2.z) / 2
+        
+        # Check if this edge is at bottom level and runs in Y direction
+        if cavg_z <= bottom_z_threshold:
+            cedge_vector = cv2 - cv1
+            cy_component = abs(cedge_vector.y)
+            cz_component = abs(cedge_vector.z)
+            cx_component = abs(cedge_vector.x)
             
-            # Check if this edge is at bottom level and runs in Y direction
-            if cavg_z <= bottom_z_threshold:
-                cedge_vector = cv2 - cv1
-                cy_component = abs(cedge_vector.y)
-                cz_component = abs(cedge_vector.z)
-                cx_component = abs(cedge_vector.x)
-                
-                # Must be mostly horizontal in Y direction
-                if cy_component > 0.02 and cy_component > cz_component and cy_component > cx_component:
-                    # This is a horizontal bottom edge - use the one with lowest Z
-                    if cavg_z < lowest_z:
-                        lowest_z = cavg_z
-                        start_edge = connected_edge
-    
-    if not start_edge:
-        bpy.ops.object.mode_set(mode='OBJECT')
+            # Must be mostly horizontal in Y direction
+            if cy_component > 0.02 and cy_component > cz_component and cy_component > cx_component:
+                # This is a horizontal bottom edge - use the one with lowest Z
+                if cavg_z < lowest_z:
+                    lowest_z = cavg_z
+                    start_edge = connected_edge
+    
+    if start_edge is None:
         return None
     
     
@@ -4185,29 +3454,12 @@ def find_hood_bottom_edge(hood_obj):
     current_edge = start_edge
     visited_edges = set()
     
-    def get_edge_vector(edge):
-        v1 = hood_obj.matrix_world @ edge.verts[0].co
-        v2 = hood_obj.matrix_world @ edge.verts[1].co
-        return v2 - v1
-    
-    def angle_between_vectors(v1, v2):
-        # Calculate angle between two vectors in degrees
-        dot_product = v1.dot(v2)
-        mag1 = v1.length
-        mag2 = v2.length
-        if mag1 == 0 or mag2 == 0:
-            return 0
-        cos_angle = max(-1, min(1, dot_product / (mag1 * mag2)))
-        return math.degrees(math.acos(cos_angle))
-    
-    current_vector = get_edge_vector(current_edge)
-    
-    while current_edge and current_edge not in visited_edges:
-        visited_edges.add(current_edge)
+    while current_edge is not None and current_edge.index not in visited_edges:
+        visited_edges.add(current_edge.index)
         
         # Add current edge to bottom edges
-        v1 = hood_obj.matrix_world @ current_edge.verts[0].co
-        v2 = hood_obj.matrix_world @ current_edge.verts[1].co
+        v1 = world_verts[current_edge.vertices[0]]
+        v2 = world_verts[current_edge.vertices[1]]
         edge_data = {
             'edge': current_edge,
             'v1_world': v1,
@@ -4215,44 +3467,40 @@ def find_hood_bottom_edge(hood_obj):
             'avg_z': (v1.z + v2.z) / 2,
             'avg_x': (v1.x + v2.x) / 2,
             'avg_y': (v1.y + v2.y) / 2,
-            'length': current_vector.length
+            'length': float(lengths[current_edge.index])
         }
         bottom_edges.append(edge_data)
         
         
         # Find next connected edge at bottom level
         next_edge = None
-        next_vector = None
         candidates = []
         
-        for vert in current_edge.verts:
-            vert_world = hood_obj.matrix_world @ vert.co
+        for connected_index in contour.linked_edges(current_edge.index):
+            if connected_index in visited_edges:
+                continue
             
-            for connected_edge in vert.link_edges:
-                if connected_edge == current_edge or connected_edge in visited_edges:
-                    continue
-                
-                # Check if connected edge has horizontal movement
-                cv1 = hood_obj.matrix_world @ connected_edge.verts[0].co
-                cv2 = hood_obj.matrix_world @ connected_edge.verts[1].co
-                cavg_z = (cv1.z + cv2.z) / 2
-                
-                connected_vector = get_edge_vector(connected_edge)
-                cy_component = abs(connected_vector.y)
+            # Check if connected edge has horizontal movement
+            connected_edge = mesh.edges[connected_index]
+            cv1 = world_verts[connected_edge.vertices[0]]
+            cv2 = world_verts[connected_edge.vertices[1]]
+            cavg_z = (cv1.z + cv2.z) / 2
+            
+            cy_component = abs(cv2.y - cv1.y)
+            
+            
+            # Must have significant Y movement to be part of bottom edge
+            if cy_component > 0.01:
+                # How far the outline turns between the two edges
+                angle_change = contour.turn_at(contour.join_vertex(current_edge.index, connected_index))
                 
+                candidates.append({
+                    'edge': connected_edge,
+                    'angle_change': angle_change,
+                    'y_component': cy_component,
+                    'avg_z': cavg_z
+                })
                 
-                # Must have significant Y movement to be part of bottom edge
-                if cy_component > 0.01:
-                    angle_change = angle_between_vectors(current_vector, connected_vector)
-                    
-                    candidates.append({
-                        'edge': connected_edge,
-                        'vector': connected_vector,
-                        'angle_change': angle_change,
-                        'y_component': cy_component,
-                        'avg_z': cavg_z
-                    })
-                    
         
         if candidates:
             # Choose the candidate with smallest angle change
@@ -4265,15 +3513,10 @@ def find_hood_bottom_edge(hood_obj):
                 break
             else:
                 next_edge = best_candidate['edge']
-                next_vector = best_candidate['vector']
         else:
             break
         
         current_edge = next_edge
-        if next_vector:
-            current_vector = next_vector
-    
-    bpy.ops.object.mode_set(mode='OBJECT')
     
     
     return bottom_edges if bottom_edges else None
@@ -4335,69 +3578,11 @@ def create_hood_to_panel_springs(hood_obj, hood_edges, panel_obj, panel_neckline
     all_spring_edges = []
     vert_index = 0
     
-    # Convert panel neckline to same format as hood edges
-    panel_edges = []
-    for edge_data in panel_neckline:
-        # Panel neckline is a tuple: (edge, v1, v2, length, avg_z)
-        edge, v1, v2, length, avg_z = edge_data
-        panel_edges.append({
-            'v1_world': v1,
-            'v2_world': v2,
-            'avg_y': (v1.y + v2.y) / 2,
-            'length': length
-        })
-    
-    # Use same interpolation approach as sleeve connections
-    def create_interpolated_points(edges, num_points=8):
-        edges.sort(key=lambda e: min(e['v1_world'].y, e['v2_world'].y))
-        
-        all_y_coords = []
-        for edge in edges:
-            all_y_coords.extend([edge['v1_world'].y, edge['v2_world'].y])
-        
-        y_min = min(all_y_coords)
-        y_max = max(all_y_coords)
-        
-        interpolated_points = []
-        
-        for i in range(num_points):
-            if num_points == 1:
-                target_y = (y_min + y_max) / 2
-            else:
-                t = i / (num_points - 1)
-                target_y = y_min + t * (y_max - y_min)
-            
-            best_point = None
-            for edge in edges:
-                v1, v2 = edge['v1_world'], edge['v2_world']
-                edge_y_min = min(v1.y, v2.y)
-                edge_y_max = max(v1.y, v2.y)
-                
-                if edge_y_min <= target_y <= edge_y_max:
-                    if abs(v2.y - v1.y) > 0.001:
-                        t_edge = (target_y - v1.y) / (v2.y - v1.y)
-                        t_edge = max(0, min(1, t_edge))
-                        best_point = v1 + t_edge * (v2 - v1)
-                        break
-            
-            if best_point is None:
-                min_dist = float('inf')
-                for edge in edges:
-                    for vertex in [edge['v1_world'], edge['v2_world']]:
-                        dist = abs(vertex.y - target_y)
-                        if dist < min_dist:
-                            min_dist = dist
-                            best_point = vertex
-            
-            if best_point:
-                interpolated_points.append(best_point)
-        
-        return interpolated_points
-    
-    # Create interpolated points for hood and panel edges
-    num_stitches = 6
-    hood_points = create_interpolated_points(hood_edges, num_stitches)
-    panel_points = create_interpolated_points(panel_edges, num_stitches)
+    # Create evenly spaced points along the hood and panel edges, chained along Y
+    hood_pairs = [(e['v1_world'], e['v2_world']) for e in hood_edges]
+    num_stitches = seam_spring_count("hood_to_panel", edge_chain_length(hood_pairs))
+    hood_points = edge_chain_points(hood_pairs, num_stitches, axis=1)
+    panel_points = edge_chain_points([(v1, v2) for _, v1, v2, _, _ in panel_neckline], num_stitches, axis=1)
     
     
     # Create springs connecting hood to panel
@@ -4427,84 +3612,64 @@ def create_hood_to_panel_springs(hood_obj, hood_edges, panel_obj, panel_neckline
     spring_obj.show_wire = True
     
 
-def mirror_vertically(coordinates):
-    points = []
-    for i in range(0, len(coordinates)-1, 2):
-        if i+1 < len(coordinates):
-            points.append((coordinates[i], coordinates[i+1]))
-    
-    longest_straight_x = find_longest_straight_z_line(points)
-    fold_x = longest_straight_x
-    
-    mirrored_points = []
-    for x, y in points:
-        mirrored_x = 2 * fold_x - x
-        mirrored_points.append((mirrored_x, y))
-    
-    mirrored_points.reverse()
-    full_points = points + mirrored_points
-    
-    full_coordinates = []
-    for x, y in full_points:
-        full_coordinates.extend([x, y])
-    
-    return full_coordinates
+# Set while sync_seam_spring_settings fills in defaults, so that doesn't rebuild every seam
+_syncing_seam_springs = False
 
-def find_longest_straight_z_line(points):
-    straight_lines = []
-    tolerance = 5
-    
-    for i in range(len(points)):
-        for j in range(i + 2, len(points)):
-            p1 = points[i]
-            p2 = points[j]
-            
-            if abs(p1[0] - p2[0]) < tolerance:
-                length = abs(p2[1] - p1[1])
-                avg_x = (p1[0] + p2[0]) / 2
-                straight_lines.append((length, avg_x))
-    
-    if straight_lines:
-        longest = max(straight_lines, key=lambda x: x[0])
-        return longest[1]
-    else:
-        max_x = max(p[0] for p in points)
-        return max_x
+def update_seam_springs(self, context):
+    if _syncing_seam_springs or get_active_garment_load() is not None:
+        return
+    rebuild_seam_springs(self.name)
 
-def rotate_coordinates(coordinates, rotation_degrees):
-    if rotation_degrees == 0:
-        return coordinates
-    
-    points = []
-    for i in range(0, len(coordinates)-1, 2):
-        if i+1 < len(coordinates):
-            points.append((coordinates[i], coordinates[i+1]))
-    
-    center_x = sum(p[0] for p in points) / len(points)
-    center_y = sum(p[1] for p in points) / len(points)
+class FASHIONSYNTH_SeamSprings(PropertyGroup):
+    """Spring density of one seam, named by its SEAM_SETUP_STEPS key"""
     
-    angle = math.radians(rotation_degrees)
-    cos_angle = math.cos(angle)
-    sin_angle = math.sin(angle)
+    density_mode: EnumProperty(
+        name="Density",
+        description="How the number of sewing springs along the seam is chosen",
+        items=[
+            ('COUNT', "Count", "A fixed number of springs along the seam"),
+            ('PER_METRE', "Per Metre", "Springs in proportion to the seam's length")
+        ],
+        default='COUNT',
+        update=update_seam_springs
+    )
     
-    rotated_points = []
-    for x, y in points:
-        x_centered = x - center_x
-        y_centered = y - center_y
-        
-        x_rotated = x_centered * cos_angle - y_centered * sin_angle
-        y_rotated = x_centered * sin_angle + y_centered * cos_angle
-        
-        x_final = x_rotated + center_x
-        y_final = y_rotated + center_y
-        
-        rotated_points.append((x_final, y_final))
+    count: IntProperty(
+        name="Springs",
+        description="Sewing springs along the seam - each one adds a sewing constraint to the cloth solve",
+        min=1,
+        soft_max=100,
+        default=5,
+        update=update_seam_springs
+    )
     
-    rotated_coordinates = []
-    for x, y in rotated_points:
-        rotated_coordinates.extend([x, y])
+    per_metre: FloatProperty(
+        name="Springs per Metre",
+        description="Sewing springs per metre of seam - each one adds a sewing constraint to the cloth solve",
+        min=0.1,
+        soft_max=100.0,
+        default=20.0,
+        update=update_seam_springs
+    )
+
+def sync_seam_spring_settings(props):
+    """Add a density setting at its default for every seam that doesn't have one yet"""
+    global _syncing_seam_springs
     
-    return rotated_coordinates
+    _syncing_seam_springs = True
+    try:
+        for seam, _, _ in SEAM_SETUP_STEPS:
+            if props.seam_springs.get(seam) is not None:
+                continue
+            
+            mode, count, per_metre, _ = SEAM_SPRING_DEFAULTS[seam]
+            settings = props.seam_springs.add()
+            settings.name = seam
+            settings.density_mode = mode
+            settings.count = count
+            settings.per_metre = per_metre
+    finally:
+        _syncing_seam_springs = False
 
 class FASHIONSYNTH_Properties(PropertyGroup):
     garment_type: EnumProperty(
@@ -4580,136 +3745,556 @@ class FASHIONSYNTH_Properties(PropertyGroup):
         default="",
         subtype='FILE_PATH'
     )
+    
+    ipfs_gateways: StringProperty(
+        name="Gateways",
+        description="Comma separated IPFS gateway URLs - the fastest responders are preferred and slow ones are hedged",
+        default=", ".join(IPFS_GATEWAYS)
+    )
+    
+    http_connect_timeout: FloatProperty(
+        name="Connect Timeout",
+        description="Seconds to wait for a gateway to accept a connection",
+        min=0.5,
+        soft_max=60.0,
+        default=HTTP_CONNECT_TIMEOUT
+    )
+    
+    http_read_timeout: FloatProperty(
+        name="Read Timeout",
+        description="Seconds to wait for a gateway to send the next part of a pattern",
+        min=1.0,
+        soft_max=300.0,
+        default=HTTP_READ_TIMEOUT
+    )
+    
+    curve_quality: EnumProperty(
+        name="Curve Quality",
+        description="How closely pattern curves are followed when they are turned into mesh vertices",
+        items=[
+            ('PREVIEW', "Preview", "Coarse outlines - fewer vertices for fast seam setup and simulation"),
+            ('PRODUCTION', "Production", "Fine outlines that follow the pattern curves closely")
+        ],
+        default='PRODUCTION'
+    )
+    
+    curve_tolerance_preview: FloatProperty(
+        name="Preview Tolerance",
+        description="Max distance between a pattern curve and its mesh outline at preview quality",
+        subtype='DISTANCE',
+        min=0.0001,
+        soft_max=0.1,
+        precision=4,
+        default=CURVE_TOLERANCE_PREVIEW
+    )
+    
+    curve_tolerance_production: FloatProperty(
+        name="Production Tolerance",
+        description="Max distance between a pattern curve and its mesh outline at production quality",
+        subtype='DISTANCE',
+        min=0.0001,
+        soft_max=0.1,
+        precision=4,
+        default=CURVE_TOLERANCE_PRODUCTION
+    )
+    
+    load_progress: FloatProperty(
+        name="Progress",
+        description="Progress of the garment currently loading",
+        subtype='PERCENTAGE',
+        min=0.0,
+        max=100.0,
+        default=0.0
+    )
+    
+    load_status: StringProperty(
+        name="Status",
+        description="Step the garment load is currently on",
+        default=""
+    )
+    
+    seam_springs: CollectionProperty(
+        name="Seam Springs",
+        description="Sewing spring density of each seam, filled in when a garment's seams are first built",
+        type=FASHIONSYNTH_SeamSprings
+    )
 
-class FASHIONSYNTH_OT_load_defaults(Operator):
-    bl_idname = "fashionsynth.load_defaults"
-    bl_label = "Load Garment Defaults"
-    bl_description = "Load default garment pieces"
-    bl_options = {'REGISTER', 'UNDO'}
+def get_curve_tolerance(props):
+    """Flattening tolerance for the selected curve quality"""
+    
+    if props.curve_quality == 'PREVIEW':
+        return props.curve_tolerance_preview
+    return props.curve_tolerance_production
 
-    def execute(self, context):
-        props = context.scene.fashionsynth_props
+# Seam setup runs after all pieces are positioned, in this order - (key, label, setup)
+SEAM_SETUP_STEPS = [
+    ("hood_center", "Hood center seam", setup_hood_center_seam),
+    ("sleeve_cuff", "Sleeve cuff seams", setup_sleeve_cuff_seams),
+    ("panel_side", "Panel side seams", setup_front_back_panel_seams),
+    ("waist_band", "Waist band seam", setup_waist_band_seam),
+    ("pocket", "Pocket seam", setup_pocket_seam),
+    ("neck_binding", "Neck binding seam", setup_neck_binding_seam),
+    ("shoulder", "Shoulder seams", setup_shoulder_seams),
+    ("sleeve", "Sleeve seams", setup_sleeve_horizontal_seams),
+    ("sleeve_cuff_closing", "Sleeve cuff closing seams", setup_sleeve_cuff_horizontal_seams),
+    ("hood_to_panel", "Hood to panel seams", setup_hood_to_panel_connection),
+    ("sleeve_to_panel", "Sleeve to panel seams", setup_sleeve_to_panel_connection),
+]
+
+def run_seam_setup(seam, setup_seam):
+    """Run one seam's setup, tagging every object it adds with SEAM_PROPERTY so it can be rebuilt alone"""
+    
+    existing = {obj.name for obj in bpy.data.objects}
+    setup_seam()
+    
+    for obj in bpy.data.objects:
+        if obj.name not in existing:
+            obj[SEAM_PROPERTY] = seam
+
+def remove_seam_objects(seam):
+    """Delete the objects a seam's setup added, with their now unused meshes and materials"""
+    
+    for obj in [obj for obj in bpy.data.objects if obj.get(SEAM_PROPERTY) == seam]:
+        mesh = obj.data
+        materials = list(mesh.materials) if mesh is not None else []
+        bpy.data.objects.remove(obj)
+        
+        if mesh is not None and mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+        for material in materials:
+            if material is not None and material.users == 0:
+                bpy.data.materials.remove(material)
+
+def rebuild_seam_springs(seam):
+    """Replace one seam's springs with a fresh build at its current density - pieces are left as they are"""
+    
+    remove_seam_objects(seam)
+    for key, _, setup_seam in SEAM_SETUP_STEPS:
+        if key == seam:
+            run_seam_setup(seam, setup_seam)
+
+def count_garment_build_steps(defaults, coordinates_by_part, include_seams=True):
+    total = 0
+    for part_name, part_info in defaults.items():
+        if len(coordinates_by_part.get(part_name, ())):
+            total += part_info.get("quantity", 1)
+    
+    if include_seams:
+        total += 1 + len(SEAM_SETUP_STEPS)
+    
+    return total
+
+def iter_garment_build_steps(garment_type, defaults, coordinates_by_part, created_objects, include_seams=True):
+    """Build a garment's meshes (and seams), yielding a status label after each unit of scene work
+    
+    coordinates_by_part must already be oriented (see orient_coordinates_for_part). Must run on the
+    main thread - callers either exhaust it in one go or spread it over timer ticks."""
+    
+    # Reset sleeve counter to fix positioning on subsequent loads
+    if hasattr(create_mesh_from_coordinates, 'sleeve_counter'):
+        create_mesh_from_coordinates.sleeve_counter = 0
+    
+    # Entries of pieces deleted since the last load are never looked up again
+    clear_world_geometry_cache()
+    
+    # Create FashionSynth collection if it doesn't exist
+    if "FashionSynth" not in bpy.data.collections:
+        fashion_collection = bpy.data.collections.new("FashionSynth")
+        bpy.context.scene.collection.children.link(fashion_collection)
+    
+    for part_name, part_info in defaults.items():
+        quantity = part_info.get("quantity", 1)
+        coordinates = coordinates_by_part.get(part_name)
         
-        # Reset sleeve counter to fix positioning on subsequent loads
-        if hasattr(create_mesh_from_coordinates, 'sleeve_counter'):
-            create_mesh_from_coordinates.sleeve_counter = 0
+        if coordinates is None or len(coordinates) == 0:
+            continue
         
-        defaults = get_garment_defaults(props.garment_type)
-        if not defaults:
-            self.report({'ERROR'}, f"No defaults found for {props.garment_type}")
+        display_name = part_info.get("display_name", part_name)
+        
+        for i in range(quantity):
+            mesh_name = f"{garment_type}_{part_name}_{i+1}" if quantity > 1 else f"{garment_type}_{part_name}"
+            
+            mesh_obj = create_mesh_from_coordinates(
+                coordinates,
+                mesh_name,
+                "FashionSynth",
+                oriented=True
+            )
+            
+            if mesh_obj:
+                created_objects.append(mesh_obj)
+            
+            yield f"Building {display_name}"
+    
+    mark_seams(created_objects)
+    
+    if not include_seams:
+        return
+    
+    # Position sleeve cuffs next to their sleeves after all pieces are created
+    for obj in bpy.data.objects:
+        if "sleeve_cuff" in obj.name.lower():
+            position_sleeve_cuff_next_to_sleeve(obj)
+    
+    yield "Positioning sleeve cuffs"
+    
+    # Set up sewing connections after all pieces are positioned
+    sync_seam_spring_settings(bpy.context.scene.fashionsynth_props)
+    for seam, label, setup_seam in SEAM_SETUP_STEPS:
+        run_seam_setup(seam, setup_seam)
+        yield label
+
+def collect_custom_part_files(props, defaults, report):
+    """Validated {part_name: file_path} for the custom SVG fields that are filled in"""
+    
+    part_files = {}
+    for part_name, part_info in defaults.items():
+        file_attr = f"{part_name}_file"
+        file_path = getattr(props, file_attr, "")
+        
+        if not file_path:
+            continue
+            
+        if not file_path.lower().endswith('.svg'):
+            report({'ERROR'}, f"{part_name} file must be an SVG")
+            continue
+        
+        part_files[part_name] = bpy.path.abspath(file_path)
+    
+    return part_files
+
+# Modal loads do their scene work in slices of this many seconds per timer tick
+MODAL_LOAD_TIME_SLICE = 0.02
+MODAL_LOAD_TIMER_INTERVAL = 0.05
+_active_garment_load = None
+
+class GarmentLoadJob:
+    """State shared between a modal load operator and its fetch/parse worker thread"""
+    
+    def __init__(self, garment_type, defaults, include_seams):
+        self.garment_type = garment_type
+        self.defaults = defaults
+        self.include_seams = include_seams
+        self.cancel_event = threading.Event()
+        self.fetch_progress = [0, 1]
+        self.result = None
+        self.error = None
+        self.worker = None
+        self.steps = None
+        self.steps_done = 0
+        self.total_steps = 1
+        self.created_objects = []
+    
+    def start(self, fetch):
+        def run():
+            try:
+                self.result = fetch(self.fetch_progress, self.cancel_event)
+            except Exception as e:
+                traceback.print_exc()
+                self.error = e
+        
+        self.worker = threading.Thread(target=run, name="fashionsynth-load", daemon=True)
+        self.worker.start()
+
+def get_active_garment_load():
+    return _active_garment_load
+
+class FashionSynthModalLoad:
+    """Mixin running a garment load as a modal operator: I/O and parsing on a worker thread,
+    scene work in timed slices on the main thread, progress in the panel and Esc to cancel
+    
+    Operators define prepare_load(context), returning (defaults, fetch, include_seams) or None after
+    reporting why the load can't start. fetch(progress, cancel_event) runs on the worker thread and
+    returns {part_name: coordinates}. With builds_garment off the mixin skips the scene work and
+    hands whatever fetch returned to complete_modal_load as job.result."""
+    
+    builds_garment = True
+    fetch_label = "Loading patterns"
+    
+    def on_fetched(self, job):
+        pass
+    
+    def invoke(self, context, event):
+        global _active_garment_load
+        
+        if _active_garment_load is not None:
+            self.report({'WARNING'}, "A garment is already loading")
+            return {'CANCELLED'}
+        
+        props = context.scene.fashionsynth_props
+        prepared = self.prepare_load(context)
+        if prepared is None:
             return {'CANCELLED'}
         
-        # Create FashionSynth collection if it doesn't exist
-        if "FashionSynth" not in bpy.data.collections:
-            fashion_collection = bpy.data.collections.new("FashionSynth")
-            bpy.context.scene.collection.children.link(fashion_collection)
+        defaults, fetch, include_seams = prepared
+        job = GarmentLoadJob(props.garment_type, defaults, include_seams)
+        job.start(fetch)
+        _active_garment_load = job
+        
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(MODAL_LOAD_TIMER_INTERVAL, window=context.window)
+        wm.modal_handler_add(self)
+        wm.progress_begin(0, 100)
+        self.update_progress(context, 0, self.fetch_label)
         
-        created_count = 0
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        job = _active_garment_load
         
-        for part_name, part_info in defaults.items():
-            ipfs_hash = part_info.get("ipfs", "")
-            quantity = part_info.get("quantity", 1)
+        if event.type == 'ESC' and event.value == 'PRESS':
+            job.cancel_event.set()
+            self.finish_modal_load(context)
+            if not self.builds_garment:
+                self.report({'WARNING'}, f"{self.bl_label} cancelled")
+                return {'CANCELLED'}
             
-            if not ipfs_hash:
-                continue
+            # Pieces built before the cancel still get their seams
+            mark_seams(job.created_objects)
+            self.report({'WARNING'}, f"Garment load cancelled, {len(job.created_objects)} pieces were built")
+            return {'CANCELLED'}
+        
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        # Stage 1: wait for the worker thread to download and parse every part (0-50%, or all of it
+        # when nothing gets built)
+        if job.steps is None:
+            fetch_share = 50 if self.builds_garment else 100
+            if job.worker.is_alive():
+                done, total = job.fetch_progress
+                self.update_progress(context, fetch_share * done / max(1, total), self.fetch_label)
+                return {'PASS_THROUGH'}
             
-            gateway_url = ipfs_to_gateway_url(ipfs_hash)
-            coordinates = get_coordinates_from_ipfs(ipfs_hash, gateway_url)
+            if not self.builds_garment:
+                return self.complete_modal_load(context, job)
             
-            if not coordinates:
-                continue
+            if job.error is not None or not job.result:
+                self.finish_modal_load(context)
+                self.report({'ERROR'}, "Could not load any pattern pieces")
+                return {'CANCELLED'}
             
-            for i in range(quantity):
-                mesh_name = f"{props.garment_type}_{part_name}_{i+1}" if quantity > 1 else f"{props.garment_type}_{part_name}"
-                
-                mesh_obj = create_mesh_from_coordinates(
-                    coordinates,
-                    mesh_name,
-                    "FashionSynth"
-                )
-                
-                if mesh_obj:
-                    markSeam(mesh_obj)
-                    created_count += 1
-        
-        # Position sleeve cuffs next to their sleeves after all pieces are created
-        for obj in bpy.data.objects:
-            if "sleeve_cuff" in obj.name.lower():
-                position_sleeve_cuff_next_to_sleeve(obj)
-        
-        # Set up sewing connections after all pieces are positioned
-        setup_hood_center_seam()
-        setup_sleeve_cuff_seams()
-        setup_front_back_panel_seams()
-        setup_waist_band_seam()
-        setup_pocket_seam()
-        setup_neck_binding_seam()
-        setup_shoulder_seams()
-        setup_sleeve_horizontal_seams()
-        setup_sleeve_cuff_horizontal_seams()
-        setup_hood_to_panel_connection()
-        setup_sleeve_to_panel_connection()
+            self.on_fetched(job)
+            job.total_steps = max(1, count_garment_build_steps(job.defaults, job.result, job.include_seams))
+            job.steps = iter_garment_build_steps(
+                job.garment_type,
+                job.defaults,
+                job.result,
+                job.created_objects,
+                job.include_seams
+            )
+        
+        # Stage 2: build meshes and seams in small slices so the UI keeps redrawing (50-100%)
+        deadline = time.perf_counter() + MODAL_LOAD_TIME_SLICE
+        label = None
+        try:
+            while time.perf_counter() < deadline:
+                label = next(job.steps)
+                job.steps_done += 1
+        except StopIteration:
+            return self.complete_modal_load(context, job)
+        except Exception as e:
+            traceback.print_exc()
+            mark_seams(job.created_objects)
+            self.finish_modal_load(context)
+            self.report({'ERROR'}, f"Garment load failed: {e}")
+            return {'CANCELLED'}
         
+        self.update_progress(context, 50 + 50 * job.steps_done / job.total_steps, label)
+        return {'PASS_THROUGH'}
+    
+    def cancel(self, context):
+        job = _active_garment_load
+        if job is not None:
+            job.cancel_event.set()
+        self.finish_modal_load(context)
+    
+    def complete_modal_load(self, context, job):
+        self.finish_modal_load(context)
         return {'FINISHED'}
+    
+    def update_progress(self, context, percent, status):
+        props = context.scene.fashionsynth_props
+        props.load_progress = percent
+        if status:
+            props.load_status = status
+        
+        context.window_manager.progress_update(percent)
+        
+        if context.screen:
+            for area in context.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+    
+    def finish_modal_load(self, context):
+        global _active_garment_load
+        
+        _active_garment_load = None
+        
+        wm = context.window_manager
+        if getattr(self, "_timer", None) is not None:
+            wm.event_timer_remove(self._timer)
+            self._timer = None
+        wm.progress_end()
+        
+        self.update_progress(context, 0, "")
 
-class FASHIONSYNTH_OT_load_custom(Operator):
-    bl_idname = "fashionsynth.load_custom"
-    bl_label = "Load Custom Files"
-    bl_description = "Load custom SVG files"
+class FASHIONSYNTH_OT_load_defaults(FashionSynthModalLoad, Operator):
+    bl_idname = "fashionsynth.load_defaults"
+    bl_label = "Load Garment Defaults"
+    bl_description = "Load default garment pieces (Esc cancels while loading)"
     bl_options = {'REGISTER', 'UNDO'}
+    
+    def prepare_load(self, context):
+        props = context.scene.fashionsynth_props
+        
+        defaults = get_garment_defaults(props.garment_type)
+        if not defaults:
+            self.report({'ERROR'}, f"No defaults found for {props.garment_type}")
+            return None
+        
+        apply_network_settings(props)
+        get_svg_cache_dir()
+        garment_type = props.garment_type
+        tolerance = get_curve_tolerance(props)
+        
+        def fetch(progress, cancel_event):
+            return load_default_coordinates(garment_type, defaults, progress, cancel_event, tolerance)
+        
+        return defaults, fetch, True
 
     def execute(self, context):
+        # Synchronous path for scripts and background mode - the panel button goes through invoke()
         props = context.scene.fashionsynth_props
         
-        # Reset sleeve counter to fix positioning on subsequent loads
-        if hasattr(create_mesh_from_coordinates, 'sleeve_counter'):
-            create_mesh_from_coordinates.sleeve_counter = 0
+        prepared = self.prepare_load(context)
+        if prepared is None:
+            return {'CANCELLED'}
+        
+        defaults, fetch, include_seams = prepared
+        
+        # Read/fetch all parts at once, then build meshes on the main thread in dependency order
+        coordinates_by_part = fetch(None, None)
+        
+        created_objects = []
+        for _ in iter_garment_build_steps(props.garment_type, defaults, coordinates_by_part, created_objects, include_seams):
+            pass
+        
+        return {'FINISHED'}
+
+class FASHIONSYNTH_OT_load_custom(FashionSynthModalLoad, Operator):
+    bl_idname = "fashionsynth.load_custom"
+    bl_label = "Load Custom Files"
+    bl_description = "Load custom SVG files (Esc cancels while loading)"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def prepare_load(self, context):
+        props = context.scene.fashionsynth_props
         
         defaults = get_garment_defaults(props.garment_type)
         if not defaults:
             self.report({'ERROR'}, f"No part definitions found for {props.garment_type}")
+            return None
+        
+        part_files = collect_custom_part_files(props, defaults, self.report)
+        if not part_files:
+            self.report({'ERROR'}, "No valid SVG files loaded")
+            return None
+        
+        tolerance = get_curve_tolerance(props)
+        
+        def fetch(progress, cancel_event):
+            return load_custom_coordinates(part_files, progress, cancel_event, tolerance)
+        
+        return defaults, fetch, False
+    
+    def on_fetched(self, job):
+        for part_name, coordinates in job.result.items():
+            if len(coordinates) == 0:
+                self.report({'WARNING'}, f"Failed to load coordinates from {part_name}")
+    
+    def complete_modal_load(self, context, job):
+        self.finish_modal_load(context)
+        
+        if not job.created_objects:
+            self.report({'ERROR'}, "No valid SVG files loaded")
             return {'CANCELLED'}
         
-        created_count = 0
+        return {'FINISHED'}
+
+    def execute(self, context):
+        props = context.scene.fashionsynth_props
         
-        for part_name, part_info in defaults.items():
-            file_attr = f"{part_name}_file"
-            file_path = getattr(props, file_attr, "")
-            
-            if not file_path:
-                continue
-                
-            if not file_path.lower().endswith('.svg'):
-                self.report({'ERROR'}, f"{part_name} file must be an SVG")
-                continue
-            
-            coordinates = get_coordinates_from_file(file_path)
-            
-            if not coordinates:
+        prepared = self.prepare_load(context)
+        if prepared is None:
+            return {'CANCELLED'}
+        
+        defaults, fetch, include_seams = prepared
+        coordinates_by_part = fetch(None, None)
+        
+        for part_name, coordinates in coordinates_by_part.items():
+            if len(coordinates) == 0:
                 self.report({'WARNING'}, f"Failed to load coordinates from {part_name}")
-                continue
-            
-            quantity = part_info.get("quantity", 1)
-            
-            for i in range(quantity):
-                mesh_name = f"{props.garment_type}_{part_name}_{i+1}" if quantity > 1 else f"{props.garment_type}_{part_name}"
-                
-                mesh_obj = create_mesh_from_coordinates(
-                    coordinates,
-                    mesh_name,
-                    "FashionSynth"
-                )
-                
-                if mesh_obj:
-                    markSeam(mesh_obj)
-                    created_count += 1
         
-        if created_count == 0:
+        created_objects = []
+        for _ in iter_garment_build_steps(props.garment_type, defaults, coordinates_by_part, created_objects, include_seams):
+            pass
+        
+        if not created_objects:
             self.report({'ERROR'}, "No valid SVG files loaded")
             return {'CANCELLED'}
         
         return {'FINISHED'}
 
+class FASHIONSYNTH_OT_build_pattern_bundle(FashionSynthModalLoad, Operator):
+    bl_idname = "fashionsynth.build_pattern_bundle"
+    bl_label = "Rebuild Offline Bundle"
+    bl_description = "Download every default garment and store its SVGs and parsed coordinates for offline loading (Esc cancels)"
+    
+    builds_garment = False
+    fetch_label = "Building offline bundle"
+    
+    def prepare_load(self, context):
+        props = context.scene.fashionsynth_props
+        
+        apply_network_settings(props)
+        # bpy.utils paths are resolved here, the worker thread only does I/O and parsing
+        path = get_pattern_bundle_path()
+        get_svg_cache_dir()
+        tolerances = (props.curve_tolerance_preview, props.curve_tolerance_production)
+        
+        def fetch(progress, cancel_event):
+            return build_pattern_bundle(path, tolerances=tolerances, progress=progress, cancel_event=cancel_event)
+        
+        return {}, fetch, False
+    
+    def complete_modal_load(self, context, job):
+        self.finish_modal_load(context)
+        return self.report_bundle(job.error, job.result)
+    
+    def report_bundle(self, error, path):
+        if error is not None:
+            self.report({'ERROR'}, f"Could not build pattern bundle: {error}")
+            return {'CANCELLED'}
+        
+        self.report({'INFO'}, f"Pattern bundle written to {path}")
+        return {'FINISHED'}
+    
+    def execute(self, context):
+        # Synchronous path for scripts and background mode - the panel button goes through invoke()
+        if get_active_garment_load() is not None:
+            self.report({'WARNING'}, "Wait for the current garment load to finish")
+            return {'CANCELLED'}
+        
+        _, fetch, _ = self.prepare_load(context)
+        
+        try:
+            path = fetch(None, None)
+        except (OSError, RuntimeError) as e:
+            return self.report_bundle(e, None)
+        
+        return self.report_bundle(None, path)
+
 class FASHIONSYNTH_OT_clear_scene(Operator):
     bl_idname = "fashionsynth.clear_scene"
     bl_label = "Clear Scene"
@@ -4723,6 +4308,7 @@ class FASHIONSYNTH_OT_clear_scene(Operator):
         
         bpy.ops.object.select_all(action='SELECT')
         bpy.ops.object.delete(use_global=False, confirm=False)
+        clear_world_geometry_cache()
         
         return {'FINISHED'}
 
@@ -4748,10 +4334,30 @@ class FASHIONSYNTH_PT_main_panel(Panel):
         method_box = layout.box()
         method_box.prop(props, "loading_method", text="")
         
+        quality_row = method_box.row(align=True)
+        quality_row.prop(props, "curve_quality", expand=True)
+        if props.curve_quality == 'PREVIEW':
+            method_box.prop(props, "curve_tolerance_preview", text="Tolerance")
+        else:
+            method_box.prop(props, "curve_tolerance_production", text="Tolerance")
+        
+        is_loading = get_active_garment_load() is not None
+        
         if props.loading_method == 'coinop':
-            method_box.operator("fashionsynth.load_defaults", 
-                               text=f"Load {props.garment_type.title()} Defaults", 
-                               icon='IMPORT')
+            load_row = method_box.row()
+            load_row.enabled = not is_loading
+            load_row.operator("fashionsynth.load_defaults", 
+                              text=f"Load {props.garment_type.title()} Defaults", 
+                              icon='IMPORT')
+            method_box.prop(props, "ipfs_gateways")
+            timeout_row = method_box.row(align=True)
+            timeout_row.prop(props, "http_connect_timeout", text="Connect")
+            timeout_row.prop(props, "http_read_timeout", text="Read")
+            
+            bundle_row = method_box.row()
+            bundle_row.enabled = not is_loading
+            bundle_row.label(text="Offline bundle ready" if get_pattern_bundle() else "No offline bundle", icon='PACKAGE')
+            bundle_row.operator("fashionsynth.build_pattern_bundle", text="", icon='FILE_REFRESH')
         
         elif props.loading_method == 'custom':
             custom_box = layout.box()
@@ -4765,15 +4371,40 @@ class FASHIONSYNTH_PT_main_panel(Panel):
                     if hasattr(props, file_attr):
                         custom_box.prop(props, file_attr, text=display_name)
             
-            custom_box.operator("fashionsynth.load_custom", icon='IMPORT')
+            load_row = custom_box.row()
+            load_row.enabled = not is_loading
+            load_row.operator("fashionsynth.load_custom", icon='IMPORT')
+        
+        if is_loading:
+            progress_box = layout.box()
+            progress_box.label(text=props.load_status or "Loading...", icon='TIME')
+            progress_row = progress_box.row()
+            progress_row.enabled = False
+            progress_row.prop(props, "load_progress", text="", slider=True)
+            progress_box.label(text="Press Esc to cancel")
+        
+        if props.seam_springs:
+            layout.separator()
+            layout.label(text="Sewing Springs", icon='MOD_CLOTH')
+            
+            springs_box = layout.box()
+            springs_box.enabled = not is_loading
+            seam_labels = {seam: label for seam, label, _ in SEAM_SETUP_STEPS}
+            for settings in props.seam_springs:
+                row = springs_box.row(align=True)
+                row.label(text=seam_labels.get(settings.name, settings.name))
+                row.prop(settings, "density_mode", text="")
+                row.prop(settings, "count" if settings.density_mode == 'COUNT' else "per_metre", text="")
         
         layout.separator()
         layout.operator("fashionsynth.clear_scene", icon='TRASH')
 
 classes = [
+    FASHIONSYNTH_SeamSprings,
     FASHIONSYNTH_Properties,
     FASHIONSYNTH_OT_load_defaults,
     FASHIONSYNTH_OT_load_custom,
+    FASHIONSYNTH_OT_build_pattern_bundle,
     FASHIONSYNTH_OT_clear_scene,
     FASHIONSYNTH_PT_main_panel,
 ]
@@ -4782,11 +4413,31 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.fashionsynth_props = bpy.props.PointerProperty(type=FASHIONSYNTH_Properties)
+    bpy.app.handlers.depsgraph_update_post.append(invalidate_world_geometry)
+    bpy.app.handlers.load_post.append(clear_world_geometry_on_load)
+    load_pattern_bundle()
 
 def unregister():
     for cls in classes:
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.fashionsynth_props
+    bpy.app.handlers.depsgraph_update_post.remove(invalidate_world_geometry)
+    bpy.app.handlers.load_post.remove(clear_world_geometry_on_load)
+    clear_world_geometry_cache()
+    close_pattern_bundle()
 
 if __name__ == "__main__":
-    register()
\ No newline at end of file
+    # blender -b --python script_complete.py -- --build-pattern-bundle [path]
+    # blender -b --python script_complete.py -- --benchmark-mesh-build [size ...]
+    script_args = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    if "--build-pattern-bundle" in script_args:
+        bundle_args = script_args[script_args.index("--build-pattern-bundle") + 1:]
+        print(f"Pattern bundle written to {build_pattern_bundle(bundle_args[0] if bundle_args else None)}")
+    elif "--benchmark-mesh-build" in script_args:
+        size_args = script_args[script_args.index("--benchmark-mesh-build") + 1:]
+        if size_args:
+            benchmark_outline_mesh_build(tuple(int(size) for size in size_args))
+        else:
+            benchmark_outline_mesh_build()
+    else:
+        register()
\ No newline at end of file
@@ -0,0 +1,115 @@
+"""ContourIndex round trip through the piece's ID property, its runs and the outline of edited meshes"""
+
+import numpy as np
+
+from fashionsynth_geometry import ContourIndex, EdgeAdjacency
+
+def circle_points(count):
+    angles = np.linspace(0.0, 2 * np.pi, count, endpoint=False)
+    return np.column_stack((np.cos(angles), np.zeros(count), np.sin(angles)))
+
+def rectangle_points(width=2.0, height=3.0, per_side=4):
+    """An outline in the XZ plane, anticlockwise from the bottom left, per_side edges to a side"""
+    
+    steps = np.arange(per_side) / per_side
+    sides = [
+        np.column_stack((steps * width, np.zeros(per_side), np.zeros(per_side))),
+        np.column_stack((np.full(per_side, width), np.zeros(per_side), steps * height)),
+        np.column_stack((width - steps * width, np.zeros(per_side), np.full(per_side, height))),
+        np.column_stack((np.zeros(per_side), np.zeros(per_side), height - steps * height)),
+    ]
+    return np.concatenate(sides)
+
+def loop_edges(count):
+    indices = np.arange(count)
+    return np.column_stack((indices, np.roll(indices, -1)))
+
+def test_stored_index_rebuilds_only_for_matching_points():
+    points = circle_points(50)
+    contour = ContourIndex(points)
+    data = contour.to_property()
+    
+    restored = ContourIndex.from_property(points, loop_edges(50), data)
+    assert restored is not None
+    assert np.array_equal(restored.turning, contour.turning)
+    assert ContourIndex.from_property(points * 2, loop_edges(50), data) is None
+    # An edge added since
+    assert ContourIndex.from_property(points, np.vstack((loop_edges(50), [[0, 25]])), data) is None
+
+def test_runs_split_at_corners_and_carry_kind_and_orientation():
+    contour = ContourIndex(rectangle_points())
+    runs = contour.runs((0.0, 0.0, 1.0))
+    
+    assert [run['orientation'] for run in runs] == ["horizontal", "vertical", "horizontal", "vertical"]
+    assert all(run['kind'] == "straight" and run['count'] == 4 and run['turn'] == 90.0 for run in runs)
+    assert [run['length'] for run in runs] == [2.0, 3.0, 2.0, 3.0]
+    assert runs[1]['edges'] == [4, 5, 6, 7] and runs[1]['vertices'] == [4, 5, 6, 7, 8]
+    
+    # Lying on its side the same outline swaps orientations
+    assert [run['orientation'] for run in contour.runs((1.0, 0.0, 0.0))] == ["vertical", "horizontal", "vertical", "horizontal"]
+    
+    circle = ContourIndex(circle_points(60)).runs((0.0, 0.0, 1.0))
+    assert {run['kind'] for run in circle} == {"curved"}
+    assert sorted({run['orientation'] for run in circle}) == ["diagonal", "horizontal", "vertical"]
+
+def test_walk_runs_stops_at_the_first_sharp_enough_corner():
+    points = rectangle_points()
+    # Cut off the top right corner, two 45 degree turns
+    points[8] = (2.0, 0.0, 2.5)
+    contour = ContourIndex(points)
+    
+    edges, past = contour.walk_runs(5, forward=True, corner_turn=35)
+    assert edges == [5, 6, 7] and past == 8
+    edges, past = contour.walk_runs(5, forward=True, corner_turn=60)
+    assert edges == [5, 6, 7, 8, 9, 10, 11] and past == 12
+    edges, past = contour.walk_runs(5, forward=False, orientation="vertical")
+    assert edges == [5, 4] and past == 3
+    
+    edges, past = contour.walk_runs(0, corner_turn=180)
+    assert sorted(edges) == list(range(16)) and past is None
+
+def test_edge_adjacency_lists_each_vertex_edges_in_edge_order():
+    edges = np.array([[0, 1], [1, 2], [2, 0], [1, 3]])
+    adjacency = EdgeAdjacency(edges)
+    
+    assert adjacency.edges_at(1) == [0, 1, 3]
+    assert adjacency.edges_at(3) == [3]
+    assert adjacency.other_vertex(3, 1) == 3
+    assert adjacency.linked_edges(0) == [2, 1, 3]
+
+def test_reordered_loops_are_walked_through_the_adjacency():
+    points = circle_points(12)
+    # The same loop with its edges shuffled and some reversed
+    edges = loop_edges(12)[[5, 0, 9, 3, 11, 7, 1, 10, 2, 8, 4, 6]]
+    edges[::3] = edges[::3, ::-1]
+    
+    contour = ContourIndex.from_mesh_loop(points, edges)
+    assert contour is not None and contour.count == 12
+    assert np.allclose(contour.lengths, ContourIndex(points).lengths)
+    touching = np.flatnonzero(np.isin(edges, edges[0]).any(axis=1))
+    assert sorted(contour.linked_edges(0)) == [int(index) for index in touching if index != 0]
+
+def test_meshes_with_extra_edges_keep_their_outer_boundary():
+    points = rectangle_points()
+    # A loop cut across the middle, and a stray vertex inside joined to the left side
+    points = np.vstack((points, [(1.0, 0.0, 1.0)]))
+    edges = np.vstack((loop_edges(16), [[6, 14], [16, 13]]))
+    
+    assert ContourIndex.from_mesh_loop(points, edges) is None
+    contour = ContourIndex.from_edge_graph(points, edges)
+    assert contour is not None
+    assert sorted(contour.edge_order.tolist()) == list(range(16))
+    assert contour.linked_edges(16) == [] and contour.edges_at(16) == []
+    assert sorted(contour.linked_edges(5)) == [4, 6]
+    assert [run['orientation'] for run in contour.runs((0.0, 0.0, 1.0))].count("vertical") == 2
+    
+    # Round trip, checked against the edited edge count
+    assert ContourIndex.from_property(points, edges, contour.to_property()) is not None
+    assert ContourIndex.from_property(points, edges[:17], contour.to_property()) is None
+
+def test_outlines_that_cross_themselves_are_rejected():
+    # Two squares touching at one corner
+    points = np.array([(0, 0, 0), (1, 0, 0), (1, 0, 1), (0, 0, 1), (2, 0, 1), (2, 0, 2), (1, 0, 2)], dtype=np.float64)
+    edges = np.array([[0, 1], [1, 2], [2, 3], [3, 0], [2, 4], [4, 5], [5, 6], [6, 2]])
+    
+    assert ContourIndex.from_edge_graph(points, edges) is None
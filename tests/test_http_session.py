@@ -0,0 +1,120 @@
+"""Gateway downloads reuse pooled keep-alive connections - checked against a local server that counts them"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("bpy")
+import script_complete
+
+SVG = b'<svg xmlns="http://www.w3.org/2000/svg"><path d="M0 0 L10 0 L10 10 Z"/></svg>'
+
+class CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+    
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), SvgHandler)
+        self.connections = 0
+        self.requests = 0
+        self.in_flight = 0
+        self.most_in_flight = 0
+        self.lock = threading.Lock()
+    
+    def get_request(self):
+        request = super().get_request()
+        with self.lock:
+            self.connections += 1
+        return request
+
+class SvgHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps the connection open between requests
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.in_flight += 1
+            self.server.most_in_flight = max(self.server.most_in_flight, self.server.in_flight)
+        if "Slow" in self.path:
+            time.sleep(2)
+        with self.server.lock:
+            self.server.in_flight -= 1
+        self.send_response(200)
+        self.send_header("Content-Type", "image/svg+xml")
+        self.send_header("Content-Length", str(len(SVG)))
+        self.end_headers()
+        self.wfile.write(SVG)
+    
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def server():
+    server = CountingServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def gateway(server):
+    # A fresh pool, so connections left over from other tests don't count
+    with script_complete._http_session_lock:
+        if script_complete._http_session is not None:
+            script_complete._http_session.close()
+        script_complete._http_session = None
+    return f"http://127.0.0.1:{server.server_address[1]}/ipfs/"
+
+def test_sequential_downloads_share_one_connection(server, gateway):
+    session = script_complete.get_http_session()
+    
+    for part in range(5):
+        assert script_complete.download_svg_from_gateway(gateway, f"QmPart{part}") == SVG.decode()
+    
+    assert script_complete.get_http_session() is session
+    assert server.requests == 5
+    assert server.connections == 1
+
+def test_concurrent_downloads_stay_within_the_per_host_limit(server, gateway):
+    with ThreadPoolExecutor(max_workers=script_complete.HTTP_MAX_CONNECTIONS_PER_HOST * 2) as executor:
+        results = list(executor.map(lambda part: script_complete.download_svg_from_gateway(gateway, f"QmPart{part}"), range(40)))
+    
+    assert results == [SVG.decode()] * 40
+    assert server.requests == 40
+    assert 1 <= server.connections <= script_complete.HTTP_MAX_CONNECTIONS_PER_HOST
+
+def test_read_timeout_applies_to_later_requests(server, gateway):
+    connect_timeout, read_timeout = script_complete.HTTP_CONNECT_TIMEOUT, script_complete.HTTP_READ_TIMEOUT
+    try:
+        script_complete.configure_http_session(connect_timeout=1.0, read_timeout=0.5)
+        start = time.perf_counter()
+        assert script_complete.download_svg_from_gateway(gateway, "QmSlow") is None
+        assert time.perf_counter() - start < 1.5
+    finally:
+        script_complete.configure_http_session(connect_timeout, read_timeout)
+
+def test_hedge_executor_never_waits_for_a_pooled_connection(server, gateway):
+    executor = script_complete.get_gateway_executor()
+    futures = [
+        executor.submit(script_complete.download_svg_from_gateway, gateway, f"QmSlow{part}")
+        for part in range(script_complete.MAX_GATEWAY_REQUESTS)
+    ]
+    
+    assert [future.result() for future in futures] == [SVG.decode()] * script_complete.MAX_GATEWAY_REQUESTS
+    assert server.most_in_flight == script_complete.MAX_GATEWAY_REQUESTS
+
+def test_cancel_stops_waiting_on_a_hedged_download(server, gateway):
+    gateways = list(script_complete.IPFS_GATEWAYS)
+    script_complete.IPFS_GATEWAYS[:] = [gateway]
+    cancel_event = threading.Event()
+    try:
+        threading.Timer(0.2, cancel_event.set).start()
+        start = time.perf_counter()
+        assert script_complete.download_svg_hedged("QmSlow", cancel_event) is None
+        assert time.perf_counter() - start < 1.0
+    finally:
+        script_complete.IPFS_GATEWAYS[:] = gateways
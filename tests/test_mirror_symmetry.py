@@ -0,0 +1,31 @@
+"""MirrorSymmetryIndex scores every axis exactly as the brute-force scorer it replaced"""
+
+import numpy as np
+import pytest
+
+from fashionsynth_geometry import MirrorSymmetryIndex
+from fashionsynth_geometry.benchmark import benchmark_mirror_axes, benchmark_outline_points, calculate_mirror_symmetry_score_brute_force
+
+def lattice_points(spacing):
+    # Reflections land exactly one tolerance away from their neighbours
+    grid = np.arange(0, 20 * spacing, spacing, dtype=np.float64)
+    return np.array([(x, y) for x in grid for y in grid[:7]])
+
+@pytest.mark.parametrize("points", [
+    benchmark_outline_points(500),
+    benchmark_outline_points(3000, seed=1),
+    np.random.default_rng(2).uniform(-400, 400, (800, 2)),
+    np.random.default_rng(3).normal(0, 30, (400, 2)),
+    lattice_points(50.0),
+    lattice_points(25.0),
+])
+def test_index_scores_match_brute_force(points):
+    symmetry_index = MirrorSymmetryIndex(points)
+    lines = benchmark_mirror_axes(points, 18) + [((0.0, 0.0), (0.0, 1.0)), ((50.0, 0.0), (50.0, 100.0)), ((0.0, 25.0), (10.0, 25.0))]
+    
+    for line in lines:
+        assert symmetry_index.score(line) == calculate_mirror_symmetry_score_brute_force(points, line)
+
+def test_empty_piece_scores_zero():
+    points = np.empty((0, 2))
+    assert MirrorSymmetryIndex(points).score(((0.0, 0.0), (0.0, 1.0))) == calculate_mirror_symmetry_score_brute_force(points, ((0.0, 0.0), (0.0, 1.0))) == 0
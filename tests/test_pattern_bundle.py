@@ -0,0 +1,65 @@
+"""Addon scene state: offline bundle builds and per-seam sewing spring density"""
+
+import os
+import threading
+
+import pytest
+
+pytest.importorskip("bpy")
+import script_complete
+import bpy
+
+@pytest.fixture
+def addon():
+    script_complete.register()
+    yield bpy.context.scene.fashionsynth_props
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+    script_complete.unregister()
+
+def test_cancelled_bundle_build_writes_nothing(tmp_path):
+    path = str(tmp_path / "patterns.bundle")
+    cancel_event = threading.Event()
+    cancel_event.set()
+    progress = [0, 1]
+    
+    assert script_complete.build_pattern_bundle(path, progress=progress, cancel_event=cancel_event) is None
+    assert not os.path.exists(path)
+    assert progress[0] == 0
+    assert progress[1] == sum(len(script_complete.get_garment_defaults(garment_type)) for garment_type in script_complete.GARMENT_DEFAULTS)
+
+def test_seam_spring_count_follows_density_mode(addon):
+    script_complete.sync_seam_spring_settings(addon)
+    settings = addon.seam_springs["panel_side"]
+    
+    settings.density_mode = 'COUNT'
+    settings.count = 7
+    assert script_complete.seam_spring_count("panel_side", 2.0) == 7
+    
+    settings.density_mode = 'PER_METRE'
+    settings.per_metre = 10.0
+    assert script_complete.seam_spring_count("panel_side", 2.0) == 20
+    # Short seams still get the seam's minimum
+    assert script_complete.seam_spring_count("panel_side", 0.1) == script_complete.SEAM_SPRING_DEFAULTS["panel_side"][3]
+
+def test_rebuild_replaces_only_that_seams_objects(addon, monkeypatch):
+    def add_spring(name):
+        return lambda: bpy.context.collection.objects.link(bpy.data.objects.new(name, bpy.data.meshes.new(name)))
+    
+    monkeypatch.setattr(script_complete, "SEAM_SETUP_STEPS", [
+        ("pocket", "Pocket seams", add_spring("SewingSpring_pocket")),
+        ("shoulder", "Shoulder seams", add_spring("SewingSpring_shoulder")),
+    ])
+    for seam, _, setup_seam in script_complete.SEAM_SETUP_STEPS:
+        script_complete.run_seam_setup(seam, setup_seam)
+    piece = bpy.data.objects.new("front_panel", bpy.data.meshes.new("front_panel"))
+    bpy.context.collection.objects.link(piece)
+    bpy.data.objects["SewingSpring_pocket"]["stale"] = True
+    shoulder = bpy.data.objects["SewingSpring_shoulder"]
+    
+    script_complete.rebuild_seam_springs("pocket")
+    
+    pockets = [obj for obj in bpy.data.objects if obj.get(script_complete.SEAM_PROPERTY) == "pocket"]
+    assert len(pockets) == 1 and pockets[0].get("stale") is None
+    assert bpy.data.objects.get("SewingSpring_shoulder") == shoulder
+    assert script_complete.garment_pieces() == [piece]
@@ -0,0 +1,51 @@
+"""Stitch placement: chain ordering and equal arc-length resampling"""
+
+import numpy as np
+
+from fashionsynth_geometry import order_segments, resample_segments
+
+# An L-shaped chain along +X: a 1-unit segment then a 3-unit one, plus a rise of 2 along Z
+STARTS = np.array([(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (4.0, 0.0, 0.0)])
+ENDS = np.array([(1.0, 0.0, 0.0), (4.0, 0.0, 0.0), (4.0, 0.0, 2.0)])
+
+def arc_positions(points):
+    """Distance along the chain of points lying on it"""
+    return np.where(points[:, 2] > 0, 4.0 + points[:, 2], points[:, 0])
+
+def test_points_are_equally_spaced_over_unequal_segments():
+    points = resample_segments(STARTS, ENDS, 7)
+    
+    assert np.allclose(arc_positions(points), np.linspace(0.0, 6.0, 7))
+    assert np.allclose(points[[0, -1]], [STARTS[0], ENDS[-1]])
+
+def test_flipped_and_shuffled_segments_are_put_in_chain_order():
+    starts = np.array([(4.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 0.0, 0.0)])
+    ends = np.array([(1.0, 0.0, 0.0), (0.0, 0.0, 0.0), (2.0, 0.0, 1.0)])
+    
+    ordered_starts, ordered_ends = order_segments(starts, ends, 0)
+    
+    assert np.array_equal(ordered_starts, [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (1.0, 0.0, 0.0)])
+    assert np.array_equal(ordered_ends, [(1.0, 0.0, 0.0), (4.0, 0.0, 0.0), (2.0, 0.0, 1.0)])
+    assert np.all(ordered_ends[:, 0] >= ordered_starts[:, 0])
+
+def test_single_point_lands_midway():
+    assert np.allclose(arc_positions(resample_segments(STARTS, ENDS, 1)), [3.0])
+    assert np.allclose(arc_positions(resample_segments(STARTS, ENDS, 1, 0.5, 1.0)), [4.5])
+
+def test_zero_length_segments_add_nothing():
+    starts = np.insert(STARTS, 1, (1.0, 0.0, 0.0), axis=0)
+    ends = np.insert(ENDS, 1, (1.0, 0.0, 0.0), axis=0)
+    
+    assert np.allclose(resample_segments(starts, ends, 7), resample_segments(STARTS, ENDS, 7))
+    
+    collapsed = resample_segments([(2.0, 2.0, 2.0)] * 3, [(2.0, 2.0, 2.0)] * 3, 4)
+    assert np.allclose(collapsed, [(2.0, 2.0, 2.0)] * 4)
+
+def test_partial_fractions_cover_only_that_stretch():
+    points = resample_segments(STARTS, ENDS, 4, 0.25, 0.75)
+    
+    assert np.allclose(arc_positions(points), [1.5, 2.5, 3.5, 4.5])
+
+def test_no_points_for_an_empty_chain_or_count():
+    assert resample_segments(STARTS, ENDS, 0).shape == (0, 3)
+    assert resample_segments(np.empty((0, 3)), np.empty((0, 3)), 5).shape == (0, 3)
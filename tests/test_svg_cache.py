@@ -0,0 +1,54 @@
+"""On-disk SVG cache: checksums verified on read, hit/miss counters and LRU eviction under the size cap"""
+
+import os
+
+import pytest
+
+pytest.importorskip("bpy")
+import script_complete
+
+SVG = '<svg xmlns="http://www.w3.org/2000/svg"><path d="M0 0 L10 0 L10 10 Z"/></svg>'
+CIDS = ["QmCacheEntryA", "QmCacheEntryB", "QmCacheEntryC", "QmCacheEntryD"]
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("FASHIONSYNTH_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(script_complete, "_svg_cache_dir", None)
+    monkeypatch.setattr(script_complete, "SVG_CACHE_STATS", {"hits": 0, "misses": 0, "evictions": 0, "corrupt": 0})
+    return tmp_path
+
+def test_counters_count_hits_and_misses(cache):
+    assert script_complete.read_svg_cache(CIDS[0]) is None
+    script_complete.write_svg_cache(CIDS[0], SVG)
+    assert script_complete.read_svg_cache(CIDS[0]) == SVG
+    assert script_complete.read_svg_cache(CIDS[0]) == SVG
+    
+    stats = script_complete.get_svg_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["corrupt"]) == (2, 1, 0)
+
+def test_corrupt_entry_is_discarded_as_a_miss(cache):
+    script_complete.write_svg_cache(CIDS[0], SVG)
+    path = script_complete.get_svg_cache_path(CIDS[0])
+    with open(path, 'r+b') as f:
+        f.seek(-5, os.SEEK_END)
+        f.write(b"XXXXX")
+    
+    assert script_complete.read_svg_cache(CIDS[0]) is None
+    assert not os.path.exists(path)
+    stats = script_complete.get_svg_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["corrupt"]) == (0, 1, 1)
+
+def test_least_recently_used_entry_is_evicted_over_the_cap(cache, monkeypatch):
+    for age, cid in enumerate(CIDS[:3]):
+        script_complete.write_svg_cache(cid, SVG)
+        os.utime(script_complete.get_svg_cache_path(cid), (1000 + age, 1000 + age))
+    entry_size = os.path.getsize(script_complete.get_svg_cache_path(CIDS[0]))
+    
+    # Reading the oldest entry makes it the most recently used
+    assert script_complete.read_svg_cache(CIDS[0]) == SVG
+    monkeypatch.setattr(script_complete, "SVG_CACHE_MAX_BYTES", 3 * entry_size)
+    script_complete.write_svg_cache(CIDS[3], SVG)
+    
+    cached = sorted(name[:-4] for name in os.listdir(cache) if name.endswith(".svg"))
+    assert cached == [CIDS[0], CIDS[2], CIDS[3]]
+    assert script_complete.get_svg_cache_stats()["evictions"] == 1
@@ -0,0 +1,102 @@
+"""SVG path parsing edge cases and curve flattening accuracy"""
+
+import math
+
+import numpy as np
+import pytest
+
+from fashionsynth_geometry import extract_coordinates_from_svg_chunks, flatten_arc, flatten_cubic, flatten_quadratic, iter_path_segments
+
+TOLERANCES = (0.001, 0.01, 0.1, 1.0)
+
+def test_compact_arc_flags_split_into_flags_and_endpoint():
+    segments = list(iter_path_segments("M0 0 a1 1 0 0110 0a5 5 0 1050 50"))
+    
+    assert segments[1] == ('A', 1.0, 1.0, 0.0, False, True, (10.0, 0.0))
+    assert segments[2] == ('A', 5.0, 5.0, 0.0, True, False, (60.0, 50.0))
+
+def test_compact_arc_flags_split_on_implicit_repeats():
+    segments = list(iter_path_segments("M0 0 a1 1 0 0110 0 1 1 0 0110 0"))
+    
+    assert [segment[-1] for segment in segments] == [(0.0, 0.0), (10.0, 0.0), (20.0, 0.0)]
+
+def test_arc_missing_arguments_ends_the_path():
+    assert list(iter_path_segments("M0 0 L1 1 a1 1 0 01")) == [('M', (0.0, 0.0)), ('L', (1.0, 1.0))]
+
+def test_streamed_outline_drops_closed_elements_in_one_feed():
+    svg = ('<svg xmlns="http://www.w3.org/2000/svg"><g><title>front</title><defs><linearGradient id="a"/></defs>'
+           '<path d="M0 0 L40 0 L40 40 L0 40 Z"/></g></svg>')
+    
+    assert extract_coordinates_from_svg_chunks([svg]) == [0.0, 0.0, 40.0, 0.0, 40.0, 40.0, 0.0, 40.0]
+
+def cubic_point(p0, p1, p2, p3, t):
+    return tuple((1 - t) ** 3 * a + 3 * (1 - t) ** 2 * t * b + 3 * (1 - t) * t * t * c + t ** 3 * d for a, b, c, d in zip(p0, p1, p2, p3))
+
+def ellipse_point(cx, cy, rx, ry, phi, theta):
+    ex, ey = rx * math.cos(theta), ry * math.sin(theta)
+    return (cx + ex * math.cos(phi) - ey * math.sin(phi), cy + ex * math.sin(phi) + ey * math.cos(phi))
+
+def polyline_deviation(samples, polyline):
+    """Largest distance from any sample point to the nearest segment of the polyline"""
+    
+    samples = np.asarray(samples)
+    starts = np.asarray(polyline[:-1])
+    vectors = np.asarray(polyline[1:]) - starts
+    offsets = samples[:, None, :] - starts[None, :, :]
+    t = np.clip((offsets * vectors).sum(axis=2) / np.maximum((vectors * vectors).sum(axis=1), 1e-300), 0.0, 1.0)
+    gaps = offsets - t[:, :, None] * vectors[None, :, :]
+    return float(np.sqrt((gaps * gaps).sum(axis=2)).min(axis=1).max())
+
+CUBICS = [
+    ((0.0, 0.0), (0.0, 10.0), (10.0, 10.0), (10.0, 0.0)),
+    ((0.0, 0.0), (30.0, 5.0), (-20.0, 5.0), (10.0, 0.0)),
+    ((0.0, 0.0), (1.0, 0.0), (2.0, 0.0), (3.0, 0.0)),
+]
+
+@pytest.mark.parametrize("curve", CUBICS)
+@pytest.mark.parametrize("tolerance", TOLERANCES)
+def test_cubic_stays_within_tolerance(curve, tolerance):
+    points = [curve[0]]
+    flatten_cubic(*curve, tolerance, points)
+    samples = [cubic_point(*curve, t) for t in np.linspace(0.0, 1.0, 2001)]
+    
+    assert points[-1] == curve[3]
+    assert polyline_deviation(samples, points) <= tolerance * (1 + 1e-9)
+
+@pytest.mark.parametrize("tolerance", TOLERANCES)
+def test_quadratic_stays_within_tolerance(tolerance):
+    p0, c, p1 = (0.0, 0.0), (5.0, 12.0), (10.0, 0.0)
+    points = [p0]
+    flatten_quadratic(p0, c, p1, tolerance, points)
+    samples = [tuple((1 - t) ** 2 * a + 2 * (1 - t) * t * b + t * t * d for a, b, d in zip(p0, c, p1)) for t in np.linspace(0.0, 1.0, 2001)]
+    
+    assert polyline_deviation(samples, points) <= tolerance * (1 + 1e-9)
+
+@pytest.mark.parametrize("rx, ry, angle", [(5.0, 5.0, 0.0), (8.0, 3.0, 30.0)])
+@pytest.mark.parametrize("tolerance", TOLERANCES)
+def test_arc_stays_within_tolerance(rx, ry, angle, tolerance):
+    # Half of an ellipse centred on the origin, from theta 0 to pi
+    phi = math.radians(angle)
+    p0, p1 = ellipse_point(0.0, 0.0, rx, ry, phi, 0.0), ellipse_point(0.0, 0.0, rx, ry, phi, math.pi)
+    points = [p0]
+    flatten_arc(p0, rx, ry, angle, False, True, p1, tolerance, points)
+    samples = [ellipse_point(0.0, 0.0, rx, ry, phi, theta) for theta in np.linspace(0.0, math.pi, 2001)]
+    
+    assert points[-1] == p1
+    assert polyline_deviation(samples, points) <= tolerance * (1 + 1e-9)
+
+def test_point_count_shrinks_as_tolerance_grows():
+    counts = {"cubic": [], "quadratic": [], "arc": []}
+    for tolerance in TOLERANCES:
+        for kind, flatten in (
+            ("cubic", lambda points: flatten_cubic((0.0, 0.0), (0.0, 10.0), (10.0, 10.0), (10.0, 0.0), tolerance, points)),
+            ("quadratic", lambda points: flatten_quadratic((0.0, 0.0), (5.0, 12.0), (10.0, 0.0), tolerance, points)),
+            ("arc", lambda points: flatten_arc((0.0, 0.0), 5.0, 5.0, 0.0, False, True, (10.0, 0.0), tolerance, points)),
+        ):
+            points = []
+            flatten(points)
+            counts[kind].append(len(points))
+    
+    for kind, kind_counts in counts.items():
+        assert kind_counts == sorted(kind_counts, reverse=True), kind
+        assert kind_counts[0] > 4 * kind_counts[-1], kind